@@ -0,0 +1,259 @@
+"""
+Load-test harness for the FastAPI service.
+
+Drives /analyze, /recommend and /benchmark with a closed-loop workload read
+from a scenario file (see benchmarks/scenarios/). Each scenario steps through
+concurrency stages so the point where latency collapses is visible. For every
+stage and endpoint it reports p50/p95/p99 latency, throughput and error rate,
+and it samples the server's RSS over time.
+
+Targets:
+    (default)          the app in-process through an ASGI transport (single event loop, like one uvicorn worker)
+    --spawn            a uvicorn subprocess on a free localhost port
+    --url URL [--pid]  an already running server (RSS sampled only if --pid is given)
+
+    python benchmarks/load_test.py benchmarks/scenarios/smoke.json
+    python benchmarks/load_test.py benchmarks/scenarios/mixed_medium.json --spawn
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Dict, Any, Optional
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import httpx
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+ENDPOINTS = ("analyze", "recommend", "benchmark")
+
+
+def read_rss_mb(pid: int) -> Optional[float]:
+    """Resident set size of a process from /proc (Linux)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+def summarize(latencies: List[float], errors: int, duration: float) -> Dict[str, Any]:
+    """Latency percentiles (ms), throughput and error rate for one endpoint in one stage."""
+    total = len(latencies) + errors
+    summary = {
+        "requests": total,
+        "errors": errors,
+        "error_rate": errors / total if total else 0.0,
+        "throughput_rps": len(latencies) / duration if duration > 0 else 0.0,
+    }
+    if latencies:
+        p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99])
+        summary.update({"p50_ms": float(p50), "p95_ms": float(p95), "p99_ms": float(p99),
+                        "max_ms": float(max(latencies) * 1000)})
+    return summary
+
+
+class LoadTest:
+    """Runs one scenario against an httpx.AsyncClient."""
+
+    def __init__(self, scenario: Dict[str, Any], client: httpx.AsyncClient, server_pid: Optional[int] = None,
+                 seed: int = 0, rss_interval: float = 0.5):
+        self.scenario = scenario
+        self.client = client
+        self.server_pid = server_pid
+        self.rng = random.Random(seed)
+        self.rss_interval = rss_interval
+        self.rss_samples: List[Dict[str, float]] = []
+        self._t0 = time.perf_counter()
+
+        mix = scenario.get("mix") or {"recommend": 1}
+        unknown = set(mix) - set(ENDPOINTS)
+        if unknown:
+            raise ValueError(f"Unknown endpoints in mix: {sorted(unknown)}")
+        self.endpoints = list(mix.keys())
+        self.weights = [mix[e] for e in self.endpoints]
+
+    def build_csv(self) -> bytes:
+        from src.automl.calibration import make_synthetic_frame
+        spec = self.scenario.get("dataset") or {}
+        df = make_synthetic_frame(spec.get("rows", 1000), spec.get("cols", 10),
+                                  categorical_share=spec.get("categorical_share", 0.0),
+                                  missing_rate=spec.get("missing_rate", 0.0),
+                                  problem_type=spec.get("problem_type", "classification"))
+        return df.to_csv(index=False).encode("utf-8")
+
+    async def setup(self):
+        """Uploads the dataset once so /recommend and /benchmark have something to work on."""
+        self.payload = self.build_csv()
+        self.filename = f"loadtest_{self.scenario.get('name', 'scenario')}.csv"
+        resp = await self.client.post("/analyze", files={"file": (self.filename, self.payload, "text/csv")}, timeout=None)
+        resp.raise_for_status()
+        self.dataset_id = resp.json()["dataset_id"]
+        algorithms = self.scenario.get("benchmark_algorithms") or ["Logistic Regression"]
+        self.benchmark_body = {"dataset_id": self.dataset_id, "target_col": "target",
+                               "recommmendations": [{"algorithm": a} for a in algorithms]}
+
+    async def call(self, endpoint: str) -> httpx.Response:
+        if endpoint == "analyze":
+            return await self.client.post("/analyze", files={"file": (self.filename, self.payload, "text/csv")}, timeout=None)
+        if endpoint == "recommend":
+            # Analysis comes from the server-side session; only the id goes over the wire
+            return await self.client.post("/recommend", json={"dataset_id": self.dataset_id}, timeout=None)
+        return await self.client.post("/benchmark", json=self.benchmark_body, timeout=None)
+
+    async def worker(self, deadline: float, stats: Dict[str, Dict[str, Any]]):
+        while time.perf_counter() < deadline:
+            endpoint = self.rng.choices(self.endpoints, weights=self.weights)[0]
+            start = time.perf_counter()
+            try:
+                resp = await self.call(endpoint)
+                ok = resp.status_code < 400
+            except Exception:
+                ok = False
+            elapsed = time.perf_counter() - start
+            if ok:
+                stats[endpoint]["latencies"].append(elapsed)
+            else:
+                stats[endpoint]["errors"] += 1
+
+    async def sample_rss(self, stop: asyncio.Event, stage_index: int):
+        pid = self.server_pid
+        while not stop.is_set():
+            rss = read_rss_mb(pid) if pid else None
+            if rss is not None:
+                self.rss_samples.append({"t": time.perf_counter() - self._t0, "stage": stage_index, "rss_mb": rss})
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.rss_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self) -> Dict[str, Any]:
+        await self.setup()
+        stages_out = []
+        for i, stage in enumerate(self.scenario["stages"]):
+            concurrency, duration = stage["concurrency"], stage["duration_seconds"]
+            stats = {e: {"latencies": [], "errors": 0} for e in self.endpoints}
+            stop = asyncio.Event()
+            sampler = asyncio.create_task(self.sample_rss(stop, i))
+
+            start = time.perf_counter()
+            deadline = start + duration
+            await asyncio.gather(*(self.worker(deadline, stats) for _ in range(concurrency)))
+            elapsed = time.perf_counter() - start  # Includes requests still in flight at the deadline
+            stop.set()
+            await sampler
+
+            stage_rss = [s["rss_mb"] for s in self.rss_samples if s["stage"] == i]
+            stages_out.append({
+                "concurrency": concurrency,
+                "duration_seconds": elapsed,
+                "endpoints": {e: summarize(s["latencies"], s["errors"], elapsed) for e, s in stats.items()},
+                "rss_mb_max": max(stage_rss) if stage_rss else None,
+            })
+            print_stage(stages_out[-1])
+        return {"scenario": self.scenario, "stages": stages_out, "rss_samples": self.rss_samples}
+
+
+def print_stage(stage: Dict[str, Any]):
+    rss = f"  rss max {stage['rss_mb_max']:.0f}MB" if stage["rss_mb_max"] else ""
+    print(f"concurrency {stage['concurrency']:>3} ({stage['duration_seconds']:.1f}s){rss}")
+    for endpoint, s in stage["endpoints"].items():
+        if s["requests"] == 0:
+            continue
+        lat = (f"p50 {s['p50_ms']:8.1f}ms  p95 {s['p95_ms']:8.1f}ms  p99 {s['p99_ms']:8.1f}ms"
+               if "p50_ms" in s else "no successful requests")
+        print(f"  {endpoint:<10} {s['requests']:>6} req  {s['throughput_rps']:8.2f} rps  "
+              f"err {s['error_rate']:6.1%}  {lat}")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def run_in_process(scenario: Dict[str, Any], seed: int) -> Dict[str, Any]:
+    from src.api.main import app
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+        return await LoadTest(scenario, client, server_pid=os.getpid(), seed=seed).run()
+
+
+async def run_remote(scenario: Dict[str, Any], url: str, pid: Optional[int], seed: int) -> Dict[str, Any]:
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=url, limits=limits) as client:
+        return await LoadTest(scenario, client, server_pid=pid, seed=seed).run()
+
+
+def wait_for_port(port: int, timeout: float = 60.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server did not start listening on port {port} within {timeout}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenario", help="Scenario JSON file")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="Base URL of a running server")
+    target.add_argument("--spawn", action="store_true", help="Start uvicorn on a free localhost port")
+    parser.add_argument("--pid", type=int, help="Server PID for RSS sampling with --url")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/load_<scenario>_<timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    with open(args.scenario) as f:
+        scenario = json.load(f)
+
+    # Uploads, plots and stores are written relative to the server's working directory
+    workdir = tempfile.mkdtemp(prefix="malgocat_load_")
+    cwd = os.getcwd()
+    server = None
+    try:
+        if args.url:
+            result = asyncio.run(run_remote(scenario, args.url, args.pid, args.seed))
+        elif args.spawn:
+            port = free_port()
+            env = dict(os.environ, PYTHONPATH=REPO_ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+            server = subprocess.Popen([sys.executable, "-m", "uvicorn", "src.api.main:app", "--host", "127.0.0.1",
+                                       "--port", str(port), "--log-level", "warning"], cwd=workdir, env=env)
+            wait_for_port(port)
+            result = asyncio.run(run_remote(scenario, f"http://127.0.0.1:{port}", server.pid, args.seed))
+        else:
+            os.chdir(workdir)
+            result = asyncio.run(run_in_process(scenario, args.seed))
+    finally:
+        os.chdir(cwd)
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"load_{scenario.get('name', 'scenario')}_{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(result, f, indent=2)
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
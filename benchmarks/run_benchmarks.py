@@ -0,0 +1,351 @@
+"""
+Throughput / memory benchmark harness.
+
+Measures, on synthetic data of varying shape:
+  - fit and predict throughput (rows/sec) and peak traced memory of every SKLEARN_MAPPING entry
+  - DatasetAnalyzer.analyze() and DatasetVisualizer.generate_all_plots() wall time
+  - /analyze, /recommend and /benchmark end to end through the FastAPI app (in-process)
+  - cold import time and RSS of src.api.main (fresh interpreter per sample); the run exits
+    non-zero if the import exceeds STARTUP_BUDGET_SECONDS or loads a deferred ML/plotting stack
+
+Results are written to JSON together with machine info so runs from different
+commits can be compared:
+
+    python benchmarks/run_benchmarks.py --quick
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/old.json benchmarks/results/new.json
+
+Everything runs offline on CPU.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from typing import List, Dict, Any, Optional
+
+os.environ.setdefault("MPLBACKEND", "Agg")  # Headless plotting
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+
+# (rows, cols, categorical_share, missing_rate)
+FULL_GRID = [
+    (1_000, 10, 0.0, 0.0),
+    (10_000, 10, 0.0, 0.0),
+    (10_000, 50, 0.0, 0.0),
+    (10_000, 20, 0.3, 0.0),
+    (10_000, 20, 0.0, 0.1),
+    (50_000, 20, 0.2, 0.05),
+]
+QUICK_GRID = [
+    (500, 8, 0.0, 0.0),
+    (2_000, 16, 0.25, 0.05),
+]
+
+
+def machine_info() -> Dict[str, Any]:
+    """Hardware/software context stored with every result file."""
+    import sklearn
+    info = {
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+        "commit": None,
+    }
+    try:
+        info["commit"] = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT,
+                                                 stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        pass
+    try:
+        with open("/proc/meminfo") as f:
+            info["mem_total_kb"] = int(f.readline().split()[1])
+    except Exception:
+        pass
+    return info
+
+
+def shape_key(rows: int, cols: int, cat: float, missing: float) -> str:
+    return f"{rows}x{cols}_cat{cat:g}_miss{missing:g}"
+
+
+def prepare_matrix(df: pd.DataFrame) -> (np.ndarray, np.ndarray):
+    """Minimal numeric encoding (mean impute + category codes), close to what AutoMLRunner does."""
+    X = df.drop(columns=["target"])
+    for col in X.columns:
+        if pd.api.types.is_numeric_dtype(X[col]):
+            X[col] = X[col].fillna(X[col].mean())
+        else:
+            X[col] = X[col].astype("category").cat.codes
+    return X.to_numpy(dtype=np.float64), df["target"].to_numpy()
+
+
+def bench_algorithms(grid, algorithms: Optional[List[str]] = None, max_seconds: float = 30.0) -> List[Dict[str, Any]]:
+    """Fit/predict throughput and peak memory per algorithm and shape."""
+    from src.algorithms.registry import AlgorithmRegistry
+    from src.automl.calibration import make_synthetic_frame
+    from src.automl.mappings import SKLEARN_MAPPING
+    import src.algorithms.definitions # Register algorithms
+
+    rows_out = []
+    slow = set()
+    for rows, cols, cat, missing in grid:
+        frames = {}
+        for name in algorithms or list(SKLEARN_MAPPING.keys()):
+            key = shape_key(rows, cols, cat, missing)
+            if name in slow:
+                # Already over the time cap on a smaller shape; bigger ones would only be slower
+                rows_out.append({"algorithm": name, "shape": key, "status": "skipped"})
+                continue
+            algo = AlgorithmRegistry.get_by_name(name)
+            problem_type = algo.type if algo is not None else "classification"
+            if problem_type not in frames:
+                df = make_synthetic_frame(rows, cols, categorical_share=cat, missing_rate=missing, problem_type=problem_type)
+                frames[problem_type] = prepare_matrix(df)
+            X, y = frames[problem_type]
+
+            model = SKLEARN_MAPPING[name]()
+            tracemalloc.start()
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    start = time.perf_counter()
+                    model.fit(X, y)
+                    fit_time = time.perf_counter() - start
+                    peak_mb = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+                    tracemalloc.stop()
+                    start = time.perf_counter()
+                    model.predict(X)
+                    predict_time = time.perf_counter() - start
+            except Exception as e:
+                if tracemalloc.is_tracing():
+                    tracemalloc.stop()
+                rows_out.append({"algorithm": name, "shape": key, "status": f"failed: {e}"})
+                continue
+
+            if fit_time > max_seconds:
+                slow.add(name)
+            rows_out.append({
+                "algorithm": name,
+                "shape": key,
+                "status": "ok",
+                "fit_seconds": fit_time,
+                "predict_seconds": predict_time,
+                "fit_rows_per_sec": rows / max(fit_time, 1e-9),
+                "predict_rows_per_sec": rows / max(predict_time, 1e-9),
+                "peak_memory_mb": peak_mb,
+            })
+            print(f"  {name:<35} {key:<28} fit {fit_time:8.3f}s  predict {predict_time:8.3f}s  peak {peak_mb:8.1f}MB")
+    return rows_out
+
+
+# Stacks the API must not import at startup (they are deferred to first use / background pre-warm)
+DEFERRED_MODULES = ("sklearn", "scipy", "matplotlib", "seaborn", "xgboost", "lightgbm", "catboost")
+# Generous ceiling for the cold import; typical is well under a second
+STARTUP_BUDGET_SECONDS = 1.5
+
+_IMPORT_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import src.api.main
+elapsed = time.perf_counter() - start
+print(json.dumps({"import_seconds": elapsed,
+                  "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+                  "deferred_loaded": sorted(m for m in %r if m in sys.modules)}))
+"""
+
+
+def bench_startup(repeats: int = 5) -> List[Dict[str, Any]]:
+    """Cold import of the API module in fresh interpreters; median time and RSS over repeats."""
+    samples = []
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT, MALGOCAT_PREWARM="0")
+    with tempfile.TemporaryDirectory() as workdir: # Import creates upload/plot/store directories in the cwd
+        for _ in range(repeats):
+            out = subprocess.run([sys.executable, "-c", _IMPORT_PROBE % (DEFERRED_MODULES,)], cwd=workdir, env=env,
+                                 capture_output=True, text=True, check=True)
+            samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    row = {"shape": "src.api.main",
+           "import_seconds": float(np.median([s["import_seconds"] for s in samples])),
+           "rss_mb": float(np.median([s["rss_mb"] for s in samples])),
+           "deferred_loaded": sorted({m for s in samples for m in s["deferred_loaded"]})}
+    row["over_budget"] = row["import_seconds"] > STARTUP_BUDGET_SECONDS
+    print(f"  {row['shape']:<28} import {row['import_seconds']:7.3f}s  rss {row['rss_mb']:7.1f}MB"
+          + (f"  OVER BUDGET ({STARTUP_BUDGET_SECONDS}s)" if row["over_budget"] else "")
+          + (f"  eagerly loaded: {', '.join(row['deferred_loaded'])}" if row["deferred_loaded"] else ""))
+    return [row]
+
+
+def bench_analysis(grid) -> List[Dict[str, Any]]:
+    """Wall time of the analyzer and the visualizer per shape."""
+    from src.analyzer import DatasetAnalyzer
+    from src.automl.calibration import make_synthetic_frame
+    from src.visualizer import DatasetVisualizer
+
+    rows_out = []
+    for rows, cols, cat, missing in grid:
+        df = make_synthetic_frame(rows, cols, categorical_share=cat, missing_rate=missing)
+        key = shape_key(rows, cols, cat, missing)
+
+        start = time.perf_counter()
+        DatasetAnalyzer(df, target_column="target").analyze()
+        analyze_time = time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory() as plots_dir:
+            start = time.perf_counter()
+            DatasetVisualizer(df, target_column="target").generate_all_plots(plots_dir)
+            plot_time = time.perf_counter() - start
+
+        rows_out.append({"shape": key, "analyze_seconds": analyze_time, "visualize_seconds": plot_time})
+        print(f"  {key:<28} analyze {analyze_time:8.3f}s  visualize {plot_time:8.3f}s")
+    return rows_out
+
+
+def bench_api(grid) -> List[Dict[str, Any]]:
+    """End-to-end latency of the main endpoints through the in-process ASGI app."""
+    try:
+        from fastapi.testclient import TestClient
+    except Exception as e: # TestClient needs httpx
+        print(f"  Skipping API benchmarks: {e}")
+        return []
+    from src.automl.calibration import make_synthetic_frame
+
+    rows_out = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir) # The app writes uploads/plots/stores relative to the working directory
+        try:
+            from src.api.main import app
+            client = TestClient(app)
+            for rows, cols, cat, missing in grid:
+                key = shape_key(rows, cols, cat, missing)
+                df = make_synthetic_frame(rows, cols, categorical_share=cat, missing_rate=missing)
+                filename = f"bench_{key}.csv"
+                payload = df.to_csv(index=False).encode("utf-8")
+                timings = {}
+
+                start = time.perf_counter()
+                resp = client.post("/analyze", files={"file": (filename, payload, "text/csv")})
+                timings["analyze_seconds"] = time.perf_counter() - start
+                resp.raise_for_status()
+                analysis = resp.json()["analysis"]
+
+                start = time.perf_counter()
+                resp = client.post("/recommend", json={"analysis": analysis, "filename": filename})
+                timings["recommend_seconds"] = time.perf_counter() - start
+                resp.raise_for_status()
+                recs = [{"algorithm": r["algorithm"]} for r in resp.json()["recommendations"]]
+
+                start = time.perf_counter()
+                resp = client.post("/benchmark", json={"filename": filename, "target_col": "target", "recommmendations": recs})
+                timings["benchmark_seconds"] = time.perf_counter() - start
+                resp.raise_for_status()
+
+                rows_out.append({"shape": key, "payload_bytes": len(payload), **timings})
+                print(f"  {key:<28} " + "  ".join(f"{k.replace('_seconds', '')} {v:7.3f}s" for k, v in timings.items()))
+        finally:
+            os.chdir(cwd)
+    return rows_out
+
+
+def flatten(results: Dict[str, Any]) -> Dict[str, float]:
+    """Maps every timing in a result file to a stable key, for comparison."""
+    flat = {}
+    for row in results.get("algorithms", []):
+        if row.get("status") == "ok":
+            flat[f"algorithms/{row['algorithm']}/{row['shape']}/fit_seconds"] = row["fit_seconds"]
+            flat[f"algorithms/{row['algorithm']}/{row['shape']}/predict_seconds"] = row["predict_seconds"]
+            flat[f"algorithms/{row['algorithm']}/{row['shape']}/peak_memory_mb"] = row["peak_memory_mb"]
+    for section in ("analysis", "api", "startup"):
+        for row in results.get(section, []):
+            for k, v in row.items():
+                if k.endswith("_seconds"):
+                    flat[f"{section}/{row['shape']}/{k}"] = v
+    return flat
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float = 0.2) -> List[Dict[str, Any]]:
+    """
+    Lists metrics present in both runs with their ratio new/base.
+
+    Args:
+        threshold: Relative slowdown (0.2 = 20%) above which an entry is flagged as a regression.
+    """
+    base_flat, new_flat = flatten(base), flatten(new)
+    rows = []
+    for key in sorted(base_flat.keys() & new_flat.keys()):
+        b, n = base_flat[key], new_flat[key]
+        ratio = n / b if b > 0 else float("inf")
+        rows.append({"metric": key, "base": b, "new": n, "ratio": ratio, "regression": ratio > 1 + threshold})
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="Small grid for a fast smoke run")
+    parser.add_argument("--algorithms", nargs="*", help="Restrict to these SKLEARN_MAPPING names")
+    parser.add_argument("--sections", nargs="*", default=["algorithms", "analysis", "api", "startup"],
+                        choices=["algorithms", "analysis", "api", "startup"])
+    parser.add_argument("--max-fit-seconds", type=float, default=30.0,
+                        help="Skip larger shapes for an algorithm once one fit exceeds this")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/<timestamp>_<commit>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="Compare two result files and exit")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Regression threshold for --compare")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            base = json.load(f)
+        with open(args.compare[1]) as f:
+            new = json.load(f)
+        rows = compare(base, new, threshold=args.threshold)
+        for row in rows:
+            flag = "  REGRESSION" if row["regression"] else ""
+            print(f"{row['metric']:<90} {row['base']:10.4f} -> {row['new']:10.4f}  x{row['ratio']:.2f}{flag}")
+        n_regressions = sum(r["regression"] for r in rows)
+        print(f"{len(rows)} metrics compared, {n_regressions} regressions")
+        return 1 if n_regressions else 0
+
+    grid = QUICK_GRID if args.quick else FULL_GRID
+    results = {"machine": machine_info(), "grid": [list(g) for g in grid], "started_at": time.time()}
+
+    if "algorithms" in args.sections:
+        print("Algorithms:")
+        results["algorithms"] = bench_algorithms(grid, args.algorithms, args.max_fit_seconds)
+    if "analysis" in args.sections:
+        print("Analyzer / visualizer:")
+        results["analysis"] = bench_analysis(grid)
+    if "api" in args.sections:
+        print("API:")
+        results["api"] = bench_api(grid)
+    if "startup" in args.sections:
+        print("Startup:")
+        results["startup"] = bench_startup()
+
+    output = args.output
+    if output is None:
+        commit = (results["machine"].get("commit") or "nocommit")[:8]
+        output = os.path.join(RESULTS_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}_{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {output}")
+    # Wall-clock gate lives here rather than in the unit suite, where loaded CI machines would trip it
+    startup_failed = any(r["over_budget"] or r["deferred_loaded"] for r in results.get("startup", []))
+    return 1 if startup_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
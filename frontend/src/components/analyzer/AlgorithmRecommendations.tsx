@@ -278,6 +278,15 @@ function AlgorithmCard({ recommendation, index }: { recommendation: AlgorithmRec
   );
 }
 
+// Backend returns predicted training time in seconds
+function formatSeconds(seconds?: number): string {
+  if (seconds === undefined || seconds === null) return "Unknown";
+  if (seconds < 1) return "< 1s";
+  if (seconds < 60) return `~${Math.round(seconds)}s`;
+  if (seconds < 3600) return `~${Math.round(seconds / 60)} min`;
+  return `~${(seconds / 3600).toFixed(1)} h`;
+}
+
 export function AlgorithmRecommendations() {
   const {
     recommendations, setRecommendations, setCurrentStep, isAnalyzing, setIsAnalyzing,
@@ -293,10 +302,10 @@ export function AlgorithmRecommendations() {
           const response = await fetch("http://localhost:8000/recommend", {
             method: "POST",
             headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
-              analysis: analysisResults,
-              filename: dataset?.filename || "unknown.csv"
-            }),
+            // The server keeps the analysis with the dataset session; only send it without one
+            body: JSON.stringify(dataset?.datasetId
+              ? { dataset_id: dataset.datasetId }
+              : { analysis: analysisResults, filename: dataset?.filename || "unknown.csv" }),
           });
 
           if (!response.ok) throw new Error("Failed to get recommendations");
@@ -314,7 +323,7 @@ export function AlgorithmRecommendations() {
             whenItFails: "Consult documentation for specific edge cases.",
             pythonCode: `# Implementation for ${rec.algorithm}\nfrom sklearn import ...\n# Todo: Generate specific code`,
             isBestFit: index === 0,
-            timeEstimate: (data.time_estimates && data.time_estimates[rec.algorithm]) || "Unknown"
+            timeEstimate: formatSeconds(data.time_estimates?.[rec.algorithm])
           }));
 
           setRecommendations(mappedRecs);
@@ -399,6 +408,7 @@ export function AlgorithmRecommendations() {
                 method: "POST",
                 headers: { "Content-Type": "application/json" },
                 body: JSON.stringify({
+                  dataset_id: dataset?.datasetId,
                   filename: dataset?.filename || "unknown.csv",
                   target_col: "target", // TODO: user should select this in Context step. For now hardcode or guess.
                   recommmendations: recommendations.map(r => ({ algorithm: r.name }))
@@ -54,6 +54,7 @@ export function DatasetUpload() {
       // Update Store with Dataset Info
       setDataset({
         filename: data.filename,
+        datasetId: data.dataset_id,
         size: file.size,
         rows: analysis.basic_stats.n_rows,
         columns: analysis.basic_stats.n_columns,
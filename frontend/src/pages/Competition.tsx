@@ -83,10 +83,9 @@ const Competition = () => {
       const response = await fetch("http://localhost:8000/competition/plan", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({
-          analysis: analysisResults,
-          filename: dataset?.filename || "unknown.csv"
-        })
+        body: JSON.stringify(dataset?.datasetId
+          ? { dataset_id: dataset.datasetId }
+          : { analysis: analysisResults, filename: dataset?.filename || "unknown.csv" })
       });
       if (!response.ok) throw new Error("Failed");
       const data = await response.json();
@@ -115,6 +114,7 @@ const Competition = () => {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({
+          dataset_id: dataset.datasetId,
           filename: dataset.filename,
           target_col: analysisResults.target_analysis?.name || analysisResults.columns[analysisResults.columns.length - 1], // fallback to checking analysis or last col
           recommmendations: recs
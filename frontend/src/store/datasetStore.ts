@@ -2,6 +2,7 @@ import { create } from "zustand";
 
 export interface DatasetInfo {
   filename: string;
+  datasetId?: string; // Server-side session id returned by /analyze
   size: number;
   rows: number;
   columns: number;
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 @dataclass
 class Algorithm:
@@ -16,6 +16,12 @@ class Algorithm:
     handle_missing: bool = False
     handle_sparse: bool = False
     handle_categorical: bool = False # Native support
+    # Lazy "module:attribute" path to the estimator class/factory; imported on first instantiation
+    estimator: Optional[Any] = None
+    estimator_fallback: Optional[str] = None # Used when the estimator's library isn't installed
+    # Hyperparameter search space: lists are categorical choices,
+    # ("int" | "float" | "log", low, high) tuples are ranges. See src/automl/tuning.py
+    search_space: Optional[Dict[str, Any]] = None
     
     def to_dict(self):
         return {
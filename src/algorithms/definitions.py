@@ -1,5 +1,6 @@
 from src.algorithms.base import Algorithm
 from src.algorithms.registry import AlgorithmRegistry
+from src.algorithms.plugins import load_entry_point_plugins
 
 def register_all_algorithms():
     """ Registers all standard algorithms into the registry. """
@@ -12,7 +13,9 @@ def register_all_algorithms():
         pros=["Simple and Interpretable", "Fast Training", "Good baseline"],
         cons=["Assumes linear boundary", "Sensitive to outliers", "Cannot handle complex relationships"],
         complexity_score=2,
-        handle_sparse=True
+        handle_sparse=True,
+        estimator="sklearn.linear_model:LogisticRegression",
+        search_space={"C": ("log", 1e-3, 100.0), "max_iter": [500]}
     ))
 
     AlgorithmRegistry.register(Algorithm(
@@ -22,7 +25,8 @@ def register_all_algorithms():
         pros=["Simple and Interpretable", "Fast", "No hyperparameter tuning needed (usually)"],
         cons=["Assumes linear relationship", "Sensitive to outliers"],
         complexity_score=1,
-        handle_sparse=True
+        handle_sparse=True,
+        estimator="sklearn.linear_model:LinearRegression"
     ))
 
     # --- Tree-based Models ---
@@ -34,7 +38,9 @@ def register_all_algorithms():
         cons=["Slow prediction", "Hard to interpret", "Large model size"],
         complexity_score=5,
         handle_missing=True, # Often implementations like sklearn require imputation, but conceptually yes
-        handle_categorical=False # sklearn implementation requires encoding
+        handle_categorical=False, # sklearn implementation requires encoding
+        estimator="sklearn.ensemble:RandomForestClassifier",
+        search_space={"n_estimators": ("int", 50, 400), "max_depth": [None, 4, 8, 16], "min_samples_leaf": ("int", 1, 10), "max_features": ["sqrt", "log2", None]}
     ))
     
     AlgorithmRegistry.register(Algorithm(
@@ -45,7 +51,10 @@ def register_all_algorithms():
         cons=["Many hyperparameters", "Can overfit if not tuned"],
         complexity_score=7,
         handle_missing=True,
-        handle_sparse=True
+        handle_sparse=True,
+        estimator="xgboost:XGBClassifier",
+        estimator_fallback="sklearn.ensemble:GradientBoostingClassifier",
+        search_space={"n_estimators": ("int", 100, 1000), "learning_rate": ("log", 0.01, 0.3), "max_depth": ("int", 3, 10), "subsample": ("float", 0.5, 1.0), "colsample_bytree": ("float", 0.5, 1.0), "min_child_weight": ("int", 1, 10)}
     ))
 
     # --- Neural Networks & Deep Learning ---
@@ -56,7 +65,9 @@ def register_all_algorithms():
         pros=["Can learn complex non-linear relationships", "Flexible architecture"],
         cons=["Requires large data", "Hard to interpret", "Computationally expensive", "Sensitive to scaling"],
         complexity_score=8,
-        min_samples=1000
+        min_samples=1000,
+        estimator="sklearn.neural_network:MLPClassifier",
+        search_space={"hidden_layer_sizes": [(50,), (100,), (100, 50)], "alpha": ("log", 1e-5, 1e-2), "learning_rate_init": ("log", 1e-4, 1e-2), "max_iter": [300]}
     ))
     
     AlgorithmRegistry.register(Algorithm(
@@ -77,7 +88,9 @@ def register_all_algorithms():
         pros=["Effective in high dimensional spaces", "Versatile kernels"],
         cons=["Not suitable for large datasets", "Sensitive to noise", "Requires feature scaling"],
         complexity_score=6,
-        handle_sparse=False # sklearn requires dense for some kernels, typically needs scaling
+        handle_sparse=False, # sklearn requires dense for some kernels, typically needs scaling
+        estimator="sklearn.svm:SVC",
+        search_space={"C": ("log", 1e-2, 100.0), "gamma": ["scale", "auto"], "kernel": ["rbf", "linear"]}
     ))
 
     # --- Naive Bayes ---
@@ -88,7 +101,9 @@ def register_all_algorithms():
         pros=["Extremely fast", "Simple", "Good for text/high-dim"],
         cons=["Assumes feature independence (rarely true)", "Can be outperformed by complex models"],
         complexity_score=1,
-        min_samples=10
+        min_samples=10,
+        estimator="sklearn.naive_bayes:GaussianNB",
+        search_space={"var_smoothing": ("log", 1e-11, 1e-6)}
     ))
     
     # --- Boosting ---
@@ -98,7 +113,9 @@ def register_all_algorithms():
         description="An iterative ensemble method that adjusts weights of incorrectly classified instances so that subsequent classifiers focus on difficult cases.",
         pros=["Less prone to overfitting than some", "Easy to implement"],
         cons=["Sensitive to noisy data and outliers"],
-        complexity_score=4
+        complexity_score=4,
+        estimator="sklearn.ensemble:AdaBoostClassifier",
+        search_space={"n_estimators": ("int", 50, 400), "learning_rate": ("log", 0.01, 2.0)}
     ))
     
     # --- Others ---
@@ -108,7 +125,9 @@ def register_all_algorithms():
         description="Non-parametric method where the input consists of the k closest training examples in the feature space.",
         pros=["Simple", "No training phase"],
         cons=["Slow prediction", "Sensitive to noise", "Curse of dimensionality"],
-        complexity_score=3
+        complexity_score=3,
+        estimator="sklearn.neighbors:KNeighborsClassifier",
+        search_space={"n_neighbors": ("int", 3, 50), "weights": ["uniform", "distance"], "p": [1, 2]}
     ))
 
     # --- Advanced Ensembles (for Competition) ---
@@ -120,7 +139,10 @@ def register_all_algorithms():
         cons=["Can overfit on small datasets"],
         complexity_score=6,
         handle_missing=True,
-        handle_categorical=True
+        handle_categorical=True,
+        estimator="lightgbm:LGBMClassifier",
+        estimator_fallback="sklearn.ensemble:GradientBoostingClassifier",
+        search_space={"n_estimators": ("int", 100, 1000), "learning_rate": ("log", 0.01, 0.3), "num_leaves": ("int", 15, 255), "max_depth": [-1, 4, 8, 12], "subsample": ("float", 0.5, 1.0), "colsample_bytree": ("float", 0.5, 1.0)}
     ))
 
     AlgorithmRegistry.register(Algorithm(
@@ -131,7 +153,10 @@ def register_all_algorithms():
         cons=["Slow training on default settings"],
         complexity_score=6,
         handle_missing=True,
-        handle_categorical=True
+        handle_categorical=True,
+        estimator="catboost:CatBoostClassifier",
+        estimator_fallback="sklearn.ensemble:GradientBoostingClassifier",
+        search_space={"iterations": ("int", 100, 1000), "learning_rate": ("log", 0.01, 0.3), "depth": ("int", 4, 10), "l2_leaf_reg": ("log", 1.0, 10.0)}
     ))
 
     AlgorithmRegistry.register(Algorithm(
@@ -141,7 +166,10 @@ def register_all_algorithms():
         pros=["State-of-the-art performance", "Handles missing values"],
         cons=["Many hyperparameters"],
         complexity_score=7,
-        handle_missing=True
+        handle_missing=True,
+        estimator="xgboost:XGBRegressor",
+        estimator_fallback="sklearn.ensemble:RandomForestRegressor",
+        search_space={"n_estimators": ("int", 100, 1000), "learning_rate": ("log", 0.01, 0.3), "max_depth": ("int", 3, 10), "subsample": ("float", 0.5, 1.0), "colsample_bytree": ("float", 0.5, 1.0)}
     ))
     
     AlgorithmRegistry.register(Algorithm(
@@ -151,7 +179,10 @@ def register_all_algorithms():
         pros=["Fast", "Efficient"],
         cons=["Overfitting on small data"],
         complexity_score=6,
-        handle_missing=True
+        handle_missing=True,
+        estimator="lightgbm:LGBMRegressor",
+        estimator_fallback="sklearn.ensemble:RandomForestRegressor",
+        search_space={"n_estimators": ("int", 100, 1000), "learning_rate": ("log", 0.01, 0.3), "num_leaves": ("int", 15, 255), "subsample": ("float", 0.5, 1.0), "colsample_bytree": ("float", 0.5, 1.0)}
     ))
 
     AlgorithmRegistry.register(Algorithm(
@@ -160,7 +191,8 @@ def register_all_algorithms():
         description="Soft Voting/Majority Rule classifier for unfitted estimators.",
         pros=["Balances out individual model weaknesses"],
         cons=["Slower to train (trains all sub-models)"],
-        complexity_score=8
+        complexity_score=8,
+        estimator="src.automl.mappings:create_voting_classifier"
     ))
 
     AlgorithmRegistry.register(Algorithm(
@@ -169,7 +201,8 @@ def register_all_algorithms():
         description="Stack of estimators with a final estimator.",
         pros=["Usually higher accuracy"],
         cons=["Computationally expensive"],
-        complexity_score=9
+        complexity_score=9,
+        estimator="src.automl.mappings:create_stacked_regressor"
     ))
     
     AlgorithmRegistry.register(Algorithm(
@@ -178,7 +211,8 @@ def register_all_algorithms():
         description="A powerful ensemble of the top gradient boosting libraries.",
         pros=["Top-tier competition performance"],
         cons=["Very slow", "Include dependencies"],
-        complexity_score=10
+        complexity_score=10,
+        estimator="src.automl.mappings:create_ensemble_classifier"
     ))
     
     AlgorithmRegistry.register(Algorithm(
@@ -187,8 +221,12 @@ def register_all_algorithms():
         description="Stacked generalization of multiple regressors.",
         pros=["Top-tier competition performance"],
         cons=["Very slow"],
-        complexity_score=10
+        complexity_score=10,
+        estimator="src.automl.mappings:create_stacked_regressor"
     ))
 
 # Call this function to initialize registry (usually in __init__)
 register_all_algorithms()
+
+# Third-party algorithms published under the "malgocat.algorithms" entry point group
+load_entry_point_plugins()
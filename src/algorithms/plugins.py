@@ -0,0 +1,104 @@
+import importlib
+import os
+import sys
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+from src.algorithms.base import Algorithm
+from src.algorithms.registry import AlgorithmRegistry
+
+# Third-party packages expose algorithms under this entry point group, e.g. in pyproject.toml:
+#   [project.entry-points."malgocat.algorithms"]
+#   my_algos = "my_package.algorithms:ALGORITHMS"
+ENTRY_POINT_GROUP = "malgocat.algorithms"
+DISABLE_ENV_VAR = "MALGOCAT_DISABLE_PLUGINS"
+
+_factories: Dict[Tuple[Any, Optional[str]], Callable] = {}
+_missing_libraries = set()  # Warn once per library, not once per estimator
+_lock = threading.Lock()
+_plugins_loaded = False
+
+
+def import_from_path(path: str) -> Any:
+    """Imports "package.module:attribute" (attribute may be dotted)."""
+    module_name, _, attribute = path.partition(":")
+    obj = importlib.import_module(module_name)
+    for part in attribute.split(".") if attribute else []:
+        obj = getattr(obj, part)
+    return obj
+
+
+def load_estimator_factory(estimator: Any, fallback: Optional[str] = None) -> Callable:
+    """
+    Resolves an Algorithm's estimator to a callable returning an unfitted model.
+    The import happens on first use and is cached.
+
+    Args:
+        estimator: Import path ("sklearn.svm:SVC") or an already imported class/factory.
+        fallback: Import path used when the primary library is not installed.
+    """
+    if callable(estimator):
+        return estimator
+    key = (estimator, fallback)
+    factory = _factories.get(key)
+    if factory is not None:
+        return factory
+    with _lock:
+        if key not in _factories:
+            try:
+                _factories[key] = import_from_path(estimator)
+            except ImportError:
+                if fallback is None:
+                    raise
+                library = estimator.split(":")[0].split(".")[0]
+                if library not in _missing_libraries:
+                    _missing_libraries.add(library)
+                    print(f"Warning: {library} not found, using sklearn fallback.", file=sys.stderr)
+                _factories[key] = import_from_path(fallback)
+        return _factories[key]
+
+
+def estimator_factory(algorithm: Algorithm) -> Optional[Callable]:
+    """Factory for a registered Algorithm, or None if it declares no estimator."""
+    if algorithm.estimator is None:
+        return None
+    return load_estimator_factory(algorithm.estimator, algorithm.estimator_fallback)
+
+
+def _register_plugin_object(obj: Any) -> int:
+    """Registers an Algorithm, an iterable of them, or the result of a zero-argument callable."""
+    if callable(obj) and not isinstance(obj, Algorithm):
+        obj = obj()
+    if obj is None:
+        return 0  # Callable registered its algorithms itself
+    if isinstance(obj, Algorithm):
+        obj = [obj]
+    count = 0
+    for algorithm in obj:
+        if not isinstance(algorithm, Algorithm):
+            raise TypeError(f"Plugin returned {type(algorithm).__name__}, expected Algorithm")
+        AlgorithmRegistry.register(algorithm)
+        count += 1
+    return count
+
+
+def load_entry_point_plugins(group: str = ENTRY_POINT_GROUP) -> int:
+    """
+    Registers algorithms published by installed packages under the entry point group.
+    Runs once per process; a broken plugin is reported and skipped.
+
+    Returns:
+        Number of algorithms registered by this call.
+    """
+    global _plugins_loaded
+    if _plugins_loaded or os.environ.get(DISABLE_ENV_VAR, "0") == "1":
+        return 0
+    _plugins_loaded = True
+
+    from importlib.metadata import entry_points
+    registered = 0
+    for entry_point in entry_points(group=group):
+        try:
+            registered += _register_plugin_object(entry_point.load())
+        except Exception as e:
+            print(f"Warning: failed to load algorithm plugin '{entry_point.name}': {e}", file=sys.stderr)
+    return registered
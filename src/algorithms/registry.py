@@ -1,15 +1,55 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterable
 from src.algorithms.base import Algorithm
 
 class AlgorithmRegistry:
     """
     Singleton-like registry to store all known algorithms.
+
+    Besides the name lookup it keeps secondary indexes by problem type, capability
+    flag and complexity band, maintained on register(). Algorithms are treated as
+    immutable once registered (re-register to change metadata).
     """
     _algorithms: Dict[str, Algorithm] = {}
 
+    # Capability flags on Algorithm that can be queried
+    CAPABILITIES = ("handle_missing", "handle_sparse", "handle_categorical")
+    # Inclusive upper complexity_score per band
+    COMPLEXITY_BANDS = (("low", 3), ("medium", 6), ("high", 10))
+
+    # Secondary indexes: key -> {lowercase name: Algorithm} (dicts keep registration order)
+    _by_type: Dict[str, Dict[str, Algorithm]] = {}
+    _by_capability: Dict[str, Dict[str, Algorithm]] = {}
+    _by_band: Dict[str, Dict[str, Algorithm]] = {}
+
     @classmethod
     def register(cls, algorithm: Algorithm):
-        cls._algorithms[algorithm.name.lower()] = algorithm
+        key = algorithm.name.lower()
+        if key in cls._algorithms:
+            cls._unindex(key, cls._algorithms[key])
+        cls._algorithms[key] = algorithm
+        cls._by_type.setdefault(algorithm.type, {})[key] = algorithm
+        for flag in cls.CAPABILITIES:
+            if getattr(algorithm, flag, False):
+                cls._by_capability.setdefault(flag, {})[key] = algorithm
+        cls._by_band.setdefault(cls.complexity_band(algorithm.complexity_score), {})[key] = algorithm
+
+    @classmethod
+    def _unindex(cls, key: str, algorithm: Algorithm):
+        cls._by_type.get(algorithm.type, {}).pop(key, None)
+        for flag in cls.CAPABILITIES:
+            cls._by_capability.get(flag, {}).pop(key, None)
+        cls._by_band.get(cls.complexity_band(algorithm.complexity_score), {}).pop(key, None)
+
+    @classmethod
+    def complexity_band(cls, complexity_score: int) -> str:
+        for band, upper in cls.COMPLEXITY_BANDS:
+            if complexity_score <= upper:
+                return band
+        return cls.COMPLEXITY_BANDS[-1][0]
+
+    @classmethod
+    def count(cls) -> int:
+        return len(cls._algorithms)
 
     @classmethod
     def get_all(cls) -> List[Algorithm]:
@@ -19,6 +59,52 @@ class AlgorithmRegistry:
     def get_by_name(cls, name: str) -> Optional[Algorithm]:
         return cls._algorithms.get(name.lower())
 
+    @classmethod
+    def get_many(cls, names: Iterable[str]) -> List[Algorithm]:
+        """Resolves names in order, skipping unknown ones."""
+        found = (cls._algorithms.get(name.lower()) for name in names)
+        return [algo for algo in found if algo is not None]
+
     @classmethod
     def get_by_type(cls, problem_type: str) -> List[Algorithm]:
-        return [algo for algo in cls._algorithms.values() if algo.type == problem_type]
+        return list(cls._by_type.get(problem_type, {}).values())
+
+    @classmethod
+    def get_by_capability(cls, capability: str) -> List[Algorithm]:
+        if capability not in cls.CAPABILITIES:
+            raise ValueError(f"Unknown capability '{capability}'. Available: {', '.join(cls.CAPABILITIES)}")
+        return list(cls._by_capability.get(capability, {}).values())
+
+    @classmethod
+    def get_by_complexity_band(cls, band: str) -> List[Algorithm]:
+        return list(cls._by_band.get(band, {}).values())
+
+    @classmethod
+    def query(cls, problem_type: Optional[str] = None, capabilities: Iterable[str] = (),
+              complexity_band: Optional[str] = None) -> List[Algorithm]:
+        """
+        Algorithms matching every given filter, in registration order.
+
+        Args:
+            problem_type: e.g. "classification".
+            capabilities: Flags that must all be True, e.g. ["handle_missing"].
+            complexity_band: "low", "medium" or "high".
+
+        Returns:
+            List of matching Algorithms.
+        """
+        sets = []
+        if problem_type is not None:
+            sets.append(cls._by_type.get(problem_type, {}))
+        for capability in capabilities:
+            if capability not in cls.CAPABILITIES:
+                raise ValueError(f"Unknown capability '{capability}'. Available: {', '.join(cls.CAPABILITIES)}")
+            sets.append(cls._by_capability.get(capability, {}))
+        if complexity_band is not None:
+            sets.append(cls._by_band.get(complexity_band, {}))
+        if not sets:
+            return cls.get_all()
+        # Walk the smallest index and probe the others
+        sets.sort(key=len)
+        smallest, rest = sets[0], sets[1:]
+        return [algo for key, algo in smallest.items() if all(key in other for other in rest)]
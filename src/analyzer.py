@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterable, List
+from src.serialization import series_to_dict, frame_to_dict, to_native
+from src.tracing import traced
 
 class DatasetAnalyzer:
     """
@@ -8,6 +10,32 @@ class DatasetAnalyzer:
     that can be used to recommend ML algorithms.
     """
     
+    # Public sections, in output order
+    SECTIONS = ("basic_stats", "feature_types", "missing_stats", "imbalance_stats",
+                "skewness", "correlations", "outliers", "feature_columns", "target_relevance",
+                "column_screening", "categorical_profile", "column_types")
+
+    # Node -> nodes it is computed from. Intermediates (not in SECTIONS) are computed at most
+    # once per analyzer and shared by every section that needs them.
+    DEPENDENCIES = {
+        "numeric_frame": (),
+        "missing_mask": (),
+        "inferred_types": (),
+        "target_profile": (),
+        "basic_stats": (),
+        "feature_types": ("inferred_types",),
+        "missing_stats": ("missing_mask",),
+        "imbalance_stats": ("target_profile",),
+        "skewness": ("numeric_frame",),
+        "correlations": ("numeric_frame",),
+        "outliers": ("numeric_frame",),
+        "feature_columns": ("inferred_types",),
+        "target_relevance": ("target_profile",),
+        "column_screening": (),
+        "categorical_profile": (),
+        "column_types": ("inferred_types",),
+    }
+    
     def __init__(self, df: pd.DataFrame, target_column: Optional[str] = None):
         """
         Initialize the analyzer with a dataframe.
@@ -19,158 +47,228 @@ class DatasetAnalyzer:
         self.df = df
         self.target_column = target_column
         self.analysis_result = {}
+        self._intermediates: Dict[str, Any] = {}
 
-    def analyze(self) -> Dict[str, Any]:
+    def analyze(self, sections: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
-        Perform full analysis of the dataset.
+        Perform analysis of the dataset.
+        
+        Args:
+            sections: Names from SECTIONS to compute (default: all). Sections not
+                      requested are never run.
         
         Returns:
             Dictionary containing dataset fingerprints and statistics.
         """
-        self.analysis_result = {
-            "basic_stats": self._get_basic_stats(),
-            "feature_types": self._get_feature_types(),
-            "missing_stats": self._get_missing_stats(),
-            "imbalance_stats": self._get_imbalance_stats() if self.target_column else None,
-            "skewness": self._get_skewness(),
-            "correlations": self._get_correlations(),
-            "outliers": self._get_outlier_stats()
+        requested = self.resolve_sections(sections)
+        sections_fn = {
+            "basic_stats": self._get_basic_stats,
+            "feature_types": self._get_feature_types,
+            "missing_stats": self._get_missing_stats,
+            "imbalance_stats": self._get_target_stats,
+            "skewness": self._get_skewness,
+            "correlations": self._get_correlations,
+            "outliers": self._get_outlier_stats,
+            # Add feature columns explicitly for frontend Mapping
+            "feature_columns": self._get_feature_columns,
+            "target_relevance": self._get_target_relevance,
+            "column_screening": self._get_column_screening,
+            "categorical_profile": self._get_categorical_profile,
+            "column_types": lambda: to_native(self._intermediates["inferred_types"]),
+        }
+        intermediates_fn = {
+            "numeric_frame": lambda: self.df.select_dtypes(include=[np.number]),
+            "missing_mask": self.df.isna,
+            # Sampled datetime/free-text detection for object/string columns (columns are not converted)
+            "inferred_types": self._infer_types,
+            # Single-pass target profile (see src.target_profile), None without a target
+            "target_profile": self._profile_target,
         }
-        
-        # Enrich target analysis with type detection if not just basic imbalance
-        if self.target_column:
-             target_type_info = self._detect_target_type()
-             if self.analysis_result["imbalance_stats"]:
-                 self.analysis_result["imbalance_stats"].update(target_type_info)
-             else:
-                 self.analysis_result["imbalance_stats"] = target_type_info
-
-        # Add feature columns explicitly for frontend Mapping
-        self.analysis_result["feature_columns"] = self._get_feature_columns()
 
+        self.analysis_result = {}
+        for node in self._plan(requested):
+            if node in sections_fn:
+                self.analysis_result[node] = sections_fn[node]()
+            elif node not in self._intermediates:
+                self._intermediates[node] = intermediates_fn[node]()
+        # Plan order is dependency order; report in the usual section order
+        self.analysis_result = {name: self.analysis_result[name] for name in self.SECTIONS if name in requested}
         return self.analysis_result
 
-    def _get_feature_columns(self) -> Dict[str, list]:
-        """Get list of column names for each type."""
+    @classmethod
+    def resolve_sections(cls, sections: Optional[Iterable[str]] = None) -> List[str]:
+        """Validates requested section names; None means every section."""
+        if sections is None:
+            return list(cls.SECTIONS)
+        requested = [name.strip() for name in sections if name.strip()]
+        unknown = [name for name in requested if name not in cls.SECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown analysis sections: {', '.join(unknown)}. Available: {', '.join(cls.SECTIONS)}")
+        return requested
+
+    @classmethod
+    def _plan(cls, requested: List[str]) -> List[str]:
+        """Requested sections plus their dependencies, dependencies first (depth-first topological order)."""
+        order: List[str] = []
+        def visit(node: str):
+            if node in order:
+                return
+            for dependency in cls.DEPENDENCIES[node]:
+                visit(dependency)
+            order.append(node)
+        for name in requested:
+            visit(name)
+        return order
+
+    def _get_target_stats(self) -> Optional[Dict[str, Any]]:
+        """Imbalance stats enriched with target type detection (None without a target)."""
+        if not self.target_column:
+            return None
+        stats = self._get_imbalance_stats()
+        target_type_info = self._detect_target_type()
+        if stats:
+            stats.update(target_type_info)
+            return stats
+        return target_type_info
+
+    @traced("analyzer.column_types")
+    def _infer_types(self) -> Dict[str, Dict[str, Any]]:
+        from src.column_types import infer_column_types
+        return infer_column_types(self.df)
+
+    def _typed_columns(self) -> Dict[str, list]:
+        """Column names per type; object/string columns are split by the inferred types."""
+        inferred = self._intermediates["inferred_types"]
         dtypes = self.df.dtypes
+        def inferred_as(kind):
+            return [col for col, profile in inferred.items() if profile["inferred"] == kind]
         return {
             "numerical": [col for col, t in dtypes.items() if pd.api.types.is_numeric_dtype(t)],
-            "categorical": [col for col, t in dtypes.items() if pd.api.types.is_object_dtype(t) or pd.api.types.is_categorical_dtype(t)],
-            "datetime": [col for col, t in dtypes.items() if pd.api.types.is_datetime64_any_dtype(t)],
+            "categorical": inferred_as("categorical") + [col for col, t in dtypes.items() if isinstance(t, pd.CategoricalDtype)],
+            "datetime": [col for col, t in dtypes.items() if pd.api.types.is_datetime64_any_dtype(t)] + inferred_as("datetime"),
+            "text": inferred_as("text"),
             "bool": [col for col, t in dtypes.items() if pd.api.types.is_bool_dtype(t)]
         }
 
+    @traced("analyzer.feature_columns")
+    def _get_feature_columns(self) -> Dict[str, list]:
+        """Get list of column names for each type."""
+        return self._typed_columns()
+
+    @traced("analyzer.basic_stats")
     def _get_basic_stats(self) -> Dict[str, Any]:
         """Extract basic dimensions and memory usage."""
         return {
             "n_rows": self.df.shape[0],
             "n_columns": self.df.shape[1],
-            "memory_usage_mb": self.df.memory_usage(deep=True).sum() / 1024**2,
-            "is_empty": self.df.empty
+            "memory_usage_mb": float(self.df.memory_usage(deep=True).sum() / 1024**2),
+            "is_empty": bool(self.df.empty)
         }
 
+    @traced("analyzer.feature_types")
     def _get_feature_types(self) -> Dict[str, int]:
-        """Identify counts of different feature types."""
-        dtypes = self.df.dtypes
-        return {
-            "numerical": int(sum(pd.api.types.is_numeric_dtype(t) for t in dtypes)),
-            "categorical": int(sum(pd.api.types.is_object_dtype(t) or pd.api.types.is_categorical_dtype(t) for t in dtypes)),
-            "datetime": int(sum(pd.api.types.is_datetime64_any_dtype(t) for t in dtypes)),
-            "bool": int(sum(pd.api.types.is_bool_dtype(t) for t in dtypes))
-        }
+        """Identify counts of different feature types (date_columns/text_columns as the advisor reads them)."""
+        counts = {kind: len(columns) for kind, columns in self._typed_columns().items()}
+        counts["date_columns"] = counts["datetime"]
+        counts["text_columns"] = counts.pop("text")
+        return counts
 
+    @traced("analyzer.missing_stats")
     def _get_missing_stats(self) -> Dict[str, Any]:
         """Analyze missing values."""
+        missing_mask = self._intermediates["missing_mask"]
         total_cells = self.df.size
-        missing_cells = self.df.isna().sum().sum()
-        columns_with_missing = self.df.columns[self.df.isna().any()].tolist()
+        missing_cells = missing_mask.sum().sum()
+        columns_with_missing = self.df.columns[missing_mask.any()].tolist()
         
         return {
             "total_missing": int(missing_cells),
             "missing_ratio": float(missing_cells / total_cells) if total_cells > 0 else 0.0,
             "columns_with_missing": columns_with_missing,
-            "has_missing_values": missing_cells > 0
+            "has_missing_values": bool(missing_cells > 0)
         }
     
+    @traced("analyzer.skewness")
     def _get_skewness(self) -> Dict[str, float]:
         """Calculate skewness for numerical columns."""
-        numeric_df = self.df.select_dtypes(include=[np.number])
+        numeric_df = self._intermediates["numeric_frame"]
         if numeric_df.empty:
             return {}
-        return numeric_df.skew().to_dict()
+        return series_to_dict(numeric_df.skew())
 
+    @traced("analyzer.correlations")
     def _get_correlations(self) -> Dict[str, Dict[str, float]]:
         """Calculate Pearson correlation matrix for numerical columns."""
-        numeric_df = self.df.select_dtypes(include=[np.number])
+        numeric_df = self._intermediates["numeric_frame"]
         if numeric_df.empty or numeric_df.shape[1] < 2:
             return {}
-        return numeric_df.corr().to_dict()
+        # Whole matrix converted in one pass (NaN -> None) so the API can serialize it as-is
+        return frame_to_dict(numeric_df.corr())
 
+    @traced("analyzer.outliers")
     def _get_outlier_stats(self) -> Dict[str, int]:
          """Detect outliers using IQR method for numerical columns."""
-         numeric_df = self.df.select_dtypes(include=[np.number])
-         outliers = {}
-         for col in numeric_df.columns:
-             Q1 = numeric_df[col].quantile(0.25)
-             Q3 = numeric_df[col].quantile(0.75)
-             IQR = Q3 - Q1
-             lower_bound = Q1 - 1.5 * IQR
-             upper_bound = Q3 + 1.5 * IQR
-             count = ((numeric_df[col] < lower_bound) | (numeric_df[col] > upper_bound)).sum()
-             if count > 0:
-                 outliers[col] = int(count)
-         return outliers
+         numeric_df = self._intermediates["numeric_frame"]
+         if numeric_df.empty:
+             return {}
+         # All columns' quartiles in one call instead of two quantile passes per column
+         quartiles = numeric_df.quantile([0.25, 0.75])
+         Q1, Q3 = quartiles.iloc[0], quartiles.iloc[1]
+         IQR = Q3 - Q1
+         counts = ((numeric_df < Q1 - 1.5 * IQR) | (numeric_df > Q3 + 1.5 * IQR)).sum()
+         return {col: int(count) for col, count in counts.items() if count > 0}
 
+    @traced("analyzer.target_relevance")
+    def _get_target_relevance(self) -> Optional[Dict[str, Any]]:
+        """Per-feature mutual information / correlation ratio with the target and leakage suspects (None without a target)."""
+        if not self.target_column or self.target_column not in self.df.columns:
+            return None
+        from src.relevance import target_relevance
+        is_classification = self._detect_target_type().get("problem_type") == "classification"
+        return to_native(target_relevance(self.df, self.target_column, is_classification))
+
+    @traced("analyzer.column_screening")
+    def _get_column_screening(self) -> Dict[str, Any]:
+        """Constant, near-constant, duplicate and ID-like columns (candidates to drop) and duplicate rows."""
+        from src.screening import screen_columns
+        return to_native(screen_columns(self.df, self.target_column))
+
+    @traced("analyzer.categorical_profile")
+    def _get_categorical_profile(self) -> Dict[str, Any]:
+        """Sketch-based distinct counts, heavy hitters and rare-category share per categorical column."""
+        from src.sketches import profile_categoricals
+        exclude = [self.target_column] if self.target_column else []
+        return to_native(profile_categoricals(self.df, exclude=exclude))
+
+    @traced("analyzer.target_profile")
+    def _profile_target(self) -> Optional[Dict[str, Any]]:
+        if not self.target_column or self.target_column not in self.df.columns:
+            return None
+        from src.target_profile import profile_series
+        return profile_series(self.df[self.target_column])
+
+    def _target_profile(self) -> Optional[Dict[str, Any]]:
+        """The target_profile intermediate, shared by the target sections of this analyzer."""
+        return self._intermediates["target_profile"]
+
+    @traced("analyzer.target_type")
     def _detect_target_type(self) -> Dict[str, Any]:
         """
-        Sophisticated logic to detect if target is regression, classification (binary/multi), or other.
+        Regression vs classification (binary/multiclass): non-numeric targets, and integer-like
+        numeric targets with fewer than 20 distinct values, are classification.
         """
-        if not self.target_column or self.target_column not in self.df.columns:
+        profile = self._target_profile()
+        if profile is None:
             return {}
-            
-        target = self.df[self.target_column]
-        distinct_count = target.nunique()
-        is_numeric = pd.api.types.is_numeric_dtype(target.dtype)
-        
-        # Heuristics
-        if not is_numeric:
-            return {"problem_type": "classification", "sub_type": "binary" if distinct_count == 2 else "multiclass"}
-        
-        # It is numeric. Is it regression or classification?
-        # If float with decimals -> Regression
-        # If integer but few unique values -> Classification (likely ordinal or class labels)
-        
-        # Check if values are essentially integers
-        is_integer_like = np.array_equal(target.dropna(), target.dropna().astype(int))
-        
-        if is_integer_like and distinct_count < 20: # Threshold of 20 unique values for classification hint
-             return {"problem_type": "classification", "sub_type": "multiclass", "note": "Numeric target with low cardinality"}
-        
-        return {"problem_type": "regression"}
+        return {key: profile[key] for key in ("problem_type", "sub_type", "note") if key in profile}
 
+    @traced("analyzer.imbalance_stats")
     def _get_imbalance_stats(self) -> Optional[Dict[str, Any]]:
-        """Check for class imbalance if target is categorical."""
-        if not self.target_column or self.target_column not in self.df.columns:
+        """Class distribution and imbalance for classification targets, skewness for regression."""
+        profile = self._target_profile()
+        if profile is None:
             return None
-            
-        target = self.df[self.target_column]
-        # We will let _detect_target_type handle the high level type, 
-        # but if it IS classification, we want distribution.
-        
-        # Re-using the logic slightly here or trusting the basic check needed for stats
-        
-        is_numeric = pd.api.types.is_numeric_dtype(target.dtype)
-        distinct_count = target.nunique()
-
-        # If it looks like regression, return skewness
-        if is_numeric and distinct_count > 20:
-             return {"type": "regression", "skewness": target.skew()}
-        
-        # Assume classification
-        value_counts = target.value_counts(normalize=True)
-        return {
-            "type": "classification",
-            "class_distribution": value_counts.to_dict(),
-            "num_classes": len(value_counts),
-            "is_imbalanced": any(value_counts < (1.0 / len(value_counts) * 0.5)) # Simple heuristic
-        }
+        if profile["problem_type"] == "regression":
+            return {"type": "regression", "skewness": profile["skewness"]}
+        return {"type": "classification", "class_distribution": dict(profile["class_distribution"]),
+                "num_classes": profile["num_classes"], "is_imbalanced": profile["is_imbalanced"]}
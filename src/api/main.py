@@ -1,20 +1,63 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException
+import importlib
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any
+from fastapi import FastAPI, UploadFile, File, HTTPException, Request, Response
+from fastapi.responses import PlainTextResponse, FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 import shutil
+import uuid
 import os
 import pandas as pd
-import json
 from src.analyzer import DatasetAnalyzer
-from src.engine import HeuristicRanker
+from src.meta.fingerprint import FingerprintVectorizer
+from src.meta.history import BenchmarkHistory
+from src.meta.index import FingerprintIndex
+from src.meta.ranker import MetaRanker
 from src.explanations.llm_engine import ExplanationEngine
 from src.competition.advisor import CompetitionAdvisor
+from src.automl.cost_model import CostModel
 from src.automl.runner import AutoMLRunner
-from src.visualizer import DatasetVisualizer
-from src.api.schemas import AnalysisResponse, RecommendationRequest, RecommendationResponse, BenchmarkRequest, BenchmarkResponse, CompetitionPlanRequest, CompetitionPlanResponse
+from src.automl.artifacts import ModelArtifactStore
+from src.automl.scoring import ScoringRun, DEFAULT_CHUNKSIZE
+from src.automl.tuning import HyperparameterTuner
+from src.algorithms.registry import AlgorithmRegistry
+from src.visualizer import DatasetVisualizer, load_plotting
+from src.profiling import profiling_requested, maybe_profile, load_summary, valid_profile_id, PROFILE_DIR
+from src.tracing import stage, metrics, REQUEST_SECONDS, start_request_timings, server_timing_header
+from src.api.responses import FastJSONResponse
+from src.api.negotiation import negotiated_analysis_response, MIN_COMPRESS_SIZE
+from src.api.sessions import SessionStore, DatasetSession
+from src.serialization import to_native
+from src.screening import screen_columns, apply_screening, pruning_summary
+from src.api.schemas import AnalysisResponse, RecommendationRequest, RecommendationResponse, BenchmarkRequest, BenchmarkResponse, CompetitionPlanRequest, CompetitionPlanResponse, SimilarDatasetsRequest, SimilarDatasetsResponse, TuneRequest, TuneResponse, LearningCurveRequest, LearningCurveResponse
 import src.algorithms.definitions # Register algorithms
 
-app = FastAPI()
+# Plotting and ML stacks are imported on first use so the process starts fast; once the server is up
+# they are pre-warmed on a background thread (MALGOCAT_PREWARM=0 disables, e.g. for one-shot workers)
+PREWARM_MODULES = ("sklearn.model_selection", "sklearn.metrics", "sklearn.impute", "sklearn.preprocessing",
+                   "sklearn.linear_model", "sklearn.ensemble")
+
+def prewarm_imports():
+    with stage("startup.prewarm"):
+        load_plotting()
+        for module in PREWARM_MODULES:
+            try:
+                importlib.import_module(module)
+            except ImportError:
+                pass
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if os.environ.get("MALGOCAT_PREWARM", "1") == "1":
+        threading.Thread(target=prewarm_imports, name="prewarm", daemon=True).start()
+    yield
+
+# Every endpoint renders through the fast serializer; /analyze also skips response_model revalidation
+app = FastAPI(default_response_class=FastJSONResponse, lifespan=lifespan)
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -25,19 +68,82 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# gzip for any client that accepts it; responses already brotli-encoded by /analyze pass through untouched
+app.add_middleware(GZipMiddleware, minimum_size=MIN_COMPRESS_SIZE)
+
+# Per-stage timings as a Server-Timing header: always with MALGOCAT_SERVER_TIMING=1, or per request with "X-Server-Timing: 1"
+SERVER_TIMING = os.environ.get("MALGOCAT_SERVER_TIMING", "0") == "1"
+
+@app.middleware("http")
+async def record_timings(request: Request, call_next):
+    timings = start_request_timings()
+    start = time.perf_counter()
+    response = await call_next(request)
+    elapsed = time.perf_counter() - start
+    # Label by route template so path parameters don't explode the series count
+    route = request.scope.get("route")
+    REQUEST_SECONDS.observe(elapsed, method=request.method, path=getattr(route, "path", "unmatched"),
+                            status=str(response.status_code))
+    if SERVER_TIMING or request.headers.get("x-server-timing") == "1":
+        timings.append(("total", elapsed))
+        response.headers["Server-Timing"] = server_timing_header(timings)
+    return response
+
 UPLOAD_DIR = "temp_uploads"
 PLOTS_DIR = "plots"
+META_DIR = "meta_store"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 os.makedirs(PLOTS_DIR, exist_ok=True)
 
+# Benchmark results accumulate here and feed the learned ranker (heuristic until there is history)
+fingerprint_index = FingerprintIndex(os.path.join(META_DIR, "fingerprint_index"))
+benchmark_history = BenchmarkHistory(os.path.join(META_DIR, "benchmark_history.jsonl"), index=fingerprint_index)
+meta_ranker = MetaRanker(history=benchmark_history)
+# Fed by every benchmark fit and by `python -m src.automl.calibration`
+cost_model = CostModel(os.path.join(META_DIR, "cost_measurements.jsonl"))
+
+# Fitted benchmark models with their preprocessing, reusable for predictions without retraining
+MODEL_DIR = "model_store"
+model_store = ModelArtifactStore(MODEL_DIR, max_bytes=int(os.environ.get("MALGOCAT_MODEL_STORE_MB", "1024")) * 1024 ** 2)
+
+# Parsed uploads keyed by dataset_id so follow-up calls skip re-uploading and re-parsing
+sessions = SessionStore(max_bytes=int(os.environ.get("MALGOCAT_SESSION_MEMORY_MB", "512")) * 1024 ** 2)
+
 # Mount plots directory
 app.mount("/plots", StaticFiles(directory=PLOTS_DIR), name="plots")
 
 @app.post("/analyze", response_model=AnalysisResponse)
-async def analyze_file(file: UploadFile = File(...)):
-    file_path = os.path.join(UPLOAD_DIR, file.filename)
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+async def analyze_file(request: Request, response: Response, file: UploadFile = File(...), fields: Optional[str] = None,
+                       target: Optional[str] = None, prune: bool = False):
+    # ?fields=basic_stats,feature_types limits the work to those sections; "plots" opts into plot generation.
+    # ?target=<column> adds the target-aware sections (imbalance_stats, target_relevance).
+    # ?prune=true drops the columns/rows column_screening flags before analysing (and for later calls on the session);
+    # it needs ?target=, otherwise the label itself could be pruned (a rare-positive flag reads as near-constant)
+    if prune and target is None:
+        raise HTTPException(status_code=400, detail="prune=true requires a target column (?target=...).")
+    requested = fields.split(",") if fields else None
+    try:
+        sections = DatasetAnalyzer.resolve_sections([f for f in requested if f.strip() != "plots"] if requested else None)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    with_plots = requested is None or "plots" in requested
+    if not profiling_requested(request.headers, request.query_params):
+        return _run_analysis(file, request, sections, with_plots, target, prune)
+    with maybe_profile(True, "analyze", PROFILE_DIR) as session:
+        result = _run_analysis(file, request, sections, with_plots, target, prune)
+    if session is not None:
+        # A returned Response replaces the injected one, so the header goes on it directly
+        result.headers["X-Profile-Id"] = session.id
+    return result
+
+def _run_analysis(file: UploadFile, request: Request, sections=None, with_plots: bool = True,
+                  target: Optional[str] = None, prune: bool = False):
+    # Unique per upload: concurrent clients sending the same filename no longer overwrite each other
+    upload_id = uuid.uuid4().hex
+    file_path = os.path.join(UPLOAD_DIR, f"{upload_id}_{os.path.basename(file.filename)}")
+    with stage("upload.copy"):
+        with open(file_path, "wb") as buffer:
+            shutil.copyfileobj(file.file, buffer)
         
     try:
         if file.filename.endswith('.csv'):
@@ -46,39 +152,59 @@ async def analyze_file(file: UploadFile = File(...)):
             df = None
             error_details = []
             
-            for encoding in encodings:
-                try:
-                    df = pd.read_csv(file_path, encoding=encoding)
-                    break
-                except UnicodeDecodeError:
-                    error_details.append(f"{encoding}: failed")
-                    continue
-                except Exception as e:
-                     error_details.append(f"{encoding}: {str(e)}")
-                     continue
+            with stage("upload.parse"):
+                for encoding in encodings:
+                    try:
+                        df = pd.read_csv(file_path, encoding=encoding)
+                        break
+                    except UnicodeDecodeError:
+                        error_details.append(f"{encoding}: failed")
+                        continue
+                    except Exception as e:
+                         error_details.append(f"{encoding}: {str(e)}")
+                         continue
             
             if df is None:
                  raise HTTPException(status_code=400, detail=f"Could not decode CSV file. Tried encodings: {', '.join(encodings)}. Errors: {'; '.join(error_details)}")
         else:
             raise HTTPException(status_code=400, detail="Only CSV files supported for now.")
             
+        if target is not None and target not in df.columns:
+            raise HTTPException(status_code=400, detail=f"Target column '{target}' not found in the uploaded file.")
+
+        screening = None
+        if prune:
+            with stage("upload.screen"):
+                screening = screen_columns(df, target)
+                df = apply_screening(df, screening, drop_duplicate_rows=True)
+            sections = [name for name in (sections or DatasetAnalyzer.SECTIONS) if name != "column_screening"]
+
         # Analysis
-        analyzer = DatasetAnalyzer(df)
-        results = analyzer.analyze()
+        analyzer = DatasetAnalyzer(df, target_column=target)
+        start = time.perf_counter()
+        results = analyzer.analyze(sections=sections)
+        if screening is not None:
+            # Pairwise sections (correlations) grow with the square of the column count
+            exponent = 2 if "correlations" in sections else 1
+            screening["pruned"] = pruning_summary(screening, df, time.perf_counter() - start, exponent)
+            results["column_screening"] = to_native(screening)
+        session = sessions.create(df, file.filename, path=file_path, analysis=results)
         
-        # Plotting
-        filename_stem = os.path.splitext(file.filename)[0]
+        # Plotting (per dataset id, so same-named uploads don't share a plot directory)
+        filename_stem = session.id
         file_plots_dir = os.path.join(PLOTS_DIR, filename_stem)
+        session.owned_paths.append(file_plots_dir)
         
         # Try to guess target column from analysis if not provided?
         # For now, initiate without target or guess last column?
         # Visualizer handles None target gracefully
-        visualizer = DatasetVisualizer(df, target_column=None) 
-        visualizer.generate_all_plots(output_dir=file_plots_dir)
+        if with_plots:
+            visualizer = DatasetVisualizer(df, target_column=None) 
+            visualizer.generate_all_plots(output_dir=file_plots_dir)
         
         # Collect plot URLs
         plot_urls = []
-        if os.path.exists(file_plots_dir):
+        if with_plots and os.path.exists(file_plots_dir):
             for plot_file in os.listdir(file_plots_dir):
                 if plot_file.endswith('.png'):
                     # URL format: http://localhost:8000/plots/filename_stem/plot_file
@@ -87,49 +213,52 @@ async def analyze_file(file: UploadFile = File(...)):
                     # Returning full URL is safer if frontend doesn't know base
                     plot_urls.append(f"/plots/{filename_stem}/{plot_file}")
 
-        # Convert NaN to None for JSON serialization and handle numpy types
-        results = json_safe(results, filename=file.filename)
-        
-        return {"analysis": results, "filename": file.filename, "plots": plot_urls}
+        # The analyzer already returns JSON-native blocks; stray numpy/NaN values are handled by the renderer.
+        # JSON unless the client asks for MessagePack; brotli/gzip per Accept-Encoding
+        return negotiated_analysis_response({"analysis": results, "filename": file.filename, "plots": plot_urls,
+                                             "dataset_id": session.id},
+                                            request.headers.get("accept"), request.headers.get("accept-encoding"))
+    except HTTPException:
+        raise
     except Exception as e:
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
-def json_safe(obj, filename=""):
-    """Recursively convert numpy types and NaNs to JSON serializable types."""
-    # Handle composites first
-    if isinstance(obj, dict):
-        return {k: json_safe(v, filename) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple)):
-        return [json_safe(x, filename) for x in obj]
-    if hasattr(obj, 'tolist'): # Handle numpy arrays/series
-        return json_safe(obj.tolist(), filename)
-        
-    # Handle scalars
-    if pd.isna(obj):
-        return None
-    if isinstance(obj, (pd.Timestamp, pd.Timedelta)):
-        return str(obj)
-    if hasattr(obj, 'item'): # numpy scalar types
-        return obj.item()
-        
-    return obj
+def _resolve_session(dataset_id: Optional[str], filename: Optional[str]) -> Optional[DatasetSession]:
+    """Session for a dataset_id (404 if unknown/evicted), else the latest upload with that filename."""
+    if dataset_id:
+        session = sessions.get(dataset_id)
+        if session is None:
+            raise HTTPException(status_code=404, detail="Dataset session expired or not found.")
+        return session
+    if filename:
+        return sessions.find_by_filename(filename)
+    return None
+
+def _resolve_analysis(analysis: Optional[Dict[str, Any]], session: Optional[DatasetSession]) -> Dict[str, Any]:
+    """The analysis sent with the request, or the one stored with the session."""
+    if analysis is not None:
+        return analysis
+    if session is not None and session.analysis is not None:
+        return session.analysis
+    raise HTTPException(status_code=400, detail="Provide an analysis or the dataset_id returned by /analyze.")
 
 @app.post("/recommend", response_model=RecommendationResponse)
 async def get_recommendations(request: RecommendationRequest):
+    session = _resolve_session(request.dataset_id, None)
+    analysis = _resolve_analysis(request.analysis, session)
     try:
-        analysis = request.analysis
-        # Re-construct ranker flow
-        ranker = HeuristicRanker()
-        rank_results = ranker.rank(analysis, top_k=3)
+        # Learned ranking from benchmark history, heuristic on cold start
+        rank_results = meta_ranker.rank(analysis, top_k=3)
         
         # Explanation
         explainer = ExplanationEngine()
-        advisor = CompetitionAdvisor()
+        advisor = CompetitionAdvisor(cost_model=cost_model)
         
         recommendations = []
         time_estimates = {}
+        memory_estimates = {}
         
         n_rows = analysis.get("basic_stats", {}).get("n_rows", 0)
         n_cols = analysis.get("basic_stats", {}).get("n_columns", 0)
@@ -137,74 +266,202 @@ async def get_recommendations(request: RecommendationRequest):
         for rec in rank_results:
             algo = rec["algorithm"]
             explanation = explainer.generate_explanation(algo.name, analysis, rec["reasons"])
-            time_est = advisor.estimate_time_budget(n_rows, n_cols, algo.complexity_score)
+            cost = advisor.estimate_training_cost(algo.name, n_rows, n_cols, algo.complexity_score)
             
-            recommendations.append({
+            recommendation = {
                 "algorithm": algo.name,
                 "score": rec["score"],
                 "explanation": explanation,
-                "reasons": rec["reasons"]
-            })
-            time_estimates[algo.name] = time_est
+                "reasons": rec["reasons"],
+                "source": rec.get("source", "heuristic")
+            }
+            if rec.get("source") == "meta":
+                recommendation["predicted_score"] = rec["predicted_score"]
+                recommendation["predicted_fit_time"] = rec["predicted_fit_time"]
+            recommendations.append(recommendation)
+            time_estimates[algo.name] = cost["seconds"]
+            memory_estimates[algo.name] = cost["peak_memory_mb"]
             
         tips = advisor.get_kaggle_tips(analysis)
         
-        return {
+        result = {
             "recommendations": recommendations,
             "tips": tips,
-            "time_estimates": time_estimates
+            "time_estimates": time_estimates,
+            "memory_estimates": memory_estimates
         }
+        if session is not None:
+            sessions.set_artifact(session, "recommendations", result)
+        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/benchmark", response_model=BenchmarkResponse)
-async def run_benchmark(request: BenchmarkRequest):
-    file_path = os.path.join(UPLOAD_DIR, request.filename)
-    if not os.path.exists(file_path):
+async def run_benchmark(request: BenchmarkRequest, http_request: Request, response: Response):
+    dataset = _resolve_session(request.dataset_id, request.filename)
+    if dataset is None:
         raise HTTPException(status_code=404, detail="File session expired or not found.")
-        
+    if not profiling_requested(http_request.headers, http_request.query_params):
+        return _run_benchmark(request, dataset)
+    with maybe_profile(True, "benchmark", PROFILE_DIR) as session:
+        result = _run_benchmark(request, dataset)
+    if session is not None:
+        response.headers["X-Profile-Id"] = session.id
+    return result
+
+def _run_benchmark(request: BenchmarkRequest, dataset: DatasetSession):
     try:
-        df = pd.read_csv(file_path)
+        df = dataset.frame
+        analysis = request.analysis if request.analysis is not None else dataset.analysis
         
         # Re-construct recommendations in the format expected by runner
-        # Runner expects [{"algorithm": AlgorithmObj}, ...]
-        # We need to lookup AlgorithmObj from name
-        from src.algorithms.registry import AlgorithmRegistry
-        
-        runner_recs = []
-        for rec in request.recommmendations:
-            # We assume rec has "algorithm" name string
-            name = rec["algorithm"]
-            # We need to find the algo object. Registry isn't fully indexed by name easily exposed,
-            # but we can search or modify registry.
-            # Let's add a helper to registry or just iterate.
-            # For now, simplest is to re-fetch from registry if we had a get_by_name
-            # But wait, registry.get_all returns a list.
-            
-            # Simple hack: Reuse definitions
-            all_algos = AlgorithmRegistry.get_all()
-            algo_obj = next((a for a in all_algos if a.name == name), None)
-            
-            if algo_obj:
-                runner_recs.append({"algorithm": algo_obj})
+        # Runner expects [{"algorithm": AlgorithmObj}, ...]; names resolve through the registry's dict index
+        runner_recs = [{"algorithm": algo} for algo in AlgorithmRegistry.get_many(rec["algorithm"] for rec in request.recommmendations)]
         
-        runner = AutoMLRunner()
-        results_df = runner.run_benchmark(df, request.target_col, runner_recs)
+        runner = AutoMLRunner(history=benchmark_history, cost_model=cost_model, artifact_store=model_store,
+                              prune_columns=request.prune_columns)
+        results_df = runner.run_benchmark(df, request.target_col, runner_recs,
+                                          analysis=analysis, dataset_name=dataset.filename,
+                                          time_budget=request.time_budget)
         
-        return {"results": results_df.to_dict(orient="records")}
+        results = results_df.to_dict(orient="records")
+        sessions.set_artifact(dataset, "benchmark_results", results)
+        return {"results": results, "screening": to_native(runner.screening)}
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _resolve_target(session: Optional[DatasetSession], target_col: Optional[str]):
+    if session is None:
+        raise HTTPException(status_code=404, detail="File session expired or not found.")
+    if target_col not in session.frame.columns:
+        raise HTTPException(status_code=400, detail=f"Target column '{target_col}' not found in dataset.")
+
+# Plain def: FastAPI runs CPU-bound handlers in its threadpool instead of blocking the event loop
+@app.post("/tune", response_model=TuneResponse)
+def tune_hyperparameters(request: TuneRequest):
+    session = _resolve_session(request.dataset_id, request.filename)
+    _resolve_target(session, request.target_col)
+    try:
+        tuner = HyperparameterTuner(n_trials=request.n_trials, time_budget=request.time_budget, n_folds=request.n_folds)
+        results = tuner.tune_frame(session.frame, request.target_col, request.algorithms)
+        sessions.set_artifact(session, "tuning", results)
+        return {"results": results}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/models/{artifact_id}")
+async def get_model_metadata(artifact_id: str):
+    meta = model_store.metadata(artifact_id)
+    if meta is None:
+        raise HTTPException(status_code=404, detail="Model artifact not found.")
+    return meta
+
+@app.post("/learning-curve", response_model=LearningCurveResponse)
+async def learning_curve(request: LearningCurveRequest):
+    session = _resolve_session(request.dataset_id, request.filename)
+    _resolve_target(session, request.target_col)
+    names = request.algorithms
+    if not names:
+        recommended = session.artifacts.get("recommendations")
+        if recommended is None:
+            raise HTTPException(status_code=400, detail="Provide algorithms or call /recommend for this dataset first.")
+        names = [rec["algorithm"] for rec in recommended["recommendations"]]
+    try:
+        runner = AutoMLRunner()
+        curves = runner.run_learning_curves(session.frame, request.target_col,
+                                            [{"algorithm": algo} for algo in AlgorithmRegistry.get_many(names)],
+                                            top_k=request.top_k, min_size=request.min_size)
+        sessions.set_artifact(session, "learning_curves", curves)
+        return {"curves": curves}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/predict")
+async def predict(artifact_id: str, file: UploadFile = File(...), chunksize: int = DEFAULT_CHUNKSIZE,
+                  proba: bool = False, keep: Optional[str] = None):
+    # Streams predictions back as CSV while the upload is read in chunks, e.g.
+    # curl -F file=@big.csv "localhost:8000/predict?artifact_id=...&keep=id" > predictions.csv
+    loaded = model_store.load(artifact_id)
+    if loaded is None:
+        raise HTTPException(status_code=404, detail="Model artifact not found.")
+    if chunksize < 1:
+        raise HTTPException(status_code=400, detail="chunksize must be positive.")
+    model, preprocessor = loaded
+    run = ScoringRun(model, preprocessor, model_store.metadata(artifact_id)["algorithm"], proba,
+                     [c for c in keep.split(",") if c] if keep else None)
+    lines = run.csv_lines(pd.read_csv(file.file, chunksize=chunksize))
+    try:
+        # Score the first chunk before responding so bad input is still a 400, not a broken stream
+        first = next(lines, "")
+    except (ValueError, KeyError, pd.errors.ParserError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    def body():
+        yield first
+        yield from lines
+
+    return StreamingResponse(body(), media_type="text/csv",
+                             headers={"X-Artifact-Id": artifact_id,
+                                      "Content-Disposition": f'attachment; filename="predictions_{artifact_id}.csv"'})
+
+@app.get("/algorithms")
+async def list_algorithms(type: Optional[str] = None, capability: Optional[str] = None, complexity: Optional[str] = None):
+    # e.g. /algorithms?type=classification&capability=handle_missing,handle_sparse&complexity=low
+    capabilities = [c for c in (capability or "").split(",") if c]
+    try:
+        algorithms = AlgorithmRegistry.query(problem_type=type, capabilities=capabilities, complexity_band=complexity)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"algorithms": [dict(a.to_dict(), complexity_band=AlgorithmRegistry.complexity_band(a.complexity_score))
+                           for a in algorithms]}
+
+@app.post("/similar", response_model=SimilarDatasetsResponse)
+async def find_similar_datasets(request: SimilarDatasetsRequest):
+    analysis = _resolve_analysis(request.analysis, _resolve_session(request.dataset_id, None))
+    try:
+        vectorizer = FingerprintVectorizer()
+        # Target-less analyses (plain /analyze) are compared on the dataset-level features only
+        return {"neighbors": fingerprint_index.search(vectorizer.transform(analysis), k=request.top_k,
+                                                      ignore=vectorizer.ignored_features(analysis))}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/competition/plan", response_model=CompetitionPlanResponse)
-async def get_competition_plan(request: CompetitionPlanRequest):
+def get_competition_plan(request: CompetitionPlanRequest):
+    session = _resolve_session(request.dataset_id, None)
+    analysis = _resolve_analysis(request.analysis, session)
+    if request.tune_budget is not None:
+        _resolve_target(session, request.target_col)
     try:
-        advisor = CompetitionAdvisor()
-        plan = advisor.generate_competition_plan(request.analysis)
+        advisor = CompetitionAdvisor(cost_model=cost_model)
+        plan = advisor.generate_competition_plan(analysis)
+        if request.tune_budget is not None:
+            plan["tuned"] = advisor.tune_advanced_plan(plan, session.frame, request.target_col, request.tune_budget)
+        if session is not None:
+            sessions.set_artifact(session, "competition_plan", plan)
         return plan
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/profiles/{profile_id}")
+async def get_profile_summary(profile_id: str):
+    summary = load_summary(profile_id, PROFILE_DIR)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Profile not found.")
+    return summary
+
+@app.get("/profiles/{profile_id}/download")
+async def download_profile(profile_id: str):
+    path = os.path.join(PROFILE_DIR, profile_id, "profile.prof")
+    if not valid_profile_id(profile_id) or not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="Profile not found.")
+    return FileResponse(path, media_type="application/octet-stream", filename=f"{profile_id}.prof")
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,136 @@
+import sys
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple
+from fastapi.responses import Response
+from src.api.responses import FastJSONResponse
+from src.serialization import dumps
+from src.tracing import stage
+
+# Optional codecs: without them clients simply get JSON / gzip
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+    print("msgpack not installed; binary analysis responses disabled", file=sys.stderr)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+NUMERIC_BLOCKS = ("correlations", "skewness")
+# Below this the compression header overhead isn't worth it (matches the GZip middleware threshold)
+MIN_COMPRESS_SIZE = 1024
+
+
+def parse_quality_list(header: Optional[str]) -> List[Tuple[str, float]]:
+    """
+    Parses an Accept / Accept-Encoding header into (token, q) pairs, highest q first.
+    Tokens with q=0 are dropped.
+    """
+    items = []
+    for position, part in enumerate((header or "").split(",")):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            items.append((position, token, q))
+    items.sort(key=lambda item: (-item[2], item[0]))  # Stable on header order for equal q
+    return [(token, q) for _, token, q in items]
+
+
+def wants_msgpack(accept: Optional[str]) -> bool:
+    """True when the client ranks a MessagePack media type above JSON and the codec is available."""
+    if msgpack is None:
+        return False
+    for token, _ in parse_quality_list(accept):
+        if token in MSGPACK_MEDIA_TYPES:
+            return True
+        if token in ("application/json", "application/*", "*/*"):
+            return False
+    return False
+
+
+def wants_brotli(accept_encoding: Optional[str]) -> bool:
+    """True when brotli is installed and ranked at least as high as gzip."""
+    if brotli is None:
+        return False
+    ranked = dict(parse_quality_list(accept_encoding))
+    return "br" in ranked and ranked["br"] >= ranked.get("gzip", 0.0)
+
+
+def pack_numeric_blocks(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replaces the dense numeric maps with packed little-endian float64 buffers.
+
+    correlations: {"columns": [...], "shape": [n, n], "dtype": "<f8", "data": bytes}  (row-major)
+    skewness:     {"columns": [...], "shape": [n],    "dtype": "<f8", "data": bytes}
+    Missing values are NaN in the buffer. Everything else keeps the JSON shape.
+    """
+    packed = dict(analysis)
+    correlations = analysis.get("correlations") or {}
+    if correlations:
+        columns = list(correlations.keys())
+        matrix = np.array([[correlations[a].get(b) for b in columns] for a in columns], dtype="<f8")
+        packed["correlations"] = _block(columns, matrix)
+    skewness = analysis.get("skewness") or {}
+    if skewness:
+        columns = list(skewness.keys())
+        packed["skewness"] = _block(columns, np.array([skewness[c] for c in columns], dtype="<f8"))
+    return packed
+
+
+def _block(columns: List[Any], values: np.ndarray) -> Dict[str, Any]:
+    return {"columns": columns, "shape": list(values.shape), "dtype": "<f8", "data": values.tobytes()}
+
+
+def unpack_numeric_blocks(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Client-side inverse of pack_numeric_blocks (NaN -> None)."""
+    unpacked = dict(analysis)
+    for key in NUMERIC_BLOCKS:
+        block = analysis.get(key)
+        if not isinstance(block, dict) or "data" not in block:
+            continue
+        values = np.frombuffer(block["data"], dtype=block["dtype"]).reshape(block["shape"]).astype(object)
+        values[np.isnan(values.astype(float))] = None
+        columns = block["columns"]
+        if key == "correlations":
+            unpacked[key] = {a: dict(zip(columns, row)) for a, row in zip(columns, values.tolist())}
+        else:
+            unpacked[key] = dict(zip(columns, values.tolist()))
+    return unpacked
+
+
+def negotiated_analysis_response(content: Dict[str, Any], accept: Optional[str], accept_encoding: Optional[str]) -> Response:
+    """
+    Builds the /analyze response from the request's Accept and Accept-Encoding headers.
+
+    JSON stays the default. MessagePack (with packed numeric blocks) is used when requested.
+    Brotli is applied here when preferred; gzip is left to the app-wide GZip middleware.
+    """
+    if wants_msgpack(accept):
+        with stage("response.serialize"):
+            payload = dict(content, analysis=pack_numeric_blocks(content.get("analysis") or {}))
+            body = msgpack.packb(payload, use_bin_type=True)
+        media_type = MSGPACK_MEDIA_TYPES[0]
+    else:
+        with stage("response.serialize"):
+            body = dumps(content)
+        media_type = FastJSONResponse.media_type
+
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if len(body) >= MIN_COMPRESS_SIZE and wants_brotli(accept_encoding):
+        with stage("response.compress"):
+            body = brotli.compress(body, quality=5)  # Quality 5 is close to gzip speed with a better ratio
+        headers["Content-Encoding"] = "br"
+    return Response(content=body, media_type=media_type, headers=headers)
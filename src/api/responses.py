@@ -0,0 +1,19 @@
+from typing import Any
+from fastapi.responses import Response
+from src.serialization import dumps
+from src.tracing import stage
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response rendered by src.serialization.dumps (orjson when installed).
+
+    Returning an instance directly from an endpoint bypasses FastAPI's
+    jsonable_encoder / response_model validation, so large analysis payloads
+    are serialized exactly once.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        with stage("response.serialize"):
+            return dumps(content)
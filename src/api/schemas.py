@@ -1,34 +1,77 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 
 class AnalysisResponse(BaseModel):
     analysis: Dict[str, Any]
     filename: str
     plots: List[str]
+    dataset_id: Optional[str] = None # Reference for follow-up calls instead of re-sending analysis/filename
 
 class RecommendationRequest(BaseModel):
-    analysis: Dict[str, Any]
-    filename: str
+    analysis: Optional[Dict[str, Any]] = None # Taken from the dataset session if omitted
+    filename: Optional[str] = None
+    dataset_id: Optional[str] = None
 
 class RecommendationResponse(BaseModel):
     recommendations: List[Dict[str, Any]]
     tips: List[str]
-    time_estimates: Dict[str, str]
+    time_estimates: Dict[str, float] # Predicted training seconds per algorithm
+    memory_estimates: Dict[str, float] = {} # Predicted peak training memory (MB)
 
 class BenchmarkRequest(BaseModel):
-    filename: str
+    filename: Optional[str] = None # Legacy; prefer dataset_id
+    dataset_id: Optional[str] = None
     target_col: str
     recommmendations: List[Dict[str, Any]]
+    analysis: Optional[Dict[str, Any]] = None # Fingerprint source for benchmark history (session analysis, or recomputed if omitted)
+    time_budget: Optional[float] = None # Seconds; cheapest jobs first, predicted overruns skipped
+    prune_columns: bool = False # Drop constant/duplicate/ID-like columns and duplicate rows first
 
 class BenchmarkResponse(BaseModel):
-    results: List[Dict[str, Any]]
+    results: List[Dict[str, Any]] # Successful rows carry an "Artifact Id" usable with /models/{id}
+    screening: Optional[Dict[str, Any]] = None # What prune_columns removed and the estimated time saved
+
+class SimilarDatasetsRequest(BaseModel):
+    analysis: Optional[Dict[str, Any]] = None
+    dataset_id: Optional[str] = None
+    top_k: int = 5
+
+class SimilarDatasetsResponse(BaseModel):
+    neighbors: List[Dict[str, Any]]
 
 class CompetitionPlanRequest(BaseModel):
-    analysis: Dict[str, Any]
-    filename: str
+    analysis: Optional[Dict[str, Any]] = None
+    filename: Optional[str] = None
+    dataset_id: Optional[str] = None
+    target_col: Optional[str] = None # With tune_budget: tune the advanced plan's models on the session dataset
+    tune_budget: Optional[float] = None # Seconds
 
 class CompetitionPlanResponse(BaseModel):
     baseline: Dict[str, str]
     advanced: Dict[str, str]
     featureEngineering: List[str]
     hyperparameters: List[Dict[str, str]]
+    tuned: Optional[List[Dict[str, Any]]] = None # Best configurations found within tune_budget
+
+class TuneRequest(BaseModel):
+    dataset_id: Optional[str] = None
+    filename: Optional[str] = None
+    target_col: str
+    algorithms: List[str]
+    n_trials: int = Field(20, ge=1) # Per algorithm
+    time_budget: Optional[float] = 60.0 # Seconds, shared across algorithms
+    n_folds: int = Field(3, ge=2)
+
+class TuneResponse(BaseModel):
+    results: List[Dict[str, Any]]
+
+class LearningCurveRequest(BaseModel):
+    dataset_id: Optional[str] = None
+    filename: Optional[str] = None
+    target_col: str
+    algorithms: Optional[List[str]] = None # Defaults to the session's recommendations
+    top_k: int = 3
+    min_size: int = 50 # Smallest subsample (rows); sizes double up to the full training split
+
+class LearningCurveResponse(BaseModel):
+    curves: List[Dict[str, Any]]
@@ -0,0 +1,163 @@
+import os
+import shutil
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+
+class DatasetSession:
+    """
+    One uploaded dataset: the parsed frame, its analysis and anything derived from it
+    (recommendations, benchmark results, ...), addressed by a generated id.
+    """
+
+    def __init__(self, frame: pd.DataFrame, filename: str, path: Optional[str] = None,
+                 analysis: Optional[Dict[str, Any]] = None):
+        self.id = uuid.uuid4().hex
+        self.frame = frame
+        self.filename = filename
+        self.path = path
+        # Files/directories removed with the session (upload copy, plots, ...)
+        self.owned_paths: List[str] = [path] if path else []
+        self.analysis = analysis
+        self.artifacts: Dict[str, Any] = {}
+        self.created_at = time.time()
+        self.frame_bytes = int(frame.memory_usage(deep=True).sum())
+        self._artifact_bytes: Dict[str, int] = {}
+        self.analysis_bytes = self._payload_bytes(analysis)
+
+    @staticmethod
+    def _payload_bytes(payload: Any) -> int:
+        """
+        Rough in-memory size of a JSON-like payload: shallow sizes of its containers and
+        scalars, memory_usage/nbytes for frames and arrays. No serialization involved.
+        """
+        if payload is None:
+            return 0
+        if isinstance(payload, (pd.DataFrame, pd.Series)):
+            return int(np.sum(payload.memory_usage(deep=True)))
+        if isinstance(payload, np.ndarray):
+            return int(payload.nbytes)
+        size = sys.getsizeof(payload)
+        if isinstance(payload, dict):
+            size += sum(DatasetSession._payload_bytes(k) + DatasetSession._payload_bytes(v) for k, v in payload.items())
+        elif isinstance(payload, (list, tuple)):
+            size += sum(DatasetSession._payload_bytes(v) for v in payload)
+        return size
+
+    @property
+    def nbytes(self) -> int:
+        return self.frame_bytes + self.analysis_bytes + sum(self._artifact_bytes.values())
+
+
+class SessionStore:
+    """
+    In-process LRU of DatasetSessions bounded by total memory.
+
+    Every get() marks a session as recently used. When the accounted size exceeds
+    max_bytes, the least recently used sessions are dropped (the newest one is always
+    kept) together with their owned files.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, max_sessions: int = 256):
+        """
+        Args:
+            max_bytes: Memory budget for frames, analyses and artifacts.
+            max_sessions: Upper bound on the number of live sessions.
+        """
+        self.max_bytes = max_bytes
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, DatasetSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def create(self, frame: pd.DataFrame, filename: str, path: Optional[str] = None,
+               analysis: Optional[Dict[str, Any]] = None) -> DatasetSession:
+        session = DatasetSession(frame, filename, path=path, analysis=analysis)
+        with self._lock:
+            self._sessions[session.id] = session
+            evicted = self._evict()
+        self._cleanup(*evicted)
+        return session
+
+    def get(self, dataset_id: str) -> Optional[DatasetSession]:
+        with self._lock:
+            session = self._sessions.get(dataset_id)
+            if session is not None:
+                self._sessions.move_to_end(dataset_id)
+            return session
+
+    def find_by_filename(self, filename: str) -> Optional[DatasetSession]:
+        """Most recently used session for an upload name (for clients that still send filenames)."""
+        with self._lock:
+            for session in reversed(self._sessions.values()):
+                if session.filename == filename:
+                    self._sessions.move_to_end(session.id)
+                    return session
+        return None
+
+    def set_analysis(self, session: DatasetSession, analysis: Dict[str, Any]):
+        with self._lock:
+            session.analysis = analysis
+            session.analysis_bytes = DatasetSession._payload_bytes(analysis)
+            evicted = self._evict()
+        self._cleanup(*evicted)
+
+    def set_artifact(self, session: DatasetSession, key: str, value: Any, nbytes: Optional[int] = None):
+        """Attaches a derived artifact; nbytes defaults to its estimated in-memory size."""
+        size = DatasetSession._payload_bytes(value) if nbytes is None else nbytes
+        with self._lock:
+            session.artifacts[key] = value
+            session._artifact_bytes[key] = size
+            evicted = self._evict()
+        self._cleanup(*evicted)
+
+    def remove(self, dataset_id: str) -> bool:
+        with self._lock:
+            session = self._sessions.pop(dataset_id, None)
+        if session is None:
+            return False
+        self._cleanup(session)
+        return True
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(s.nbytes for s in self._sessions.values())
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, dataset_id: str) -> bool:
+        return dataset_id in self._sessions
+
+    def _evict(self) -> List[DatasetSession]:
+        # Caller holds the lock and passes the evicted sessions to _cleanup once it has released it
+        evicted = []
+        total = sum(s.nbytes for s in self._sessions.values())
+        while len(self._sessions) > 1 and (total > self.max_bytes or len(self._sessions) > self.max_sessions):
+            _, session = self._sessions.popitem(last=False)
+            total -= session.nbytes
+            self.evictions += 1
+            evicted.append(session)
+        return evicted
+
+    @staticmethod
+    def _cleanup(*sessions: DatasetSession):
+        """Deletes the sessions' owned files (slow on big uploads, so never under the store lock)."""
+        for session in sessions:
+            for path in session.owned_paths:
+                try:
+                    if os.path.isdir(path):
+                        shutil.rmtree(path)
+                    elif os.path.exists(path):
+                        os.remove(path)
+                except OSError:
+                    pass
@@ -0,0 +1,212 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+import pandas as pd
+
+# Wrappers that can reload their library's own format; everything else goes through joblib
+NATIVE_FORMATS = {"xgboost": "model.ubj", "catboost": "model.cbm"}
+META_FILE = "meta.json"
+
+
+def dataset_key(df: pd.DataFrame) -> str:
+    """Content hash of a frame (values, index and column names)."""
+    digest = hashlib.sha1(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    digest.update("\x1f".join(map(str, df.columns)).encode())
+    return digest.hexdigest()[:16]
+
+
+def artifact_id(dataset: str, algorithm: str, params: Dict[str, Any]) -> str:
+    """Stable id for (dataset, algorithm, params); refitting the same model overwrites its artifact."""
+    payload = json.dumps({"dataset": dataset, "algorithm": algorithm, "params": params}, sort_keys=True, default=repr)
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def model_params(model: Any) -> Dict[str, Any]:
+    """get_params() reduced to JSON-friendly values (nested estimators by class name)."""
+    try:
+        params = model.get_params(deep=False)
+    except Exception:
+        return {}
+    return {k: v if isinstance(v, (int, float, str, bool, type(None))) else repr(v) for k, v in params.items()}
+
+
+class ModelArtifactStore:
+    """
+    Disk store of fitted models together with their TabularPreprocessor.
+
+    One directory per artifact holding the estimator (xgboost/catboost in their
+    native format, everything else as an uncompressed joblib file so numpy arrays
+    load via mmap), the pickled preprocessor and a meta.json. The least recently
+    used artifacts are deleted once the store exceeds max_bytes, and the most
+    recently loaded models stay in memory for warm reuse.
+    """
+
+    def __init__(self, root: str = "model_store", max_bytes: int = 1024 ** 3, compress: int = 0,
+                 max_loaded: int = 8):
+        """
+        Args:
+            root: Directory holding one subdirectory per artifact.
+            max_bytes: Disk budget; older artifacts are evicted past it.
+            compress: joblib compression level. 0 keeps files mmap-able; > 0 trades
+                      load time for size (compressed files are read fully on load).
+            max_loaded: Loaded (model, preprocessor) pairs kept in memory.
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.max_loaded = max_loaded
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._loaded: "OrderedDict[str, Any]" = OrderedDict()
+        self._scan()
+
+    def _scan(self):
+        if not os.path.isdir(self.root):
+            return
+        metas = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name, META_FILE)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    metas.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        for meta in sorted(metas, key=lambda m: m.get("last_used", 0)):
+            self._index[meta["id"]] = meta
+
+    def _dir(self, artifact: str) -> str:
+        return os.path.join(self.root, artifact)
+
+    def _write_meta(self, meta: Dict[str, Any]):
+        with open(os.path.join(self._dir(meta["id"]), META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f, default=repr)
+
+    def save(self, model: Any, preprocessor: Any, dataset: str, algorithm: str,
+             metrics: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Persists a fitted model and its preprocessing.
+
+        Args:
+            model: Fitted estimator.
+            preprocessor: Fitted TabularPreprocessor used to build the model's inputs.
+            dataset: dataset_key() of the training frame.
+            algorithm: Algorithm name.
+            metrics: Optional scores/timings stored in the metadata.
+
+        Returns:
+            The artifact id.
+        """
+        import joblib
+
+        params = model_params(model)
+        artifact = artifact_id(dataset, algorithm, params)
+        directory = self._dir(artifact)
+        tmp = f"{directory}.tmp{threading.get_ident()}"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+
+        library = type(model).__module__.split(".")[0]
+        if library in NATIVE_FORMATS:
+            model_file = NATIVE_FORMATS[library]
+            model.save_model(os.path.join(tmp, model_file))
+            model_format = library
+        else:
+            model_file = "model.joblib"
+            joblib.dump(model, os.path.join(tmp, model_file), compress=self.compress)
+            model_format = "joblib"
+        joblib.dump(preprocessor, os.path.join(tmp, "preprocessor.joblib"), compress=3)
+
+        nbytes = sum(os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp))
+        now = time.time()
+        meta = {"id": artifact, "dataset": dataset, "algorithm": algorithm, "params": params,
+                "format": model_format, "model_file": model_file, "model_class": f"{type(model).__module__}:{type(model).__name__}",
+                "bytes": nbytes, "created": now, "last_used": now, "metrics": metrics or {}}
+        with open(os.path.join(tmp, META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f, default=repr)
+
+        with self._lock:
+            shutil.rmtree(directory, ignore_errors=True)
+            os.replace(tmp, directory)
+            self._index.pop(artifact, None)
+            self._index[artifact] = meta
+            self._loaded.pop(artifact, None)
+            self._evict(keep=artifact)
+        return artifact
+
+    def _evict(self, keep: str):
+        while self.total_bytes > self.max_bytes and len(self._index) > 1:
+            oldest = next(iter(self._index))
+            if oldest == keep:
+                break
+            self._index.pop(oldest)
+            self._loaded.pop(oldest, None)
+            shutil.rmtree(self._dir(oldest), ignore_errors=True)
+            self.evictions += 1
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(meta["bytes"] for meta in self._index.values())
+
+    def __contains__(self, artifact: str) -> bool:
+        return artifact in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def metadata(self, artifact: str) -> Optional[Dict[str, Any]]:
+        return self._index.get(artifact)
+
+    def list(self, dataset: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Metadata of stored artifacts, most recently used first (optionally one dataset's only)."""
+        with self._lock:
+            metas = list(self._index.values())
+        return [m for m in reversed(metas) if dataset is None or m["dataset"] == dataset]
+
+    def load(self, artifact: str):
+        """
+        Returns (model, preprocessor), or None for unknown ids. Models stay in memory
+        for repeated calls; joblib artifacts are otherwise memory-mapped from disk.
+        """
+        import joblib
+
+        with self._lock:
+            meta = self._index.get(artifact)
+            if meta is None:
+                return None
+            self._index.move_to_end(artifact)
+            meta["last_used"] = time.time()
+            if artifact in self._loaded:
+                self._loaded.move_to_end(artifact)
+                return self._loaded[artifact]
+
+        directory = self._dir(artifact)
+        path = os.path.join(directory, meta["model_file"])
+        if meta["format"] == "joblib":
+            model = joblib.load(path, mmap_mode="r" if not self.compress else None)
+        else:
+            from src.algorithms.plugins import import_from_path
+            model = import_from_path(meta["model_class"])()
+            model.load_model(path)
+        preprocessor = joblib.load(os.path.join(directory, "preprocessor.joblib"))
+
+        with self._lock:
+            if artifact in self._index:
+                self._write_meta(meta) # Persist last_used so LRU order survives restarts
+            self._loaded[artifact] = (model, preprocessor)
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+        return model, preprocessor
+
+    def remove(self, artifact: str) -> bool:
+        with self._lock:
+            if self._index.pop(artifact, None) is None:
+                return False
+            self._loaded.pop(artifact, None)
+            shutil.rmtree(self._dir(artifact), ignore_errors=True)
+            return True
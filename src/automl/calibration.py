@@ -0,0 +1,135 @@
+import argparse
+import time
+import tracemalloc
+import warnings
+import numpy as np
+import pandas as pd
+from typing import List, Dict, Any, Optional, Tuple
+from src.algorithms.registry import AlgorithmRegistry
+from src.automl.cost_model import CostModel
+from src.automl.mappings import SKLEARN_MAPPING
+import src.algorithms.definitions # Register algorithms
+
+# Small shapes (rows, cols) spanning enough range to fit a scaling curve in a few seconds
+DEFAULT_SHAPES: List[Tuple[int, int]] = [(250, 5), (500, 10), (1000, 20), (2000, 10)]
+
+
+def make_synthetic_frame(n_rows: int, n_cols: int, categorical_share: float = 0.0, missing_rate: float = 0.0,
+                         problem_type: str = "classification", n_classes: int = 2, seed: int = 0) -> pd.DataFrame:
+    """
+    Builds a reproducible synthetic dataset with a "target" column.
+
+    Args:
+        n_rows: Number of rows.
+        n_cols: Number of feature columns.
+        categorical_share: Fraction of feature columns that are string categoricals.
+        missing_rate: Fraction of feature cells set to NaN.
+        problem_type: "classification" or "regression".
+        n_classes: Number of target classes for classification.
+        seed: Random seed.
+    """
+    rng = np.random.default_rng(seed)
+    n_cat = int(round(n_cols * categorical_share))
+    n_num = n_cols - n_cat
+
+    numeric = rng.normal(size=(n_rows, n_num))
+    data = {f"num_{i}": numeric[:, i] for i in range(n_num)}
+    categories = np.array(["a", "b", "c", "d", "e"])
+    for i in range(n_cat):
+        data[f"cat_{i}"] = categories[rng.integers(0, len(categories), n_rows)]
+    df = pd.DataFrame(data)
+
+    # Target depends on a few numeric columns so models have something to learn
+    signal = numeric[:, :min(3, n_num)].sum(axis=1) if n_num else rng.normal(size=n_rows)
+    signal = signal + rng.normal(scale=0.5, size=n_rows)
+    if problem_type == "classification":
+        edges = np.quantile(signal, np.linspace(0, 1, n_classes + 1)[1:-1])
+        df["target"] = np.digitize(signal, edges)
+    else:
+        df["target"] = signal
+
+    if missing_rate > 0:
+        mask = rng.random((n_rows, n_cols)) < missing_rate
+        features = df.columns[:-1]
+        df[features] = df[features].mask(mask)
+    return df
+
+
+def _problem_type(name: str) -> str:
+    algo = AlgorithmRegistry.get_by_name(name)
+    return algo.type if algo is not None else "classification"
+
+
+def measure_fit(model_factory, X: np.ndarray, y: np.ndarray, track_memory: bool = True) -> Dict[str, Optional[float]]:
+    """
+    Fits one fresh model and measures it.
+
+    Returns:
+        {"fit_time": seconds, "predict_time": seconds, "peak_memory_mb": MB or None}
+    """
+    model = model_factory()
+    if track_memory:
+        tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        model.fit(X, y)
+        fit_time = time.perf_counter() - start
+        peak_memory_mb = tracemalloc.get_traced_memory()[1] / 1024 ** 2 if track_memory else None
+    finally:
+        if track_memory:
+            tracemalloc.stop()
+    start = time.perf_counter()
+    model.predict(X)
+    predict_time = time.perf_counter() - start
+    return {"fit_time": fit_time, "predict_time": predict_time, "peak_memory_mb": peak_memory_mb}
+
+
+def run_calibration(cost_model: CostModel, algorithms: Optional[List[str]] = None,
+                    shapes: List[Tuple[int, int]] = DEFAULT_SHAPES, track_memory: bool = True) -> List[Dict[str, Any]]:
+    """
+    Micro-benchmarks each algorithm on synthetic data and feeds the cost model.
+
+    Args:
+        cost_model: Model receiving the measurements (source="calibration").
+        algorithms: SKLEARN_MAPPING keys to calibrate (default: all).
+        shapes: (rows, cols) shapes to measure.
+        track_memory: Measure peak allocations with tracemalloc (slows fits down somewhat).
+
+    Returns:
+        List of measurement dicts, including failures as {"algorithm", "error"}.
+    """
+    results = []
+    for name in algorithms or list(SKLEARN_MAPPING.keys()):
+        problem_type = _problem_type(name)
+        algo = AlgorithmRegistry.get_by_name(name)
+        for n_rows, n_cols in shapes:
+            df = make_synthetic_frame(n_rows, n_cols, problem_type=problem_type)
+            X = df.drop(columns=["target"]).to_numpy(dtype=np.float64)
+            y = df["target"].to_numpy()
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")  # Convergence warnings are expected on tiny fits
+                    m = measure_fit(SKLEARN_MAPPING[name], X, y, track_memory=track_memory)
+            except Exception as e:
+                results.append({"algorithm": name, "n_rows": n_rows, "n_cols": n_cols, "error": str(e)})
+                continue
+            cost_model.add_measurement(name, n_rows, n_cols, m["fit_time"], peak_memory_mb=m["peak_memory_mb"],
+                                       complexity_score=algo.complexity_score if algo else None,
+                                       source="calibration")
+            results.append({"algorithm": name, "n_rows": n_rows, "n_cols": n_cols, **m})
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calibrate the training cost model on this machine.")
+    parser.add_argument("--algorithms", nargs="*", help="Algorithm names (default: all of SKLEARN_MAPPING)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc peak-memory tracking")
+    args = parser.parse_args()
+
+    model = CostModel()
+    for row in run_calibration(model, algorithms=args.algorithms, track_memory=not args.no_memory):
+        if "error" in row:
+            print(f"{row['algorithm']:<35} {row['n_rows']:>6}x{row['n_cols']:<4} failed: {row['error']}")
+        else:
+            print(f"{row['algorithm']:<35} {row['n_rows']:>6}x{row['n_cols']:<4} fit {row['fit_time']:.4f}s")
+    print(f"Saved measurements to {model.path}")
@@ -0,0 +1,170 @@
+import json
+import os
+import time
+import numpy as np
+from typing import List, Dict, Any, Optional
+
+
+class CostModel:
+    """
+    Predicts training time (seconds) and peak memory (MB) of an algorithm for a
+    given dataset shape.
+
+    Per algorithm it fits log(cost) = a + b*log(rows) + c*log(cols) on measured
+    runs (collected by AutoMLRunner and by the calibration micro-benchmark in
+    src/automl/calibration.py). Algorithms with too few measurements fall back to
+    a complexity-based prior, rescaled by how fast this machine turned out to be
+    on the algorithms that were measured.
+    """
+
+    # Prior: seconds ~ complexity_score * (PRIOR_OVERHEAD_SECONDS + PRIOR_SECONDS_PER_UNIT * rows * cols)
+    PRIOR_OVERHEAD_SECONDS = 0.02
+    PRIOR_SECONDS_PER_UNIT = 2e-8
+    # Prior: peak MB ~ dense float64 copy of the data times a complexity-dependent factor
+    PRIOR_MEMORY_FACTOR = 0.5
+
+    def __init__(self, path: Optional[str] = os.path.join("meta_store", "cost_measurements.jsonl"),
+                 min_measurements: int = 3):
+        """
+        Args:
+            path: JSONL file measurements are persisted to (None keeps them in memory only).
+            min_measurements: Runs needed before an algorithm gets its own fitted curve.
+        """
+        self.path = path
+        self.min_measurements = min_measurements
+        self._measurements: Optional[List[Dict[str, Any]]] = None
+        self._coefs: Dict[str, Dict[str, np.ndarray]] = {}
+        self._machine_factor = 1.0
+        self._fitted_on = -1
+
+    def measurements(self) -> List[Dict[str, Any]]:
+        """All known measurements (loaded from disk once)."""
+        if self._measurements is None:
+            self._measurements = []
+            if self.path and os.path.exists(self.path):
+                with open(self.path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            self._measurements.append(json.loads(line))
+                        except json.JSONDecodeError:
+                            continue
+        return self._measurements
+
+    def add_measurement(self, algorithm: str, n_rows: int, n_cols: int, fit_time: float,
+                        peak_memory_mb: Optional[float] = None, complexity_score: Optional[int] = None,
+                        source: str = "benchmark"):
+        """
+        Records one observed training run.
+
+        Args:
+            algorithm: Algorithm name (SKLEARN_MAPPING key).
+            n_rows, n_cols: Shape of the training matrix.
+            fit_time: Seconds spent in fit().
+            peak_memory_mb: Peak traced allocation during fit, if measured.
+            complexity_score: Algorithm.complexity_score, used to calibrate the prior.
+            source: "benchmark" or "calibration".
+        """
+        measurement = {
+            "algorithm": algorithm,
+            "n_rows": int(n_rows),
+            "n_cols": int(n_cols),
+            "fit_time": float(fit_time),
+            "peak_memory_mb": None if peak_memory_mb is None else float(peak_memory_mb),
+            "complexity_score": complexity_score,
+            "source": source,
+            "timestamp": time.time(),
+        }
+        measurements = self.measurements()
+        if self.path:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(measurement) + "\n")
+        measurements.append(measurement)
+
+    @staticmethod
+    def _design(n_rows, n_cols) -> np.ndarray:
+        n_rows = np.atleast_1d(np.asarray(n_rows, dtype=np.float64))
+        n_cols = np.atleast_1d(np.asarray(n_cols, dtype=np.float64))
+        return np.column_stack([np.ones_like(n_rows), np.log(np.maximum(n_rows, 1)), np.log(np.maximum(n_cols, 1))])
+
+    def _fit_curve(self, X: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Least squares in log space; with a single shape only the intercept is identifiable."""
+        if np.unique(X[:, 1:], axis=0).shape[0] >= 3:
+            coef, *_ = np.linalg.lstsq(X, y, rcond=None)
+            # Costs never shrink with more data; clamp exponents that noise pushed negative
+            coef[1:] = np.maximum(coef[1:], 0.0)
+            return coef
+        # Assume linear scaling in rows and cols and fit just the constant
+        return np.array([float(np.mean(y - X[:, 1] - X[:, 2])), 1.0, 1.0])
+
+    def fit(self) -> "CostModel":
+        """Refits all per-algorithm curves from the stored measurements."""
+        measurements = self.measurements()
+        self._fitted_on = len(measurements)
+        self._coefs = {}
+
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for m in measurements:
+            grouped.setdefault(m["algorithm"], []).append(m)
+
+        ratios = []
+        for algorithm, rows in grouped.items():
+            if len(rows) < self.min_measurements:
+                continue
+            X = self._design([r["n_rows"] for r in rows], [r["n_cols"] for r in rows])
+            coefs = {"time": self._fit_curve(X, np.log(np.maximum([r["fit_time"] for r in rows], 1e-4)))}
+
+            with_memory = [(x, r["peak_memory_mb"]) for x, r in zip(X, rows) if r.get("peak_memory_mb")]
+            if len(with_memory) >= self.min_measurements:
+                Xm = np.vstack([x for x, _ in with_memory])
+                coefs["memory"] = self._fit_curve(Xm, np.log(np.maximum([m for _, m in with_memory], 1e-3)))
+            self._coefs[algorithm] = coefs
+
+            # How this machine compares to the prior, for algorithms we have never measured
+            for r in rows:
+                if r.get("complexity_score"):
+                    prior = self._prior_seconds(r["n_rows"], r["n_cols"], r["complexity_score"], factor=1.0)
+                    ratios.append(r["fit_time"] / prior)
+
+        self._machine_factor = float(np.median(ratios)) if ratios else 1.0
+        return self
+
+    def _prior_seconds(self, n_rows: int, n_cols: int, complexity_score: int, factor: Optional[float] = None) -> float:
+        factor = self._machine_factor if factor is None else factor
+        per_point = self.PRIOR_OVERHEAD_SECONDS + self.PRIOR_SECONDS_PER_UNIT * max(n_rows, 1) * max(n_cols, 1)
+        return factor * per_point * max(complexity_score, 1)
+
+    def predict(self, algorithm: str, n_rows: int, n_cols: int, complexity_score: int = 5) -> Dict[str, Any]:
+        """
+        Predicts the cost of training one algorithm.
+
+        Args:
+            algorithm: Algorithm name.
+            n_rows, n_cols: Shape of the training data.
+            complexity_score: Used by the prior when the algorithm has no measurements.
+
+        Returns:
+            {"seconds": float, "peak_memory_mb": float, "source": "fitted" | "prior"}
+        """
+        if len(self.measurements()) != self._fitted_on:
+            self.fit()
+
+        data_mb = max(n_rows, 1) * max(n_cols, 1) * 8 / 1024 ** 2
+        coefs = self._coefs.get(algorithm)
+        x = self._design(n_rows, n_cols)[0]
+
+        if coefs is None:
+            return {
+                "seconds": self._prior_seconds(n_rows, n_cols, complexity_score),
+                "peak_memory_mb": data_mb * (1 + self.PRIOR_MEMORY_FACTOR * complexity_score),
+                "source": "prior",
+            }
+
+        seconds = float(np.exp(x @ coefs["time"]))
+        if "memory" in coefs:
+            peak_memory_mb = float(np.exp(x @ coefs["memory"]))
+        else:
+            peak_memory_mb = data_mb * (1 + self.PRIOR_MEMORY_FACTOR * complexity_score)
+        return {"seconds": seconds, "peak_memory_mb": peak_memory_mb, "source": "fitted"}
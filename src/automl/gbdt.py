@@ -0,0 +1,118 @@
+from typing import Dict, Any, List, Optional
+import numpy as np
+
+# Libraries with their own missing-value and categorical handling
+NATIVE_LIBRARIES = ("xgboost", "lightgbm", "catboost")
+
+# sklearn estimators with built-in iteration-level early stopping (used as xgboost/lightgbm fallbacks)
+SKLEARN_GBDT = ("GradientBoostingClassifier", "GradientBoostingRegressor",
+                "HistGradientBoostingClassifier", "HistGradientBoostingRegressor")
+
+
+def gbdt_library(model: Any) -> Optional[str]:
+    """ "xgboost", "lightgbm", "catboost", "sklearn" for boosted-tree models, else None."""
+    module = type(model).__module__.split(".")[0]
+    if module in ("xgboost", "lightgbm", "catboost"):
+        return module
+    if type(model).__name__ in SKLEARN_GBDT:
+        return "sklearn"
+    return None
+
+
+def is_gbdt(model: Any) -> bool:
+    return gbdt_library(model) is not None
+
+
+def prepare_native(model: Any, categorical: List[int], n_features: int) -> Dict[str, Any]:
+    """
+    Switches on native categorical support for inputs of n_features columns where the
+    `categorical` ones hold integer codes (NaN = missing) and returns extra fit() keyword arguments.
+    CatBoost only takes int/str categorical values, so its codes stay numeric there.
+    """
+    library = gbdt_library(model)
+    if not categorical:
+        return {}
+    if library == "xgboost":
+        feature_types = ["c" if i in set(categorical) else "q" for i in range(n_features)]
+        model.set_params(enable_categorical=True, tree_method="hist", feature_types=feature_types)
+        return {}
+    if library == "lightgbm":
+        return {"categorical_feature": list(categorical)}
+    return {}
+
+
+def fit_with_early_stopping(model: Any, X_train: np.ndarray, y_train: np.ndarray,
+                            X_val: np.ndarray, y_val: np.ndarray, rounds: int = 20,
+                            fit_kwargs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Fits a boosted-tree model, stopping once the validation score has not improved
+    for `rounds` iterations. Non-GBDT models are fitted normally.
+
+    Args:
+        model: Unfitted estimator.
+        X_train, y_train: Training data.
+        X_val, y_val: Held-out data monitored for early stopping (xgboost/lightgbm/catboost;
+                      sklearn's boosters carve their own validation_fraction out of X_train).
+        rounds: Patience in boosting iterations.
+        fit_kwargs: Extra fit() arguments (see prepare_native).
+
+    Returns:
+        {"early_stopped": bool, "best_iteration": int or None, "max_iterations": int or None,
+         "trained_iterations": int or None (best + the patience rounds that ran past it)}
+    """
+    library = gbdt_library(model)
+    max_iterations = _max_iterations(model)
+    fit_kwargs = fit_kwargs or {}
+    trained = None
+
+    if library == "xgboost":
+        model.set_params(early_stopping_rounds=rounds)
+        model.fit(X_train, y_train, eval_set=[(X_val, y_val)], verbose=False, **fit_kwargs)
+        best = getattr(model, "best_iteration", None)
+        best = None if best is None else best + 1
+        trained = model.get_booster().num_boosted_rounds()
+    elif library == "lightgbm":
+        import lightgbm
+        model.fit(X_train, y_train, eval_set=[(X_val, y_val)], callbacks=[lightgbm.early_stopping(rounds, verbose=False)],
+                  **fit_kwargs)
+        best = getattr(model, "best_iteration_", None) or None
+        trained = model.booster_.current_iteration()
+    elif library == "catboost":
+        model.fit(X_train, y_train, eval_set=(X_val, y_val), early_stopping_rounds=rounds, verbose=False, **fit_kwargs)
+        best = model.get_best_iteration()
+        best = None if best is None else best + 1
+    elif library == "sklearn":
+        if type(model).__name__.startswith("Hist"):
+            model.set_params(early_stopping=True, n_iter_no_change=rounds, validation_fraction=0.1)
+        else:
+            model.set_params(n_iter_no_change=rounds, validation_fraction=0.1)
+        model.fit(X_train, y_train, **fit_kwargs)
+        # sklearn keeps every stage it fitted, patience included
+        trained = int(getattr(model, "n_iter_", getattr(model, "n_estimators_", 0))) or None
+        best = trained
+        if trained is not None and max_iterations and trained < max_iterations:
+            best = max(1, trained - rounds) # Stopped `rounds` stages after the best one
+    else:
+        model.fit(X_train, y_train, **fit_kwargs)
+        return {"early_stopped": False, "best_iteration": None, "max_iterations": None, "trained_iterations": None}
+
+    if trained is None and best is not None:
+        trained = min(best + rounds, max_iterations or best + rounds)
+    return {"early_stopped": trained is not None and max_iterations is not None and trained < max_iterations,
+            "best_iteration": best, "max_iterations": max_iterations, "trained_iterations": trained}
+
+
+def time_saved(fit_seconds: float, info: Dict[str, Any]) -> float:
+    """Estimated seconds early stopping saved versus training all max_iterations rounds."""
+    trained, total = info.get("trained_iterations"), info.get("max_iterations")
+    if not info.get("early_stopped") or not trained or not total:
+        return 0.0
+    return fit_seconds * (total - trained) / trained
+
+
+def _max_iterations(model: Any) -> Optional[int]:
+    params = model.get_params()
+    for name in ("n_estimators", "max_iter", "iterations", "num_boost_round"):
+        if params.get(name) is not None:
+            return int(params[name])
+    return None
@@ -0,0 +1,101 @@
+import math
+import time
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional
+
+# A model counts as saturated once the fitted curve is within this much of its asymptote
+SATURATION_TOLERANCE = 0.005
+# Saturation points beyond this are reported as None ("not within reach")
+MAX_SATURATION_SIZE = 1e12
+
+
+def subsample_sizes(n_train: int, min_size: int = 50, factor: float = 2.0) -> List[int]:
+    """Geometrically increasing training sizes, ending with the full training set."""
+    sizes = []
+    size = float(min(min_size, n_train))
+    while size < n_train:
+        sizes.append(int(size))
+        size *= factor
+    sizes.append(n_train)
+    return sorted(set(sizes))
+
+
+def _power_law(n, a, b, c):
+    return a - b * np.power(n, -c)
+
+
+def fit_power_law(sizes: List[int], scores: List[float]) -> Optional[Dict[str, float]]:
+    """
+    Fits score(n) = a - b * n^-c (a = asymptotic score <= 1, as for accuracy and R2;
+    b >= 0; 0.05 <= c <= 2).
+
+    Returns:
+        {"a", "b", "c"} or None with fewer than 3 points or when the fit fails.
+    """
+    if len(sizes) < 3:
+        return None
+    from scipy.optimize import curve_fit
+
+    n = np.asarray(sizes, dtype=float)
+    s = np.asarray(scores, dtype=float)
+    p0 = (min(s.max(), 1.0), max(s.max() - s.min(), 1e-3) * n.min() ** 0.5, 0.5)
+    try:
+        (a, b, c), _ = curve_fit(_power_law, n, s, p0=p0, bounds=([-np.inf, 0.0, 0.05], [1.0, np.inf, 2.0]),
+                                 maxfev=5000)
+    except (RuntimeError, ValueError):
+        return None
+    return {"a": float(a), "b": float(b), "c": float(c)}
+
+
+def saturation_size(curve: Dict[str, float], tolerance: float = SATURATION_TOLERANCE) -> float:
+    """Sample size at which the fitted curve is within `tolerance` of its asymptote."""
+    if curve["b"] <= tolerance:
+        return 1.0
+    return (curve["b"] / tolerance) ** (1.0 / curve["c"])
+
+
+def summarize_curve(points: List[Dict[str, Any]], n_train: int,
+                    tolerance: float = SATURATION_TOLERANCE) -> Dict[str, Any]:
+    """
+    Turns measured (n_samples, score) points into the data-sufficiency report.
+
+    Returns:
+        {"curve", "asymptotic_score", "projected_gain", "gain_if_doubled", "saturation_size",
+         "saturated", "recommended_sample_size"}; curve fields are None if no fit was possible.
+    """
+    ok = [p for p in points if p.get("score") is not None]
+    curve = fit_power_law([p["n_samples"] for p in ok], [p["score"] for p in ok])
+    if curve is None:
+        return {"curve": None, "asymptotic_score": None, "projected_gain": None, "gain_if_doubled": None,
+                "saturation_size": None, "saturated": None, "recommended_sample_size": n_train}
+    at_full = _power_law(n_train, **curve)
+    saturation = saturation_size(curve, tolerance)
+    reachable = saturation <= MAX_SATURATION_SIZE
+    return {
+        "curve": curve,
+        "asymptotic_score": curve["a"],
+        "projected_gain": float(curve["a"] - at_full), # Best case with unlimited data
+        "gain_if_doubled": float(_power_law(2 * n_train, **curve) - at_full),
+        "saturation_size": int(math.ceil(saturation)) if reachable else None,
+        "saturated": bool(saturation <= n_train),
+        # Training on more rows than this buys less than `tolerance`
+        "recommended_sample_size": int(min(n_train, math.ceil(saturation))) if reachable else n_train,
+    }
+
+
+def fit_subsample(factory: Callable, X_train: np.ndarray, y_train: np.ndarray, X_test: np.ndarray,
+                  y_test: np.ndarray, rows: np.ndarray, is_classification: bool) -> Dict[str, Any]:
+    """Fits one model on X_train[rows] and scores it on the test split (module-level for joblib)."""
+    from sklearn.metrics import accuracy_score, r2_score
+
+    point = {"n_samples": int(len(rows))}
+    try:
+        model = factory()
+        start = time.perf_counter()
+        model.fit(X_train[rows], y_train[rows])
+        point["fit_time"] = time.perf_counter() - start
+        y_pred = model.predict(X_test)
+        point["score"] = float(accuracy_score(y_test, y_pred) if is_classification else r2_score(y_test, y_pred))
+    except Exception as e:
+        point.update(score=None, error=str(e))
+    return point
@@ -1,90 +1,112 @@
-from sklearn.linear_model import LogisticRegression, LinearRegression
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier, AdaBoostClassifier, VotingClassifier, StackingRegressor, RandomForestRegressor
-from sklearn.neural_network import MLPClassifier
-from sklearn.neighbors import KNeighborsClassifier
-from sklearn.tree import DecisionTreeClassifier
-from sklearn.svm import SVC
-from sklearn.naive_bayes import GaussianNB
 import sys
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+from src.algorithms.plugins import load_estimator_factory, estimator_factory
+from src.algorithms.registry import AlgorithmRegistry
+import src.algorithms.definitions # Register algorithms (they carry the estimator import paths)
 
-# Conditional Imports to avoid crashing if libs are missing
-try:
-    from xgboost import XGBClassifier, XGBRegressor
-except ImportError:
-    XGBClassifier = GradientBoostingClassifier
-    XGBRegressor = RandomForestRegressor
-    print("Warning: XGBoost not found, using sklearn fallback.", file=sys.stderr)
-
-try:
-    from lightgbm import LGBMClassifier, LGBMRegressor
-except ImportError:
-    LGBMClassifier = GradientBoostingClassifier
-    LGBMRegressor = RandomForestRegressor
-    print("Warning: LightGBM not found, using sklearn fallback.", file=sys.stderr)
-
-try:
-    from catboost import CatBoostClassifier
-    # CatBoostRegressor not used yet but good to know
-except ImportError:
-    CatBoostClassifier = GradientBoostingClassifier
-    print("Warning: CatBoost not found, using sklearn fallback.", file=sys.stderr)
+# Estimator classes are imported lazily (see Algorithm.estimator), so importing this
+# module no longer pulls in sklearn ensembles, xgboost, lightgbm or catboost.
 
 
 # Factory functions for complex ensembles
 def create_voting_classifier():
+    from sklearn.ensemble import VotingClassifier, RandomForestClassifier
     return VotingClassifier(
         estimators=[
-            ('xgb', XGBClassifier(n_estimators=100, use_label_encoder=False, eval_metric='logloss')),
-            ('lgb', LGBMClassifier(n_estimators=100)),
+            ('xgb', SKLEARN_MAPPING["XGBoost"](n_estimators=100, use_label_encoder=False, eval_metric='logloss')),
+            ('lgb', SKLEARN_MAPPING["LightGBM Classifier"](n_estimators=100)),
             ('rf', RandomForestClassifier(n_estimators=100))
         ],
         voting='soft'
     )
 
 def create_stacked_regressor():
+    from sklearn.ensemble import StackingRegressor
+    from sklearn.linear_model import LinearRegression
     return StackingRegressor(
         estimators=[
-            ('xgb', XGBRegressor(n_estimators=100)),
-            ('lgb', LGBMRegressor(n_estimators=100))
+            ('xgb', SKLEARN_MAPPING["XGBoost Regressor"](n_estimators=100)),
+            ('lgb', SKLEARN_MAPPING["LightGBM Regressor"](n_estimators=100))
         ],
         final_estimator=LinearRegression()
     )
 
 def create_ensemble_classifier():
     # Matches "Ensemble (XGB + CatBoost + LGBM)"
+    from sklearn.ensemble import VotingClassifier, GradientBoostingClassifier
     estimators = [
-        ('xgb', XGBClassifier(use_label_encoder=False, eval_metric='logloss')),
-        ('lgb', LGBMClassifier()),
+        ('xgb', SKLEARN_MAPPING["XGBoost"](use_label_encoder=False, eval_metric='logloss')),
+        ('lgb', SKLEARN_MAPPING["LightGBM Classifier"]()),
     ]
     # Only add catboost if available (it might be the fallback GB, checking class name/module might be safer but this is MVP)
     # If CatBoostClassifier is actually GradientBoostingClassifier (fallback), we might duplicate.
     # But it's fine for now.
+    CatBoostClassifier = SKLEARN_MAPPING["CatBoost Classifier"]
     estimators.append(('cat', CatBoostClassifier(verbose=0) if 'catboost' in sys.modules else GradientBoostingClassifier()))
-    
+
     return VotingClassifier(estimators=estimators, voting='soft')
 
-# Map Algorithm.name -> sklearn class OR factory function
-SKLEARN_MAPPING = {
-    # Classification
-    "Logistic Regression": LogisticRegression,
-    "Random Forest": RandomForestClassifier,
-    "Gradient Boosting": GradientBoostingClassifier,
-    "AdaBoost": AdaBoostClassifier,
-    "Decision Tree": DecisionTreeClassifier,
-    "Multi-Layer Perceptron (MLP)": MLPClassifier,
-    "K-Nearest Neighbors": KNeighborsClassifier,
-    "XGBoost": XGBClassifier,
-    "Support Vector Machine (SVM)": SVC,
-    "Gaussian Naive Bayes": GaussianNB,
-    "LightGBM Classifier": LGBMClassifier,
-    "CatBoost Classifier": CatBoostClassifier,
-    "Voting Classifier": create_voting_classifier,
-    "Ensemble (XGB + CatBoost + LGBM)": create_ensemble_classifier,
-    
-    # Regression
-    "Linear Regression": LinearRegression,
-    "XGBoost Regressor": XGBRegressor,
-    "LightGBM Regressor": LGBMRegressor,
-    "Stacked Regressor": create_stacked_regressor,
-    "Stacked Regressors": create_stacked_regressor, # Alias
+
+# How the benchmark evaluates each ensemble from its members' cached predictions
+# (src/automl/oof.py) instead of refitting the factory above. Members are
+# SKLEARN_MAPPING keys; "stacking" trains final_estimator on out-of-fold predictions.
+ENSEMBLE_SPECS: Dict[str, Dict[str, Any]] = {
+    "Voting Classifier": {"kind": "voting", "members": ["XGBoost", "LightGBM Classifier", "Random Forest"]},
+    "Ensemble (XGB + CatBoost + LGBM)": {"kind": "voting",
+                                         "members": ["XGBoost", "LightGBM Classifier", "CatBoost Classifier"]},
+    "Stacked Regressor": {"kind": "stacking", "members": ["XGBoost Regressor", "LightGBM Regressor"],
+                          "final_estimator": "sklearn.linear_model:LinearRegression"},
+    "Stacked Regressors": {"kind": "stacking", "members": ["XGBoost Regressor", "LightGBM Regressor"],
+                           "final_estimator": "sklearn.linear_model:LinearRegression"},
 }
+
+
+# Benchmarkable estimators that have no Algorithm entry in the registry
+UNREGISTERED_ESTIMATORS: Dict[str, Tuple[str, Optional[str]]] = {
+    "Gradient Boosting": ("sklearn.ensemble:GradientBoostingClassifier", None),
+    "Decision Tree": ("sklearn.tree:DecisionTreeClassifier", None),
+}
+
+
+class LazyEstimatorMapping(Mapping):
+    """
+    Read-only Algorithm.name -> sklearn class OR factory function.
+
+    Keys are every registered Algorithm that declares an estimator (including
+    plugins) plus UNREGISTERED_ESTIMATORS; a value's library is imported only
+    when that key is looked up.
+    """
+
+    def __init__(self, extra: Dict[str, Tuple[str, Optional[str]]]):
+        self._extra = extra
+
+    def __getitem__(self, name: str) -> Callable:
+        algo = AlgorithmRegistry.get_by_name(name)
+        # Registry lookups are case-insensitive; mapping keys stay exact like the old dict
+        if algo is not None and algo.name == name and algo.estimator is not None:
+            return estimator_factory(algo)
+        if name in self._extra:
+            return load_estimator_factory(*self._extra[name])
+        raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        seen = set()
+        for algo in AlgorithmRegistry.get_all():
+            if algo.estimator is not None:
+                seen.add(algo.name)
+                yield algo.name
+        for name in self._extra:
+            if name not in seen:
+                yield name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, name: object) -> bool:
+        algo = AlgorithmRegistry.get_by_name(name) if isinstance(name, str) else None
+        return (algo is not None and algo.name == name and algo.estimator is not None) or name in self._extra
+
+
+# Map Algorithm.name -> sklearn class OR factory function
+SKLEARN_MAPPING = LazyEstimatorMapping(UNREGISTERED_ESTIMATORS)
@@ -0,0 +1,179 @@
+import time
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional
+from src.algorithms.plugins import load_estimator_factory
+
+
+def prediction_matrix(model: Any, X: np.ndarray, is_classification: bool, n_classes: int) -> np.ndarray:
+    """
+    Predictions in the form ensembles combine: class probabilities (n, n_classes) for
+    classifiers, one-hot labels if the model has no predict_proba, raw values for regressors.
+    """
+    if not is_classification:
+        return np.asarray(model.predict(X), dtype=float)
+    proba = np.zeros((len(X), n_classes))
+    classes = np.asarray(model.classes_, dtype=int)
+    if hasattr(model, "predict_proba"):
+        proba[:, classes] = model.predict_proba(X)
+    else:
+        proba[np.arange(len(X)), np.asarray(model.predict(X), dtype=int)] = 1.0
+    return proba
+
+
+def _fold_predictions(factory: Callable, X: np.ndarray, y: np.ndarray, train_idx: np.ndarray,
+                      val_idx: np.ndarray, is_classification: bool, n_classes: int) -> np.ndarray:
+    model = factory()
+    model.fit(X[train_idx], y[train_idx])
+    return prediction_matrix(model, X[val_idx], is_classification, n_classes)
+
+
+class PredictionCache:
+    """
+    Out-of-fold and test-set predictions of base models for one train/test split.
+
+    Test predictions come from the model the benchmark already fitted on the full
+    training set; out-of-fold predictions (needed only to train stacking
+    meta-learners) are computed once per member on first request. Ensembles are
+    then evaluated by combining cached arrays, without refitting their members.
+    """
+
+    def __init__(self, X_train: np.ndarray, y_train: np.ndarray, X_test: np.ndarray,
+                 is_classification: bool, n_folds: int = 5, seed: int = 42, n_jobs: int = -1):
+        self.X_train = X_train
+        self.y_train = np.asarray(y_train)
+        self.X_test = X_test
+        self.is_classification = is_classification
+        self.n_classes = int(self.y_train.max()) + 1 if is_classification and len(self.y_train) else 0
+        self.n_folds = n_folds
+        self.seed = seed
+        self.n_jobs = n_jobs # Parallel fold fits for out-of-fold predictions
+        self.models: Dict[str, Any] = {} # Fitted on the full training split
+        self._test: Dict[str, np.ndarray] = {}
+        self._oof: Dict[str, np.ndarray] = {}
+        self.fit_seconds = 0.0 # Time spent fitting inside the cache (members not benchmarked themselves, OOF folds)
+        self.member_seconds: Dict[str, float] = {} # Full-training-set fit time per member
+        self.oof_seconds: Dict[str, float] = {}    # Out-of-fold fit time per member
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._test
+
+    def put_test(self, name: str, model: Any, fit_seconds: float = 0.0):
+        """Caches test predictions of an already fitted base model (and the time its fit took)."""
+        self.models[name] = model
+        self.member_seconds[name] = fit_seconds
+        self._test[name] = prediction_matrix(model, self.X_test, self.is_classification, self.n_classes)
+
+    def test(self, name: str, factory: Callable) -> np.ndarray:
+        """Test predictions for `name`, fitting it on the training set if it wasn't benchmarked."""
+        if name not in self._test:
+            start = time.perf_counter()
+            model = factory()
+            model.fit(self.X_train, self.y_train)
+            seconds = time.perf_counter() - start
+            self.fit_seconds += seconds
+            self.put_test(name, model, seconds)
+        return self._test[name]
+
+    def oof(self, name: str, factory: Callable) -> np.ndarray:
+        """Out-of-fold training-set predictions for `name` (n_folds parallel fits, computed once)."""
+        if name not in self._oof:
+            from joblib import Parallel, delayed
+            from sklearn.model_selection import KFold, StratifiedKFold
+
+            if self.is_classification and np.bincount(self.y_train).min() >= self.n_folds:
+                splits = StratifiedKFold(self.n_folds, shuffle=True, random_state=self.seed).split(self.X_train, self.y_train)
+            else:
+                splits = KFold(self.n_folds, shuffle=True, random_state=self.seed).split(self.X_train)
+            splits = list(splits)
+            start = time.perf_counter()
+            folds = Parallel(n_jobs=self.n_jobs)(
+                delayed(_fold_predictions)(factory, self.X_train, self.y_train, train_idx, val_idx,
+                                           self.is_classification, self.n_classes)
+                for train_idx, val_idx in splits)
+            self.oof_seconds[name] = time.perf_counter() - start
+            self.fit_seconds += self.oof_seconds[name]
+            shape = (len(self.y_train), self.n_classes) if self.is_classification else (len(self.y_train),)
+            oof = np.zeros(shape)
+            for (_, val_idx), predictions in zip(splits, folds):
+                oof[val_idx] = predictions
+            self._oof[name] = oof
+        return self._oof[name]
+
+
+def _stack(matrices: List[np.ndarray]) -> np.ndarray:
+    return np.column_stack([m.reshape(len(m), -1) for m in matrices])
+
+
+class FittedEnsemble:
+    """
+    Estimator-like ensemble assembled from already fitted members (and a stacking
+    meta-learner), so an evaluated ensemble can be stored and used for predictions.
+    """
+
+    def __init__(self, kind: str, members: List[Any], is_classification: bool, n_classes: int,
+                 final_estimator: Optional[Any] = None, fit_seconds: float = 0.0):
+        self.kind = kind
+        self.members = members
+        self.is_classification = is_classification
+        self.n_classes = n_classes
+        self.final_estimator = final_estimator
+        self.fit_seconds = fit_seconds # What training it from scratch costs: members (+ OOF folds and meta-learner)
+
+    def get_params(self, deep: bool = True) -> Dict[str, Any]:
+        return {"kind": self.kind, "members": [type(m).__name__ for m in self.members],
+                "final_estimator": type(self.final_estimator).__name__ if self.final_estimator is not None else None}
+
+    def _member_predictions(self, X: np.ndarray) -> List[np.ndarray]:
+        return [prediction_matrix(m, X, self.is_classification, self.n_classes) for m in self.members]
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        if not self.is_classification:
+            raise AttributeError("predict_proba is only available for classification ensembles")
+        if self.kind == "voting":
+            return np.mean(self._member_predictions(X), axis=0)
+        return self.final_estimator.predict_proba(_stack(self._member_predictions(X)))
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return _combine(self, self._member_predictions(X))
+
+
+def _combine(ensemble: FittedEnsemble, predictions: List[np.ndarray]) -> np.ndarray:
+    if ensemble.kind == "voting":
+        # Soft voting: average probabilities (or values for regressors)
+        blended = np.mean(predictions, axis=0)
+        return blended.argmax(axis=1) if ensemble.is_classification else blended
+    return ensemble.final_estimator.predict(_stack(predictions))
+
+
+def evaluate_ensemble(spec: Dict[str, Any], cache: PredictionCache, factories: Dict[str, Callable]):
+    """
+    Test-set predictions of an ENSEMBLE_SPECS entry built from cached member predictions.
+
+    Args:
+        spec: {"kind": "voting" | "stacking", "members": [...], "final_estimator": "module:attr"}.
+        cache: Predictions for the current split.
+        factories: Member name -> estimator factory, used only for missing predictions.
+
+    Returns:
+        (predicted labels or values for cache.X_test, FittedEnsemble); the ensemble's fit_seconds
+        adds up its members' fit times even when they were fitted (and timed) by the benchmark.
+    """
+    members = spec["members"]
+    test = [cache.test(name, factories[name]) for name in members]
+    final = None
+    fit_seconds = sum(cache.member_seconds[name] for name in members)
+
+    if spec["kind"] == "stacking":
+        oof = [cache.oof(name, factories[name]) for name in members]
+        final = load_estimator_factory(spec["final_estimator"])()
+        start = time.perf_counter()
+        final.fit(_stack(oof), cache.y_train)
+        final_seconds = time.perf_counter() - start
+        cache.fit_seconds += final_seconds
+        fit_seconds += sum(cache.oof_seconds[name] for name in members) + final_seconds
+    elif spec["kind"] != "voting":
+        raise ValueError(f"Unknown ensemble kind '{spec['kind']}'")
+
+    ensemble = FittedEnsemble(spec["kind"], [cache.models[name] for name in members],
+                              cache.is_classification, cache.n_classes, final_estimator=final, fit_seconds=fit_seconds)
+    return _combine(ensemble, test), ensemble
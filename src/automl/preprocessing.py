@@ -0,0 +1,157 @@
+import copy
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+from src.sketches import profile_categoricals, choose_encodings
+from src.target_profile import profile_series
+from src.tracing import stage
+
+
+class TabularPreprocessor:
+    """
+    The benchmark's minimal preprocessing as a reusable, picklable object so a
+    stored model can be applied to new rows: mean imputation for numerical
+    columns, label encoding for everything else (or frequency encoding for the
+    columns `encodings` marks, see src.sketches.choose_encodings), label encoding
+    of a categorical target, and (once fit_scaler is called) standard scaling.
+    """
+
+    def __init__(self, target_col: str, encodings: Optional[Dict[str, str]] = None):
+        self.target_col = target_col
+        self.encodings = encodings or {}
+        self.frequency_maps: Dict[str, Dict[str, float]] = {}
+        self.feature_columns: List[str] = []
+        self.numeric_columns: List[str] = []
+        self.numeric_means: Dict[str, float] = {}
+        self.category_codes: Dict[str, Dict[str, int]] = {}
+        self.target_classes: Optional[np.ndarray] = None
+        self.is_classification = False
+        self.scaler: Optional[Any] = None
+        self.native = False
+
+    def fit_transform(self, df: pd.DataFrame, target_profile: Optional[Dict[str, Any]] = None):
+        """
+        Learns the encodings from df and applies them.
+
+        Args:
+            df: Training frame, target included.
+            target_profile: profile_series() of df's target, if the caller already has it.
+
+        Returns:
+            (X DataFrame, encoded y, is_classification)
+        """
+        from sklearn.impute import SimpleImputer
+        from sklearn.preprocessing import LabelEncoder
+
+        X = df.drop(columns=[self.target_col])
+        y = df[self.target_col]
+        self.feature_columns = list(X.columns)
+
+        # Handle Missing Values (Simple Mean Imputation)
+        num_cols = X.select_dtypes(include=[np.number]).columns
+        self.numeric_columns = list(num_cols)
+        if len(num_cols) > 0:
+            imputer_num = SimpleImputer(strategy='mean')
+            X[num_cols] = imputer_num.fit_transform(X[num_cols])
+            self.numeric_means = dict(zip(imputer_num.feature_names_in_, imputer_num.statistics_.tolist()))
+
+        # Categorical -> Label Encode (str conversion so NaN becomes its own category);
+        # high-cardinality columns get their training frequency instead
+        for col in X.select_dtypes(exclude=[np.number]).columns:
+            if self.encodings.get(col) == "frequency":
+                shares = X[col].astype(str).value_counts(normalize=True)
+                self.frequency_maps[col] = shares.to_dict()
+                X[col] = X[col].astype(str).map(shares).astype(float)
+                continue
+            le = LabelEncoder()
+            X[col] = le.fit_transform(X[col].astype(str))
+            self.category_codes[col] = {value: code for code, value in enumerate(le.classes_)}
+
+        # Target Encoding if categorical (same rule as the analyzer)
+        if target_profile is None:
+            target_profile = profile_series(y)
+        self.is_classification = target_profile["problem_type"] == "classification"
+        if self.is_classification:
+            le_y = LabelEncoder()
+            y = le_y.fit_transform(y)
+            self.target_classes = le_y.classes_
+        return X, y, self.is_classification
+
+    def fit_scaler(self, X_train: Any) -> np.ndarray:
+        """Fits the StandardScaler on the training split and returns it scaled."""
+        from sklearn.preprocessing import StandardScaler
+
+        self.scaler = StandardScaler()
+        # Fitted on a bare array: transform() passes arrays, and feature names would make sklearn warn
+        return self.scaler.fit_transform(np.asarray(X_train, dtype=float))
+
+    @property
+    def categorical_indices(self) -> List[int]:
+        """Positions of the label-encoded columns in the transformed matrix."""
+        return [i for i, col in enumerate(self.feature_columns) if col in self.category_codes]
+
+    def native_copy(self) -> "TabularPreprocessor":
+        """Same fitted encodings, transforming in native mode."""
+        clone = copy.copy(self)
+        clone.native = True
+        return clone
+
+    def transform(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Encodes new rows exactly like the training data. The target column may be
+        absent; categories unseen during fit are encoded as -1 (NaN in native mode),
+        and as frequency 0 in frequency-encoded columns.
+        """
+        missing = [c for c in self.feature_columns if c not in df.columns]
+        if missing:
+            raise ValueError(f"Missing feature columns: {missing}")
+        X = df[self.feature_columns].copy()
+        for col in self.numeric_columns:
+            X[col] = pd.to_numeric(X[col], errors="coerce")
+            if not self.native:
+                X[col] = X[col].fillna(self.numeric_means.get(col, 0.0))
+        for col, codes in self.category_codes.items():
+            encoded = X[col].astype(str).map(codes)
+            if self.native:
+                X[col] = encoded.where(X[col].notna()).astype(float)
+            else:
+                X[col] = encoded.fillna(-1).astype(np.int64)
+        for col, shares in self.frequency_maps.items():
+            X[col] = X[col].astype(str).map(shares).fillna(0.0).astype(float)
+        X = X.to_numpy(dtype=float)
+        if self.native or self.scaler is None:
+            return X
+        return self.scaler.transform(X)
+
+    def decode_target(self, y_pred: Any) -> np.ndarray:
+        """Maps encoded class predictions back to the original labels."""
+        y_pred = np.asarray(y_pred)
+        if self.target_classes is None:
+            return y_pred
+        return self.target_classes[y_pred.astype(int)]
+
+
+def categorical_encodings(df: pd.DataFrame, target_col: str,
+                          profile: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+    """
+    The "auto" per-column encodings for df's categorical features (see choose_encodings),
+    from a profile_categoricals() result if the caller has one.
+    """
+    if profile is None:
+        with stage("automl.categorical_profile"):
+            profile = profile_categoricals(df, exclude=[target_col])
+    return {col: encoding for col, encoding in choose_encodings(profile).items()
+            if col in df.columns and col != target_col}
+
+
+def preprocess_frame(df: pd.DataFrame, target_col: str,
+                     categorical_encoding: str = "auto") -> (pd.DataFrame, Any, bool):
+    """
+    Minimal preprocessing shared by benchmarking and tuning (see TabularPreprocessor),
+    with the same categorical_encoding choice as AutoMLRunner.
+
+    Returns:
+        (X, y, is_classification)
+    """
+    encodings = categorical_encodings(df, target_col) if categorical_encoding == "auto" else {}
+    return TabularPreprocessor(target_col, encodings=encodings).fit_transform(df)
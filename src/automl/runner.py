@@ -1,18 +1,63 @@
+import time
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, mean_squared_error, r2_score
-from sklearn.impute import SimpleImputer
-from sklearn.preprocessing import LabelEncoder, StandardScaler
-from src.automl.mappings import SKLEARN_MAPPING
+from typing import List, Dict, Any, Optional
+from src.automl.artifacts import ModelArtifactStore, dataset_key
+from src.automl.cost_model import CostModel
+from src.automl.preprocessing import TabularPreprocessor, categorical_encodings
+from src.automl.mappings import SKLEARN_MAPPING, ENSEMBLE_SPECS
+from src.automl.oof import PredictionCache, evaluate_ensemble
+from src.automl.learning_curve import subsample_sizes, summarize_curve, fit_subsample
+from src.automl.gbdt import NATIVE_LIBRARIES, fit_with_early_stopping, gbdt_library, prepare_native, time_saved
+from src.meta.history import BenchmarkHistory
+from src.screening import screen_columns, apply_screening, pruning_summary
+from src.tracing import stage
 
 class AutoMLRunner:
     """
     Executes the recommended algorithms and benchmarks them.
     """
+
+    def __init__(self, history: Optional[BenchmarkHistory] = None, cost_model: Optional[CostModel] = None,
+                 artifact_store: Optional[ModelArtifactStore] = None, early_stopping_rounds: Optional[int] = 20,
+                 validation_fraction: float = 0.1, native_gbdt: bool = True, prune_columns: bool = False,
+                 categorical_encoding: str = "auto"):
+        """
+        Args:
+            history: Optional store; when set, every successful result is persisted
+                     with the dataset fingerprint so MetaRanker can learn from it.
+            cost_model: Optional cost model; every successful fit is added as a timing
+                        measurement, and it drives scheduling when a time budget is given.
+            artifact_store: Optional store; every successful model is saved with its
+                            preprocessing and its id returned in the "Artifact Id" column.
+            early_stopping_rounds: Patience for boosted trees, which then stop once a
+                                   validation split carved from the training data stops
+                                   improving. None trains every round.
+            validation_fraction: Share of the training split used for that validation.
+            native_gbdt: Give xgboost/lightgbm/catboost unimputed, unscaled inputs with
+                         categorical columns marked, so they use their own handling.
+            prune_columns: Drop constant, near-constant, duplicate and ID-like columns and
+                           duplicate rows before benchmarking; what was removed (and the
+                           estimated fit time saved) is left in self.screening.
+            categorical_encoding: "auto" picks per-column encodings from the sketch-based
+                                  categorical profile (frequency encoding for high-cardinality
+                                  columns; see src.sketches); "label" label-encodes every
+                                  categorical column. The choice is left in self.encodings.
+        """
+        self.history = history
+        self.cost_model = cost_model
+        self.artifact_store = artifact_store
+        self.early_stopping_rounds = early_stopping_rounds
+        self.validation_fraction = validation_fraction
+        self.native_gbdt = native_gbdt
+        self.prune_columns = prune_columns
+        self.categorical_encoding = categorical_encoding
+        self.encodings: Dict[str, str] = {}
+        self.screening: Optional[Dict[str, Any]] = None
     
-    def run_benchmark(self, df: pd.DataFrame, target_col: str, recommendations: List[Any]) -> pd.DataFrame:
+    def run_benchmark(self, df: pd.DataFrame, target_col: str, recommendations: List[Any],
+                      analysis: Optional[Dict[str, Any]] = None, dataset_name: Optional[str] = None,
+                      time_budget: Optional[float] = None) -> pd.DataFrame:
         """
         Runs the benchmark loop.
         
@@ -20,55 +65,81 @@ class AutoMLRunner:
             df: Dataset.
             target_col: Target column name.
             recommendations: List of recommendation dicts from HeuristicRanker.
+            analysis: DatasetAnalyzer output for df (only used for history; computed if missing).
+            dataset_name: Label stored with the history records.
+            time_budget: Optional seconds for the whole loop. With a cost model, jobs run
+                         cheapest-first and any job predicted to overrun the remaining
+                         budget is skipped.
+                         Ensembles in ENSEMBLE_SPECS are scored last from their members'
+                         cached predictions rather than refitted.
             
         Returns:
-            DataFrame with columns [Algorithm, Metric, Value, Status]
+            DataFrame with columns [Algorithm, Metric, Value, Status, Fit Time, Predict Time]
+            (+ Best Iteration and Time Saved for boosted trees, + Artifact Id with an artifact store)
         """
+        # sklearn is imported here rather than at module level so the API starts without it
+        from sklearn.model_selection import train_test_split
+        from sklearn.metrics import accuracy_score, mean_squared_error, r2_score
+
         results = []
+        self.screening = None
+        screening = None
+        if self.prune_columns:
+            with stage("automl.screen"):
+                screening = screen_columns(df, target_col)
+                df = apply_screening(df, screening, drop_duplicate_rows=True)
         
         # 1. Preprocessing (Minimal)
-        X = df.drop(columns=[target_col])
-        y = df[target_col]
-        
-        # Handle Missing Values (Simple Mean/Mode Imputation)
-        # Numerical
-        num_cols = X.select_dtypes(include=[np.number]).columns
-        if len(num_cols) > 0:
-            imputer_num = SimpleImputer(strategy='mean')
-            X[num_cols] = imputer_num.fit_transform(X[num_cols])
+        preprocessor = self._preprocessor(df, target_col, analysis if screening is None else None)
+        X, y, is_classification = preprocessor.fit_transform(df)
             
-        # Categorical -> Label Encode for simplicity (or OneHot)
-        cat_cols = X.select_dtypes(exclude=[np.number]).columns
-        for col in cat_cols:
-            le = LabelEncoder()
-            # Handle potential new categories in future/test by using str conversion
-            X[col] = le.fit_transform(X[col].astype(str))
-            
-        # Target Encoding if categorical
-        is_classification = False
-        if y.dtype == 'object' or len(y.unique()) < 20:
-            is_classification = True
-            le_y = LabelEncoder()
-            y = le_y.fit_transform(y)
-            
-        # 2. Train/Test Split
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        # 2. Train/Test Split (by position, so native GBDT inputs can use the same rows)
+        y = np.asarray(y)
+        train_idx, test_idx = train_test_split(np.arange(len(X)), test_size=0.2, random_state=42)
+        X_train, X_test, y_train, y_test = X.iloc[train_idx], X.iloc[test_idx], y[train_idx], y[test_idx]
         
         # Scaling (Important for KNN, MLP, Linear)
-        scaler = StandardScaler()
-        X_train = scaler.fit_transform(X_train)
-        X_test = scaler.transform(X_test)
+        X_train = preprocessor.fit_scaler(X_train)
+        X_test = preprocessor.scaler.transform(np.asarray(X_test, dtype=float))
+        dataset = dataset_key(df) if self.artifact_store is not None else None
+        native = {} # Built on first use: NaN kept, categories as codes, no scaling
         
         # 3. Benchmark Loop
+        n_train, n_features = X_train.shape
+        predicted = {}
+        if self.cost_model is not None and time_budget is not None:
+            for rec in recommendations:
+                algo = rec["algorithm"]
+                predicted[algo.name] = self.cost_model.predict(algo.name, n_train, n_features, algo.complexity_score)["seconds"]
+            recommendations = sorted(recommendations, key=lambda r: predicted[r["algorithm"].name])
+        loop_start = time.perf_counter()
+
+        # Ensembles are scored after the loop from their members' cached predictions
+        ensembles = [rec["algorithm"] for rec in recommendations if rec["algorithm"].name in ENSEMBLE_SPECS]
+        members = {name for algo in ensembles for name in ENSEMBLE_SPECS[algo.name]["members"]}
+        cache = PredictionCache(X_train, y_train, X_test, is_classification) if ensembles else None
+
         for rec in recommendations:
             algo = rec["algorithm"]
-            model_class = SKLEARN_MAPPING.get(algo.name)
+            if algo.name in ENSEMBLE_SPECS:
+                continue
+
+            if predicted:
+                remaining = time_budget - (time.perf_counter() - loop_start)
+                if predicted[algo.name] > remaining:
+                    results.append({"Algorithm": algo.name, "Metric": "N/A", "Value": 0.0,
+                                    "Status": f"Skipped: predicted {predicted[algo.name]:.1f}s exceeds remaining budget ({max(remaining, 0):.1f}s)",
+                                    "Fit Time": 0.0, "Predict Time": 0.0})
+                    continue
             
-            if not model_class:
-                results.append({"Algorithm": algo.name, "Metric": "N/A", "Value": 0.0, "Status": "Not Implemented"})
+            if algo.name not in SKLEARN_MAPPING:
+                results.append({"Algorithm": algo.name, "Metric": "N/A", "Value": 0.0, "Status": "Not Implemented",
+                                "Fit Time": 0.0, "Predict Time": 0.0})
                 continue
                 
             try:
+                # Resolving imports the estimator's library on first use (a missing one fails just this job)
+                model_class = SKLEARN_MAPPING[algo.name]
                 # Instantiate
                 if isinstance(model_class, type):
                     model = model_class()
@@ -76,11 +147,27 @@ class AutoMLRunner:
                     # It's a factory function (or instance if we messed up, but let's assume factory)
                     model = model_class()
                 
+                # Ensemble members keep the shared inputs so their cached predictions can be combined
+                library = gbdt_library(model)
+                use_native = self.native_gbdt and library in NATIVE_LIBRARIES and algo.name not in members
+                if use_native and not native:
+                    native_preprocessor = preprocessor.native_copy()
+                    X_native = native_preprocessor.transform(df)
+                    native.update(preprocessor=native_preprocessor, train=X_native[train_idx], test=X_native[test_idx])
+                fit_X, eval_X = (native["train"], native["test"]) if use_native else (X_train, X_test)
+
                 # Train
-                model.fit(X_train, y_train)
+                start = time.perf_counter()
+                with stage("automl.fit", algorithm=algo.name):
+                    stopping = self._fit(model, library, fit_X, y_train, is_classification,
+                                         preprocessor.categorical_indices if use_native else [])
+                fit_time = time.perf_counter() - start
                 
                 # Predict
-                y_pred = model.predict(X_test)
+                start = time.perf_counter()
+                with stage("automl.predict", algorithm=algo.name):
+                    y_pred = model.predict(eval_X)
+                predict_time = time.perf_counter() - start
                 
                 # Evaluate
                 if is_classification:
@@ -90,9 +177,156 @@ class AutoMLRunner:
                     score = r2_score(y_test, y_pred) # or RMSE
                     metric_name = "R2 Score"
                     
-                results.append({"Algorithm": algo.name, "Metric": metric_name, "Value": score, "Status": "Success"})
+                results.append({"Algorithm": algo.name, "Metric": metric_name, "Value": score, "Status": "Success",
+                                "Fit Time": fit_time, "Predict Time": predict_time})
+                if stopping is not None:
+                    results[-1].update({"Best Iteration": stopping["best_iteration"],
+                                        "Time Saved": time_saved(fit_time, stopping)})
+                if cache is not None and algo.name in members:
+                    cache.put_test(algo.name, model, fit_time)
+                self._store(results[-1], model, native["preprocessor"] if use_native else preprocessor, dataset)
+                if self.cost_model is not None:
+                    self.cost_model.add_measurement(algo.name, n_train, n_features, fit_time,
+                                                    complexity_score=algo.complexity_score)
                 
             except Exception as e:
-                results.append({"Algorithm": algo.name, "Metric": "Error", "Value": 0.0, "Status": f"Failed: {str(e)}"})
+                results.append({"Algorithm": algo.name, "Metric": "Error", "Value": 0.0, "Status": f"Failed: {str(e)}",
+                                "Fit Time": 0.0, "Predict Time": 0.0})
+
+        for algo in ensembles:
+            try:
+                # Members not benchmarked above are fitted once here; nothing is refitted. The reported
+                # fit time is still the full cost (members' fits included), as history and cost model expect.
+                fitted_before = cache.fit_seconds
+                start = time.perf_counter()
+                with stage("automl.ensemble", algorithm=algo.name):
+                    y_pred, ensemble = evaluate_ensemble(ENSEMBLE_SPECS[algo.name], cache, SKLEARN_MAPPING)
+                fit_time = ensemble.fit_seconds
+                predict_time = time.perf_counter() - start - (cache.fit_seconds - fitted_before)
+
+                if is_classification:
+                    score, metric_name = accuracy_score(y_test, y_pred), "Accuracy"
+                else:
+                    score, metric_name = r2_score(y_test, y_pred), "R2 Score"
+                results.append({"Algorithm": algo.name, "Metric": metric_name, "Value": score, "Status": "Success",
+                                "Fit Time": fit_time, "Predict Time": predict_time})
+                self._store(results[-1], ensemble, preprocessor, dataset)
+            except Exception as e:
+                results.append({"Algorithm": algo.name, "Metric": "Error", "Value": 0.0, "Status": f"Failed: {str(e)}",
+                                "Fit Time": 0.0, "Predict Time": 0.0})
+
+        if self.artifact_store is not None:
+            for result in results:
+                result.setdefault("Artifact Id", None)
+
+        if screening is not None:
+            fit_seconds = sum(r["Fit Time"] + r["Predict Time"] for r in results)
+            self.screening = dict(screening, pruned=pruning_summary(screening, df, fit_seconds))
+
+        if self.history is not None:
+            if analysis is None or not analysis.get("imbalance_stats"):
+                # Fingerprint needs target info; /analyze results are computed without one
+                from src.analyzer import DatasetAnalyzer
+                from src.meta.fingerprint import FingerprintVectorizer
+                analysis = DatasetAnalyzer(df, target_column=target_col).analyze(sections=FingerprintVectorizer.required_sections)
+            self.history.record(analysis, results, dataset_name=dataset_name)
                 
         return pd.DataFrame(results).sort_values(by="Value", ascending=False)
+
+    def run_learning_curves(self, df: pd.DataFrame, target_col: str, recommendations: List[Any],
+                            top_k: int = 3, min_size: int = 50, factor: float = 2.0,
+                            n_jobs: int = -1) -> List[Dict[str, Any]]:
+        """
+        Learning-curve mode: fits the top candidates on geometrically growing subsamples
+        of the training split (in parallel), fits a power law to the test scores and
+        reports how much more data would help and where each model saturates.
+
+        Args:
+            df: Dataset.
+            target_col: Target column name.
+            recommendations: Ranked recommendation dicts; the first top_k runnable ones are used.
+            top_k: Number of candidates.
+            min_size: Smallest subsample (rows).
+            factor: Growth factor between subsample sizes.
+            n_jobs: Parallel fits (joblib semantics).
+
+        Returns:
+            One dict per algorithm: {"algorithm", "metric", "n_train", "points", and the
+            summarize_curve fields (projected_gain, saturation_size, recommended_sample_size, ...)}.
+        """
+        from joblib import Parallel, delayed
+        from sklearn.model_selection import train_test_split
+
+        preprocessor = self._preprocessor(df, target_col)
+        X, y, is_classification = preprocessor.fit_transform(df)
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        X_train = preprocessor.fit_scaler(X_train)
+        X_test = preprocessor.scaler.transform(np.asarray(X_test, dtype=float))
+        y_train, y_test = np.asarray(y_train), np.asarray(y_test)
+
+        # Nested subsamples: every size is a prefix of one shuffled order. For classification
+        # the order interleaves classes so each prefix keeps the class proportions.
+        order = np.random.default_rng(42).permutation(len(y_train))
+        if is_classification:
+            labels = y_train[order]
+            rank_in_class = np.zeros(len(order))
+            for label in np.unique(labels):
+                members = np.flatnonzero(labels == label)
+                rank_in_class[members] = (np.arange(len(members)) + 0.5) / len(members)
+            order = order[np.argsort(rank_in_class, kind="stable")]
+        sizes = subsample_sizes(len(y_train), min_size=min_size, factor=factor)
+
+        candidates = [rec["algorithm"] for rec in recommendations
+                      if rec["algorithm"].name in SKLEARN_MAPPING and rec["algorithm"].name not in ENSEMBLE_SPECS][:top_k]
+        jobs = [(algo, size) for algo in candidates for size in sizes]
+        with stage("automl.learning_curve"):
+            points = Parallel(n_jobs=n_jobs)(
+                delayed(fit_subsample)(SKLEARN_MAPPING[algo.name], X_train, y_train, X_test, y_test,
+                                       order[:size], is_classification)
+                for algo, size in jobs)
+
+        metric = "Accuracy" if is_classification else "R2 Score"
+        curves = []
+        for algo in candidates:
+            algo_points = [p for (a, _), p in zip(jobs, points) if a is algo]
+            curves.append({"algorithm": algo.name, "metric": metric, "n_train": len(y_train),
+                           "points": algo_points, **summarize_curve(algo_points, len(y_train))})
+        return curves
+
+    def _preprocessor(self, df: pd.DataFrame, target_col: str,
+                      analysis: Optional[Dict[str, Any]] = None) -> TabularPreprocessor:
+        """TabularPreprocessor with the configured categorical encodings (profile reused from analysis if present)."""
+        self.encodings = {}
+        if self.categorical_encoding == "auto":
+            self.encodings = categorical_encodings(df, target_col, (analysis or {}).get("categorical_profile"))
+        return TabularPreprocessor(target_col, encodings=self.encodings)
+
+    def _fit(self, model: Any, library: Optional[str], X_train: np.ndarray, y_train: np.ndarray,
+             is_classification: bool, categorical: List[int]) -> Optional[Dict[str, Any]]:
+        """Fits model; boosted trees early-stop. Returns fit_with_early_stopping's info or None."""
+        if library is None or not self.early_stopping_rounds:
+            model.fit(X_train, y_train, **(prepare_native(model, categorical, X_train.shape[1]) if library else {}))
+            return None
+        if library == "sklearn":
+            # GradientBoosting/HistGradientBoosting hold out their own validation_fraction
+            return fit_with_early_stopping(model, X_train, y_train, None, None, rounds=self.early_stopping_rounds)
+
+        from sklearn.model_selection import train_test_split
+        stratify = y_train if is_classification and np.bincount(y_train).min() >= 2 else None
+        X_fit, X_val, y_fit, y_val = train_test_split(X_train, y_train, test_size=self.validation_fraction,
+                                                      random_state=42, stratify=stratify)
+        return fit_with_early_stopping(model, X_fit, y_fit, X_val, y_val, rounds=self.early_stopping_rounds,
+                                       fit_kwargs=prepare_native(model, categorical, X_train.shape[1]))
+
+    def _store(self, result: Dict[str, Any], model: Any, preprocessor: TabularPreprocessor, dataset: Optional[str]):
+        if self.artifact_store is None:
+            return
+        try:
+            with stage("automl.save", algorithm=result["Algorithm"]):
+                result["Artifact Id"] = self.artifact_store.save(
+                    model, preprocessor, dataset, result["Algorithm"],
+                    metrics={"metric": result["Metric"], "value": float(result["Value"]), "fit_seconds": result["Fit Time"]})
+        except Exception as e:
+            # The score stands even if the model can't be persisted
+            result["Artifact Id"] = None
+            result["Status"] = f"Success (not stored: {e})"
@@ -0,0 +1,143 @@
+import argparse
+import sys
+import time
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from src.automl.artifacts import ModelArtifactStore
+from src.tracing import stage, metrics
+
+DEFAULT_CHUNKSIZE = 50_000
+
+PREDICT_ROWS_PER_SECOND = metrics.histogram(
+    "malgocat_predict_rows_per_second", "Batch scoring throughput per request.", ("algorithm",),
+    buckets=(1e2, 1e3, 5e3, 1e4, 5e4, 1e5, 5e5, 1e6, 5e6, 1e7))
+
+
+def predict_frame(model: Any, preprocessor: Any, chunk: pd.DataFrame, proba: bool = False,
+                  keep_columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Scores one chunk: saved preprocessing, then the estimator.
+
+    Args:
+        model: Fitted estimator from the artifact store.
+        preprocessor: Its TabularPreprocessor.
+        chunk: Raw rows (the target column, if present, is ignored).
+        proba: Add a "proba_<class>" column per class for classifiers with predict_proba.
+        keep_columns: Input columns copied to the output (e.g. row ids).
+
+    Returns:
+        DataFrame with keep_columns, "prediction" and optional probability columns.
+    """
+    X = preprocessor.transform(chunk)
+    out = chunk[keep_columns].reset_index(drop=True) if keep_columns else pd.DataFrame(index=range(len(chunk)))
+    out["prediction"] = preprocessor.decode_target(model.predict(X))
+    if proba and preprocessor.is_classification and hasattr(model, "predict_proba"):
+        probabilities = model.predict_proba(X)
+        classes = getattr(model, "classes_", np.arange(probabilities.shape[1]))
+        for i, label in enumerate(preprocessor.decode_target(classes)):
+            out[f"proba_{label}"] = probabilities[:, i]
+    return out
+
+
+class ScoringRun:
+    """
+    Streams chunks through a stored model, yielding predictions chunk by chunk so
+    memory stays bounded by the chunk size; rows/sec is available as it runs.
+    """
+
+    def __init__(self, model: Any, preprocessor: Any, algorithm: str = "", proba: bool = False,
+                 keep_columns: Optional[List[str]] = None):
+        self.model = model
+        self.preprocessor = preprocessor
+        self.algorithm = algorithm
+        self.proba = proba
+        self.keep_columns = keep_columns
+        self.rows = 0
+        self.chunks = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {"rows": self.rows, "chunks": self.chunks, "seconds": self.seconds, "rows_per_sec": self.rows_per_sec}
+
+    def predict(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Yields one prediction frame per input chunk."""
+        for chunk in chunks:
+            start = time.perf_counter()
+            with stage("predict.chunk", algorithm=self.algorithm):
+                out = predict_frame(self.model, self.preprocessor, chunk, self.proba, self.keep_columns)
+            self.seconds += time.perf_counter() - start
+            self.rows += len(chunk)
+            self.chunks += 1
+            yield out
+        if self.rows:
+            PREDICT_ROWS_PER_SECOND.observe(self.rows_per_sec, algorithm=self.algorithm)
+
+    def csv_lines(self, chunks: Iterable[pd.DataFrame]) -> Iterator[str]:
+        """Like predict(), but yields CSV text (header with the first chunk)."""
+        for i, out in enumerate(self.predict(chunks)):
+            yield out.to_csv(index=False, header=i == 0)
+
+
+def score_csv(store: ModelArtifactStore, artifact: str, source: Any, destination: Any,
+              chunksize: int = DEFAULT_CHUNKSIZE, proba: bool = False, keep_columns: Optional[List[str]] = None,
+              progress: bool = False) -> Dict[str, Any]:
+    """
+    Scores a CSV of any size with a stored model, writing predictions as each chunk completes.
+
+    Args:
+        store: Artifact store holding the model.
+        artifact: Artifact id (as returned by /benchmark).
+        source: Input CSV path or file object.
+        destination: Output CSV path or text file object.
+        chunksize: Rows per chunk.
+        proba: Include class probabilities.
+        keep_columns: Input columns copied to the output.
+        progress: Print running rows/sec to stderr.
+
+    Returns:
+        {"rows", "chunks", "seconds", "rows_per_sec"}; seconds covers preprocessing and
+        prediction only, not CSV parsing/writing.
+    """
+    loaded = store.load(artifact)
+    if loaded is None:
+        raise KeyError(f"Model artifact '{artifact}' not found")
+    model, preprocessor = loaded
+    run = ScoringRun(model, preprocessor, store.metadata(artifact)["algorithm"], proba, keep_columns)
+
+    start = time.perf_counter()
+    output = open(destination, "w", encoding="utf-8", newline="") if isinstance(destination, str) else destination
+    try:
+        for text in run.csv_lines(pd.read_csv(source, chunksize=chunksize)):
+            output.write(text)
+            if progress:
+                elapsed = time.perf_counter() - start
+                print(f"\r{run.rows:,} rows  {run.rows / elapsed:,.0f} rows/sec", end="", file=sys.stderr)
+    finally:
+        if output is not destination:
+            output.close()
+    if progress:
+        print(file=sys.stderr)
+    return dict(run.stats(), wall_seconds=time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score a CSV with a model stored by /benchmark.")
+    parser.add_argument("artifact_id", help="Artifact id from the benchmark results")
+    parser.add_argument("input", help="CSV to score")
+    parser.add_argument("output", help="Where to write predictions (CSV)")
+    parser.add_argument("--model-dir", default="model_store", help="Artifact store directory")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Rows per chunk")
+    parser.add_argument("--proba", action="store_true", help="Add class probability columns")
+    parser.add_argument("--keep", nargs="*", default=None, help="Input columns to copy to the output (e.g. an id)")
+    args = parser.parse_args()
+
+    stats = score_csv(ModelArtifactStore(args.model_dir), args.artifact_id, args.input, args.output,
+                      chunksize=args.chunksize, proba=args.proba, keep_columns=args.keep, progress=True)
+    print(f"Scored {stats['rows']:,} rows in {stats['wall_seconds']:.2f}s "
+          f"({stats['rows'] / stats['wall_seconds'] if stats['wall_seconds'] else 0:,.0f} rows/sec end-to-end, "
+          f"{stats['rows_per_sec']:,.0f} rows/sec model)")
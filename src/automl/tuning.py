@@ -0,0 +1,262 @@
+import inspect
+import math
+import time
+import numpy as np
+import pandas as pd
+from typing import List, Dict, Any, Optional
+from src.algorithms.base import Algorithm
+from src.algorithms.registry import AlgorithmRegistry
+from src.automl.gbdt import fit_with_early_stopping, gbdt_library
+from src.automl.mappings import SKLEARN_MAPPING
+from src.automl.preprocessing import preprocess_frame
+from src.tracing import stage
+
+# Share of each training fold held out to monitor GBDT early stopping
+EARLY_STOPPING_FRACTION = 0.1
+
+
+def sample_params(space: Dict[str, Any], rng: np.random.Generator) -> Dict[str, Any]:
+    """
+    Draws one configuration from an Algorithm.search_space.
+
+    Args:
+        space: {param: [choices...]} or {param: ("int" | "float" | "log", low, high)}.
+        rng: NumPy random generator.
+
+    Returns:
+        Dict of plain Python values (JSON-serializable apart from tuple choices).
+    """
+    params = {}
+    for name, spec in space.items():
+        if isinstance(spec, list):
+            params[name] = spec[int(rng.integers(len(spec)))]
+            continue
+        kind, low, high = spec
+        if kind == "int":
+            params[name] = int(rng.integers(low, high + 1))
+        elif kind == "float":
+            params[name] = float(rng.uniform(low, high))
+        elif kind == "log":
+            params[name] = float(math.exp(rng.uniform(math.log(low), math.log(high))))
+        else:
+            raise ValueError(f"Unknown search space type '{kind}' for parameter '{name}'")
+    return params
+
+
+def accepted_params(factory: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drops parameters the estimator doesn't take, so a space written for xgboost
+    still works on its sklearn fallback (e.g. colsample_bytree is skipped), and
+    translates lightgbm's max_depth=-1 for it.
+    """
+    try:
+        names = set(inspect.signature(factory).parameters)
+    except (TypeError, ValueError):
+        return params
+    if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in inspect.signature(factory).parameters.values()):
+        # xgboost forwards **kwargs; its get_params() lists the real ones
+        names |= set(factory().get_params())
+    accepted = {k: v for k, v in params.items() if k in names}
+    if accepted.get("max_depth") == -1 and not getattr(factory, "__module__", "").startswith("lightgbm"):
+        accepted["max_depth"] = None # LightGBM's "no limit"; sklearn trees spell it None and reject -1
+    return accepted
+
+
+def _evaluate_fold(factory: Any, params: Dict[str, Any], X: np.ndarray, y: np.ndarray,
+                   train_idx: np.ndarray, val_idx: np.ndarray, is_classification: bool,
+                   early_stopping_rounds: Optional[int], seed: int) -> Dict[str, Any]:
+    """Fits one configuration on one CV fold. Module-level so joblib can ship it to workers."""
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.metrics import accuracy_score, r2_score
+
+    try:
+        scaler = StandardScaler()
+        X_train = scaler.fit_transform(X[train_idx])
+        X_val = scaler.transform(X[val_idx])
+        y_train, y_val = y[train_idx], y[val_idx]
+
+        model = factory(**params)
+        start = time.perf_counter()
+        library = gbdt_library(model)
+        if early_stopping_rounds and library is not None:
+            if library == "sklearn":
+                # sklearn's boosters carve validation_fraction out of the training data themselves
+                info = fit_with_early_stopping(model, X_train, y_train, None, None, rounds=early_stopping_rounds)
+            else:
+                order = np.random.default_rng(seed).permutation(len(X_train))
+                n_stop = max(1, int(len(order) * EARLY_STOPPING_FRACTION))
+                stop, fit = order[:n_stop], order[n_stop:]
+                info = fit_with_early_stopping(model, X_train[fit], y_train[fit], X_train[stop], y_train[stop],
+                                               rounds=early_stopping_rounds)
+        else:
+            model.fit(X_train, y_train)
+            info = {"early_stopped": False, "best_iteration": None}
+        fit_time = time.perf_counter() - start
+
+        y_pred = model.predict(X_val)
+        score = accuracy_score(y_val, y_pred) if is_classification else r2_score(y_val, y_pred)
+        return {"score": float(score), "fit_time": fit_time,
+                "best_iteration": info["best_iteration"], "early_stopped": info["early_stopped"]}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+class HyperparameterTuner:
+    """
+    Budgeted random search over Algorithm.search_space with k-fold CV.
+
+    Trials run in batches of `n_jobs` parallel fold fits. After each fold a trial
+    is pruned if its running mean score is below the median of earlier trials at
+    the same fold (median pruning), and boosted-tree models stop adding trees once
+    a held-out slice of the training fold stops improving.
+    """
+
+    def __init__(self, n_trials: int = 30, time_budget: Optional[float] = None, n_folds: int = 3,
+                 n_jobs: int = -1, early_stopping_rounds: Optional[int] = 20, prune: bool = True,
+                 n_startup_trials: int = 4, seed: int = 0):
+        """
+        Args:
+            n_trials: Maximum configurations per algorithm.
+            time_budget: Seconds per tune() call (tune_frame splits it across algorithms).
+                         No new batch starts once it is spent.
+            n_folds: Cross-validation folds.
+            n_jobs: Parallel fold fits (joblib semantics, -1 = all cores).
+            early_stopping_rounds: GBDT patience; None disables early stopping.
+            prune: Enable median pruning.
+            n_startup_trials: Trials that must complete before pruning kicks in.
+            seed: Seeds sampling, folds and early-stopping splits.
+        """
+        self.n_trials = n_trials
+        self.time_budget = time_budget
+        self.n_folds = n_folds
+        self.n_jobs = n_jobs
+        self.early_stopping_rounds = early_stopping_rounds
+        self.prune = prune
+        self.n_startup_trials = n_startup_trials
+        self.seed = seed
+
+    def _folds(self, X: np.ndarray, y: np.ndarray, is_classification: bool) -> List[Any]:
+        from sklearn.model_selection import KFold, StratifiedKFold
+
+        if is_classification:
+            _, counts = np.unique(y, return_counts=True)
+            if counts.min() >= self.n_folds:
+                return list(StratifiedKFold(self.n_folds, shuffle=True, random_state=self.seed).split(X, y))
+        return list(KFold(self.n_folds, shuffle=True, random_state=self.seed).split(X))
+
+    def tune(self, algorithm: Algorithm, X: Any, y: Any, is_classification: bool,
+             time_budget: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Searches one algorithm's space.
+
+        Args:
+            algorithm: Registered Algorithm with a search_space.
+            X, y: Preprocessed features and (label-encoded) target, see preprocess_frame.
+            is_classification: Accuracy if True, R2 otherwise.
+            time_budget: Overrides the tuner's budget for this call.
+
+        Returns:
+            Dict with best_params, best_score, metric, per-trial records and pruning stats.
+        """
+        from joblib import Parallel, delayed, effective_n_jobs
+
+        metric = "Accuracy" if is_classification else "R2 Score"
+        result = {"algorithm": algorithm.name, "metric": metric, "best_score": None, "best_params": None,
+                  "n_trials": 0, "n_pruned": 0, "n_failed": 0, "elapsed": 0.0, "trials": []}
+        if algorithm.name not in SKLEARN_MAPPING:
+            return dict(result, status="Not Implemented")
+        if not algorithm.search_space:
+            return dict(result, status="Not Tunable: no search space declared")
+
+        budget = self.time_budget if time_budget is None else time_budget
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y)
+        rng = np.random.default_rng(self.seed)
+        folds = self._folds(X, y, is_classification)
+        batch_size = max(1, effective_n_jobs(self.n_jobs))
+        start = time.perf_counter()
+
+        with stage("automl.tune", algorithm=algorithm.name):
+            factory = SKLEARN_MAPPING[algorithm.name]
+            trials = []
+            # history[k] = running mean at fold k of every earlier trial that reached it
+            history: List[List[float]] = [[] for _ in folds]
+            n_complete = 0
+
+            with Parallel(n_jobs=self.n_jobs) as parallel:
+                while len(trials) < self.n_trials:
+                    if trials and budget is not None and time.perf_counter() - start >= budget:
+                        break # The first batch always runs so every algorithm gets a result
+                    batch = []
+                    for _ in range(min(batch_size, self.n_trials - len(trials))):
+                        params = accepted_params(factory, sample_params(algorithm.search_space, rng))
+                        batch.append({"trial": len(trials) + len(batch), "params": params, "status": "running",
+                                      "fold_scores": [], "fit_time": 0.0, "best_iterations": []})
+
+                    for k, (train_idx, val_idx) in enumerate(folds):
+                        alive = [t for t in batch if t["status"] == "running"]
+                        if not alive:
+                            break
+                        outputs = parallel(delayed(_evaluate_fold)(factory, t["params"], X, y, train_idx, val_idx,
+                                                                   is_classification, self.early_stopping_rounds,
+                                                                   self.seed + t["trial"])
+                                           for t in alive)
+                        median = float(np.median(history[k])) if history[k] else None
+                        for t, out in zip(alive, outputs):
+                            if "error" in out:
+                                t["status"], t["error"] = "failed", out["error"]
+                                continue
+                            t["fold_scores"].append(out["score"])
+                            t["fit_time"] += out["fit_time"]
+                            if out["best_iteration"] is not None:
+                                t["best_iterations"].append(out["best_iteration"])
+                            running = float(np.mean(t["fold_scores"]))
+                            if (self.prune and k < len(folds) - 1 and n_complete >= self.n_startup_trials
+                                    and median is not None and running < median):
+                                t["status"] = "pruned"
+                            history[k].append(running)
+                    for t in batch:
+                        if t["status"] == "running":
+                            t["status"] = "complete"
+                            n_complete += 1
+                        t["score"] = float(np.mean(t["fold_scores"])) if t["fold_scores"] else None
+                        # Early-stopped GBDTs report how many trees the folds actually needed
+                        iterations = t.pop("best_iterations")
+                        t["best_iteration"] = int(np.median(iterations)) if iterations else None
+                    trials.extend(batch)
+
+        complete = [t for t in trials if t["status"] == "complete"]
+        result.update(trials=trials, n_trials=len(trials),
+                      n_pruned=sum(t["status"] == "pruned" for t in trials),
+                      n_failed=sum(t["status"] == "failed" for t in trials),
+                      elapsed=time.perf_counter() - start)
+        if not complete:
+            return dict(result, status="Failed: no trial completed")
+        best = max(complete, key=lambda t: t["score"])
+        result.update(best_score=best["score"], best_params=best["params"], best_iteration=best["best_iteration"],
+                      top=[{"params": t["params"], "score": t["score"]}
+                           for t in sorted(complete, key=lambda t: t["score"], reverse=True)[:5]],
+                      status="Success")
+        return result
+
+    def tune_frame(self, df: pd.DataFrame, target_col: str, algorithms: List[str]) -> List[Dict[str, Any]]:
+        """
+        Preprocesses a raw frame like AutoMLRunner and tunes each named algorithm.
+        The time budget is shared: each algorithm gets an even split of what is left.
+
+        Returns:
+            One tune() result per algorithm, best score first.
+        """
+        X, y, is_classification = preprocess_frame(df, target_col)
+        results = []
+        start = time.perf_counter()
+        for i, name in enumerate(algorithms):
+            algorithm = AlgorithmRegistry.get_by_name(name)
+            if algorithm is None:
+                results.append({"algorithm": name, "status": "Unknown algorithm", "best_score": None})
+                continue
+            budget = None
+            if self.time_budget is not None:
+                budget = max(0.0, self.time_budget - (time.perf_counter() - start)) / (len(algorithms) - i)
+            results.append(self.tune(algorithm, X, y, is_classification, time_budget=budget))
+        return sorted(results, key=lambda r: -math.inf if r["best_score"] is None else r["best_score"], reverse=True)
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Optional
+
+SAMPLE_SIZE = 1000   # Non-null values inspected per column
+MIN_PARSE_RATE = 0.95 # Share of sampled values a date format must parse
+TEXT_MIN_TOKENS = 4   # Mean whitespace tokens per value for free text
+TEXT_MIN_DISTINCT = 0.5 # Free text rarely repeats; categories do
+
+# Tried in order on the sample; the best-parsing one wins (earlier wins ties)
+DATE_FORMATS = ("ISO8601", "%Y/%m/%d", "%d/%m/%Y", "%m/%d/%Y", "%d-%m-%Y", "%m-%d-%Y", "%d.%m.%Y",
+                "%Y/%m/%d %H:%M:%S", "%d/%m/%Y %H:%M", "%m/%d/%Y %H:%M", "%d/%m/%Y %H:%M:%S", "%m/%d/%Y %H:%M:%S",
+                "%d %b %Y", "%b %d, %Y", "%d %B %Y", "%B %d, %Y")
+# Cheap screen before any parsing: numeric date with separators, or a month name next to a day
+_DATE_LIKE = r"^\s*(?:\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}|\d{1,2} [A-Za-z]{3}|[A-Za-z]{3,9} \d{1,2},? \d{4})"
+
+
+def _sample(series: pd.Series, size: int, seed: int) -> pd.Series:
+    """Up to `size` non-null values (random rows for long columns), as strings."""
+    if len(series) > 2 * size:
+        rows = np.sort(np.random.default_rng(seed).choice(len(series), size=2 * size, replace=False))
+        series = series.iloc[rows]
+    return series.dropna().astype(str).iloc[:size]
+
+
+def detect_date_format(sample: pd.Series) -> Optional[Dict[str, Any]]:
+    """
+    Best-parsing format for a sample of strings, parsed in bulk per candidate format.
+
+    Returns:
+        {"format", "parse_rate", "ambiguous" (day/month order could not be told apart),
+         "min", "max"} or None when nothing parses at least MIN_PARSE_RATE of the values.
+    """
+    if sample.empty or sample.str.match(_DATE_LIKE).mean() < MIN_PARSE_RATE:
+        return None
+    best, best_rate, best_parsed = None, 0.0, None
+    for fmt in DATE_FORMATS:
+        parsed = pd.to_datetime(sample, format=fmt, errors="coerce")
+        rate = float(parsed.notna().mean())
+        if rate > best_rate:
+            best, best_rate, best_parsed = fmt, rate, parsed
+        if best_rate == 1.0:
+            break
+    if best is None or best_rate < MIN_PARSE_RATE:
+        return None
+    # Every day <= 12 in the sample: the month-first twin parses just as well
+    twins = {"%d/%m/%Y": "%m/%d/%Y", "%d-%m-%Y": "%m-%d-%Y", "%d/%m/%Y %H:%M": "%m/%d/%Y %H:%M",
+             "%d/%m/%Y %H:%M:%S": "%m/%d/%Y %H:%M:%S"}
+    twin = twins.get(best)
+    ambiguous = twin is not None and (pd.to_datetime(sample, format=twin, errors="coerce").notna().mean() >= best_rate)
+    return {"format": best, "parse_rate": best_rate, "ambiguous": bool(ambiguous),
+            "min": best_parsed.min().isoformat(), "max": best_parsed.max().isoformat()}
+
+
+def text_stats(sample: pd.Series) -> Dict[str, float]:
+    """Length and whitespace-token statistics of a sample of strings."""
+    tokens = sample.str.split().str.len()
+    return {
+        "mean_length": float(sample.str.len().mean()),
+        "mean_tokens": float(tokens.mean()),
+        "max_tokens": int(tokens.max()),
+        "distinct_ratio": float(sample.nunique() / len(sample)),
+    }
+
+
+def infer_column_types(df: pd.DataFrame, sample_size: int = SAMPLE_SIZE, seed: int = 0) -> Dict[str, Dict[str, Any]]:
+    """
+    Classifies object/string columns as "datetime", "text" or "categorical" from a sample
+    of each, without converting the columns themselves.
+
+    Args:
+        df: Dataset.
+        sample_size: Non-null values inspected per column.
+        seed: Row sampling seed.
+
+    Returns:
+        {column: {"inferred", "sample_size", plus detect_date_format() fields for dates
+         or text_stats() fields otherwise}}
+    """
+    profiles = {}
+    for col, dtype in df.dtypes.items():
+        if not (pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)):
+            continue
+        sample = _sample(df[col], sample_size, seed)
+        profile: Dict[str, Any] = {"inferred": "categorical", "sample_size": int(len(sample))}
+        if sample.empty:
+            profiles[col] = profile
+            continue
+        date = detect_date_format(sample)
+        if date is not None:
+            profile.update(date, inferred="datetime")
+        else:
+            stats = text_stats(sample)
+            profile.update(stats)
+            if stats["mean_tokens"] >= TEXT_MIN_TOKENS and stats["distinct_ratio"] >= TEXT_MIN_DISTINCT:
+                profile["inferred"] = "text"
+        profiles[col] = profile
+    return profiles
+
@@ -1,13 +1,39 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from src.automl.cost_model import CostModel
+from src.target_profile import problem_type_of
 
 class CompetitionAdvisor:
     """
     Provides strategic tips and time budget estimations for ML competitions.
     """
+
+    # Registered algorithms behind each "advanced" plan, tuned individually by tune_advanced_plan
+    ADVANCED_MEMBERS = {
+        "Ensemble (XGB + CatBoost + LGBM)": ["XGBoost", "LightGBM Classifier", "CatBoost Classifier"],
+        "Stacked Regressors": ["XGBoost Regressor", "LightGBM Regressor"],
+    }
+
+    def __init__(self, cost_model: Optional[CostModel] = None):
+        """
+        Args:
+            cost_model: Calibrated cost model used for numeric estimates
+                        (an in-memory, uncalibrated one is used if omitted).
+        """
+        self.cost_model = cost_model or CostModel(path=None)
+
+    def estimate_training_cost(self, algo_name: str, n_rows: int, n_cols: int, algo_complexity: int) -> Dict[str, Any]:
+        """
+        Numeric training cost prediction for one algorithm.
+
+        Returns:
+            {"seconds": float, "peak_memory_mb": float, "source": "fitted" | "prior"}
+        """
+        return self.cost_model.predict(algo_name, n_rows, n_cols, algo_complexity)
     
     def estimate_time_budget(self, n_rows: int, n_cols: int, algo_complexity: int) -> str:
         """
         Heuristic to estimate training time scale.
+        Coarse label only; use estimate_training_cost for numbers that can drive scheduling.
         """
         # A rough complexity metric: rows * cols * complexity
         computational_load = n_rows * n_cols * algo_complexity
@@ -38,7 +64,23 @@ class CompetitionAdvisor:
         missing = analysis.get("missing_stats") or {}
         imbalance = analysis.get("imbalance_stats") or {}
         feature_types = analysis.get("feature_types") or {}
+        relevance = analysis.get("target_relevance") or {}
+        screening = analysis.get("column_screening") or {}
+        categorical = analysis.get("categorical_profile")
         
+        leaks = relevance.get("leakage_suspects") or []
+        if leaks:
+            columns = ", ".join(s["column"] for s in leaks[:5])
+            tips.append(f"⚠️ Possible target leakage: {columns} (almost) determine the target on their own. "
+                        "Check they are available at prediction time before trusting any CV score.")
+
+        if screening.get("id_columns"):
+            tips.append(f"💡 Tip: {', '.join(screening['id_columns'][:5])} look like row IDs. Drop them from the features "
+                        "(keep them for the submission file); models can only memorise them.")
+        if screening.get("duplicate_columns") or screening.get("constant_columns"):
+            tips.append("💡 Tip: Constant and duplicated columns add cost but no signal; /analyze?prune=true or "
+                        "prune_columns in /benchmark drops them.")
+
         if missing.get("has_missing_values", False):
             tips.append("💡 Tip: XGBoost and LightGBM handle missing values natively. Using them saves you from complex imputation strategies.")
             
@@ -48,7 +90,22 @@ class CompetitionAdvisor:
         if feature_types.get("numerical", 0) > 0 and feature_types.get("categorical", 0) > 0:
             tips.append("💡 Tip: Tree-based models (RF, XGB) often outperform Linear models on mixed data types without heavy preprocessing.")
             
-        if feature_types.get("categorical", 0) > 5:
+        if relevance.get("nonlinear_features"):
+            tips.append("💡 Tip: Some features carry information about the target without a linear relationship; "
+                        "tree ensembles or binned/interaction features will pick up what a linear model misses.")
+
+        if categorical is not None:
+            # Measured cardinality rather than a count of categorical columns
+            high = categorical.get("high_cardinality_columns") or []
+            if high:
+                distinct = ", ".join(f"{col} (~{categorical['columns'][col]['distinct']:,} values)" for col in high[:5])
+                tips.append(f"💡 Tip: High cardinality categoricals: {distinct}. Try Target Encoding (out-of-fold) "
+                            "or frequency encoding, or CatBoost which handles them automatically.")
+            rare = categorical.get("rare_heavy_columns") or []
+            if rare:
+                tips.append(f"💡 Tip: {', '.join(rare[:5])} spread many rows over rare values; group categories "
+                            "below ~1% into an 'other' level so models don't fit noise.")
+        elif feature_types.get("categorical", 0) > 5:
             tips.append("💡 Tip: High cardinality categoricals? Try Target Encoding or CatBoost which handles them automatically.")
 
         # General advice
@@ -60,19 +117,8 @@ class CompetitionAdvisor:
         """
         Generates a full competition plan including code snippets.
         """
-        target_info = analysis.get("target_analysis", {})
-        is_classification = True # Default
-        if target_info:
-             # Heuristic to determine type if not explicitly stated
-             # Assuming likely classification if low cardinality
-             unique_count = target_info.get("n_unique", 0)
-             dtype = target_info.get("dtype", "")
-             if "float" in dtype and unique_count > 50:
-                 is_classification = False
-        
-        # Override if explicitly in analysis
-        if "problem_type" in analysis:
-            is_classification = analysis["problem_type"] == "classification"
+        # Same rule as the analyzer/ranker/runner (target profile first, then explicit hints)
+        is_classification = problem_type_of(analysis) == "classification"
 
         # Baseline Code
         if is_classification:
@@ -164,3 +210,23 @@ stack.fit(X_train, y_train)"""
             "featureEngineering": fe_tips,
             "hyperparameters": hparams
         }
+
+    def tune_advanced_plan(self, plan: Dict[str, Any], df: Any, target_col: str, time_budget: float) -> List[Dict[str, Any]]:
+        """
+        Runs the hyperparameter search for the models behind plan["advanced"], turning the
+        static ranges in plan["hyperparameters"] into concrete configurations.
+
+        Args:
+            plan: Output of generate_competition_plan.
+            df: Raw dataset.
+            target_col: Target column.
+            time_budget: Seconds shared by all member models.
+
+        Returns:
+            HyperparameterTuner.tune_frame results (best first, trial details dropped).
+        """
+        from src.automl.tuning import HyperparameterTuner
+
+        members = self.ADVANCED_MEMBERS.get(plan["advanced"]["model"], [])
+        results = HyperparameterTuner(time_budget=time_budget).tune_frame(df, target_col, members)
+        return [{k: v for k, v in r.items() if k != "trials"} for r in results]
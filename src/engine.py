@@ -1,6 +1,7 @@
 from typing import List, Dict, Any
 from src.algorithms.base import Algorithm
 from src.algorithms.registry import AlgorithmRegistry
+from src.target_profile import problem_type_of
 
 class HeuristicRanker:
     """
@@ -20,14 +21,8 @@ class HeuristicRanker:
         """
         ranked_list = []
         
-        # 1. Determine Problem Type (Classification vs Regression)
-        target_stats = analysis_result.get("imbalance_stats", {})
-        problem_type = "classification" # Default
-        if target_stats and target_stats.get("type") == "regression":
-            problem_type = "regression"
-        elif target_stats and target_stats.get("type") == "classification":
-            problem_type = "classification"
-        # Note: robust target detection from phase 1 helps here
+        # 1. Determine Problem Type (Classification vs Regression), from the shared target profile
+        problem_type = problem_type_of(analysis_result)
         
         # Get Candidate Algorithms
         candidates = AlgorithmRegistry.get_by_type(problem_type)
@@ -59,6 +54,7 @@ class HeuristicRanker:
         missing_stats = stats.get("missing_stats") or {}
         feature_types = stats.get("feature_types") or {}
         imbalance_stats = stats.get("imbalance_stats") or {}
+        relevance = stats.get("target_relevance") or {}
         
         n_rows = basic_stats.get("n_rows", 0)
         has_missing = missing_stats.get("has_missing_values", False)
@@ -102,5 +98,23 @@ class HeuristicRanker:
             if "Tree" in algo.description or "Forest" in algo.name or "Boost" in algo.name:
                 score += 15
                 reasons.append("Handles class imbalance well")
+
+        # 3. Target relevance: informative but non-linear features favour flexible models,
+        # and strong categorical signal favours native categorical handling
+        if relevance:
+            features = relevance.get("features") or {}
+            n_nonlinear = len(relevance.get("nonlinear_features") or [])
+            if n_nonlinear:
+                if algo.complexity_score <= 3:
+                    score -= 10
+                    reasons.append(f"{n_nonlinear} informative feature(s) are not linearly related to the target")
+                elif algo.complexity_score >= 5:
+                    score += 10
+                    reasons.append("Captures non-linear feature/target relationships")
+            categorical_signal = max((f.get("uncertainty", 0.0) for f in features.values()
+                                      if f.get("kind") == "categorical" and not f.get("id_like")), default=0.0)
+            if categorical_signal >= 0.1 and algo.handle_categorical:
+                score += 5
+                reasons.append("Handles the informative categorical features natively")
         
         return score, reasons
@@ -0,0 +1,116 @@
+import numpy as np
+from typing import Dict, Any, List
+from src.target_profile import problem_type_of # Re-exported: history/ranker read the problem type from here
+
+
+class FingerprintVectorizer:
+    """
+    Turns a DatasetAnalyzer result into a fixed-length numeric "fingerprint"
+    that can be compared across datasets.
+
+    Meta-features are kept as a named dict (what gets persisted) and only turned
+    into a vector at comparison time, so stored history survives new features
+    being added here (unknown features default to 0).
+    """
+
+    # All features are on roughly unit scale (log10 sizes, ratios, |r|) so raw
+    # Euclidean distance is meaningful without a fitted scaler
+    feature_names: List[str] = [
+        "log_rows",
+        "log_columns",
+        "numerical_ratio",
+        "categorical_ratio",
+        "datetime_ratio",
+        "bool_ratio",
+        "missing_ratio",
+        "missing_columns_ratio",
+        "mean_abs_skew",
+        "max_abs_skew",
+        "mean_abs_corr",
+        "max_abs_corr",
+        "log_classes",
+        "minority_class_ratio",
+        "is_imbalanced",
+    ]
+
+    # Derived from the target column; an analysis made without a target has them all at 0
+    target_feature_names: List[str] = ["log_classes", "minority_class_ratio", "is_imbalanced"]
+
+    # Analyzer sections extract() reads; callers can compute just these
+    required_sections: List[str] = ["basic_stats", "feature_types", "missing_stats", "imbalance_stats", "skewness", "correlations"]
+
+    def extract(self, analysis: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Extracts named meta-features from an analysis result.
+
+        Args:
+            analysis: The dictionary output from DatasetAnalyzer.
+
+        Returns:
+            Dictionary of meta-feature name -> float.
+        """
+        basic_stats = analysis.get("basic_stats") or {}
+        feature_types = analysis.get("feature_types") or {}
+        missing_stats = analysis.get("missing_stats") or {}
+        imbalance_stats = analysis.get("imbalance_stats") or {}
+
+        n_rows = basic_stats.get("n_rows") or 0
+        n_columns = basic_stats.get("n_columns") or 0
+        n_typed = max(n_columns, 1)
+
+        # Skewness is unbounded; log1p keeps one extreme column from dominating the distance
+        skew = self._finite(list((analysis.get("skewness") or {}).values()))
+        abs_skew = np.log1p(np.abs(skew)) if skew.size else skew
+        abs_corr = self._off_diagonal_abs_corr(analysis.get("correlations") or {})
+
+        class_distribution = imbalance_stats.get("class_distribution") or {}
+        shares = self._finite(list(class_distribution.values()))
+
+        return {
+            "log_rows": float(np.log10(n_rows + 1)),
+            "log_columns": float(np.log10(n_columns + 1)),
+            "numerical_ratio": float(feature_types.get("numerical", 0)) / n_typed,
+            "categorical_ratio": float(feature_types.get("categorical", 0)) / n_typed,
+            "datetime_ratio": float(feature_types.get("datetime", 0)) / n_typed,
+            "bool_ratio": float(feature_types.get("bool", 0)) / n_typed,
+            "missing_ratio": float(missing_stats.get("missing_ratio") or 0.0),
+            "missing_columns_ratio": len(missing_stats.get("columns_with_missing") or []) / n_typed,
+            "mean_abs_skew": float(abs_skew.mean()) if abs_skew.size else 0.0,
+            "max_abs_skew": float(abs_skew.max()) if abs_skew.size else 0.0,
+            "mean_abs_corr": float(abs_corr.mean()) if abs_corr.size else 0.0,
+            "max_abs_corr": float(abs_corr.max()) if abs_corr.size else 0.0,
+            "log_classes": float(np.log10((imbalance_stats.get("num_classes") or 0) + 1)),
+            "minority_class_ratio": float(shares.min()) if shares.size else 0.0,
+            "is_imbalanced": 1.0 if imbalance_stats.get("is_imbalanced") else 0.0,
+        }
+
+    def ignored_features(self, analysis: Dict[str, Any]) -> List[str]:
+        """
+        Features to leave out when comparing this analysis with others: the target-derived
+        ones when it was computed without a target (their zeros are unknowns, not values).
+        """
+        return [] if analysis.get("imbalance_stats") else list(self.target_feature_names)
+
+    @staticmethod
+    def _finite(values: List[Any]) -> np.ndarray:
+        """Float array of the values with None/NaN/inf dropped (analysis may come back through JSON)."""
+        arr = np.array([v for v in values if v is not None], dtype=np.float64)
+        return arr[np.isfinite(arr)]
+
+    @staticmethod
+    def _off_diagonal_abs_corr(correlations: Dict[str, Dict[str, Any]]) -> np.ndarray:
+        """Upper-triangle |r| values of the correlation matrix."""
+        columns = list(correlations.keys())
+        if len(columns) < 2:
+            return np.array([])
+        matrix = np.array([[correlations[a].get(b) for b in columns] for a in columns], dtype=np.float64)
+        upper = np.abs(matrix[np.triu_indices(len(columns), k=1)])
+        return upper[np.isfinite(upper)]
+
+    def vectorize(self, meta_features: Dict[str, float]) -> np.ndarray:
+        """Orders a meta-feature dict into a float vector (missing features -> 0)."""
+        return np.array([meta_features.get(name, 0.0) or 0.0 for name in self.feature_names], dtype=np.float64)
+
+    def transform(self, analysis: Dict[str, Any]) -> np.ndarray:
+        """Shortcut for vectorize(extract(analysis))."""
+        return self.vectorize(self.extract(analysis))
@@ -0,0 +1,103 @@
+import json
+import os
+import time
+from typing import List, Dict, Any, Optional, Iterable
+from src.meta.fingerprint import FingerprintVectorizer, problem_type_of
+from src.meta.index import FingerprintIndex
+
+
+class BenchmarkHistory:
+    """
+    Local append-only store of benchmark results, each saved next to the
+    fingerprint of the dataset it was measured on.
+
+    Stored as JSON lines so appends are cheap and the file stays readable.
+    """
+
+    def __init__(self, path: str = os.path.join("meta_store", "benchmark_history.jsonl"),
+                 index: Optional[FingerprintIndex] = None):
+        """
+        Args:
+            path: Location of the JSONL file (created on first write).
+            index: Optional nearest-neighbour index; each recorded benchmark adds one
+                   fingerprint with its winning algorithm.
+        """
+        self.path = path
+        self.index = index
+        self.vectorizer = FingerprintVectorizer()
+        self._records: Optional[List[Dict[str, Any]]] = None
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Returns all stored records (read from disk once, then kept in memory)."""
+        if self._records is None:
+            self._records = []
+            if os.path.exists(self.path):
+                with open(self.path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            self._records.append(json.loads(line))
+                        except json.JSONDecodeError:
+                            continue  # Skip a partially written line rather than losing the whole store
+        return self._records
+
+    def record(self, analysis: Dict[str, Any], results: Iterable[Dict[str, Any]], dataset_name: Optional[str] = None) -> int:
+        """
+        Persists successful benchmark rows together with the dataset fingerprint.
+
+        Args:
+            analysis: The DatasetAnalyzer output for the benchmarked dataset.
+            results: Rows as produced by AutoMLRunner.run_benchmark (records orientation).
+            dataset_name: Optional label (e.g. the uploaded filename).
+
+        Returns:
+            Number of records written.
+        """
+        meta_features = self.vectorizer.extract(analysis)
+        problem_type = problem_type_of(analysis)
+        timestamp = time.time()
+
+        new_records = []
+        for row in results:
+            if row.get("Status") != "Success":
+                continue
+            new_records.append({
+                "dataset": dataset_name,
+                "problem_type": problem_type,
+                "meta_features": meta_features,
+                "algorithm": row["Algorithm"],
+                "metric": row["Metric"],
+                "score": float(row["Value"]),
+                "fit_time": float(row.get("Fit Time") or 0.0),
+                "timestamp": timestamp,
+            })
+
+        if not new_records:
+            return 0
+
+        records = self.load()  # Read existing lines before appending so they are not counted twice
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for rec in new_records:
+                f.write(json.dumps(rec) + "\n")
+
+        records.extend(new_records)
+
+        if self.index is not None:
+            best = max(new_records, key=lambda r: r["score"])
+            self.index.add(self.vectorizer.vectorize(meta_features), {
+                "dataset": dataset_name,
+                "problem_type": problem_type,
+                "best_algorithm": best["algorithm"],
+                "best_score": best["score"],
+                "metric": best["metric"],
+                "timestamp": timestamp,
+            })
+        return len(new_records)
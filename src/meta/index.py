@@ -0,0 +1,177 @@
+import json
+import os
+import numpy as np
+from typing import List, Dict, Any, Optional
+from src.meta.fingerprint import FingerprintVectorizer
+
+
+class FingerprintIndex:
+    """
+    On-disk nearest-neighbour index over dataset fingerprints.
+
+    Layout of the index directory:
+        header.json  - dimension, row count and the feature names the vectors were built with
+        vectors.f32  - float32 memmap (capacity x dim), grown by doubling on insert
+        norms.f32    - float32 memmap of squared row norms, so brute-force search is one matrix-vector product
+        meta.jsonl   - one JSON line of metadata per row (dataset, best algorithm, ...)
+        offsets.i64  - int64 memmap of byte offsets into meta.jsonl for random access
+    """
+
+    def __init__(self, directory: str = os.path.join("meta_store", "fingerprint_index"),
+                 feature_names: Optional[List[str]] = None, initial_capacity: int = 1024):
+        """
+        Args:
+            directory: Where the index files live (created on first insert).
+            feature_names: Fingerprint layout; defaults to FingerprintVectorizer.feature_names.
+            initial_capacity: Rows pre-allocated when a new index is created.
+        """
+        self.directory = directory
+        self.feature_names = list(feature_names or FingerprintVectorizer.feature_names)
+        self.dim = len(self.feature_names)
+        self.initial_capacity = initial_capacity
+        self.count = 0
+        self.capacity = 0
+        self._vectors: Optional[np.memmap] = None
+        self._norms: Optional[np.memmap] = None
+        self._offsets: Optional[np.memmap] = None
+        self._ball_tree = None
+
+        header = self._read_header()
+        if header is not None:
+            if header["feature_names"] != self.feature_names:
+                raise ValueError(f"Index at {directory} was built with different fingerprint features; rebuild it.")
+            self.count = header["count"]
+            self.capacity = header["capacity"]
+            self._open(self.capacity)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _read_header(self) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(self._path("header.json")):
+            return None
+        with open(self._path("header.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_header(self):
+        tmp = self._path("header.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"dim": self.dim, "count": self.count, "capacity": self.capacity,
+                       "feature_names": self.feature_names}, f)
+        os.replace(tmp, self._path("header.json"))  # Atomic, so readers never see a half-written count
+
+    def _open(self, capacity: int):
+        """(Re)maps the data files at the given capacity, extending them on disk if needed."""
+        os.makedirs(self.directory, exist_ok=True)
+        for name, width, dtype in (("vectors.f32", self.dim, np.float32),
+                                   ("norms.f32", 1, np.float32),
+                                   ("offsets.i64", 1, np.int64)):
+            path = self._path(name)
+            size = capacity * width * np.dtype(dtype).itemsize
+            with open(path, "ab") as f:
+                if f.tell() < size:
+                    f.truncate(size)
+        self._vectors = np.memmap(self._path("vectors.f32"), dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+        self._norms = np.memmap(self._path("norms.f32"), dtype=np.float32, mode="r+", shape=(capacity,))
+        self._offsets = np.memmap(self._path("offsets.i64"), dtype=np.int64, mode="r+", shape=(capacity,))
+        self.capacity = capacity
+
+    def add(self, vector: np.ndarray, metadata: Dict[str, Any]) -> int:
+        """
+        Appends one fingerprint.
+
+        Args:
+            vector: Fingerprint of length dim (see FingerprintVectorizer.transform).
+            metadata: JSON-serialisable info returned with search hits.
+
+        Returns:
+            Row id of the inserted fingerprint.
+        """
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        if vector.shape[0] != self.dim:
+            raise ValueError(f"Expected fingerprint of length {self.dim}, got {vector.shape[0]}")
+
+        if self.count >= self.capacity:
+            self._open(max(self.initial_capacity, self.capacity * 2))
+
+        with open(self._path("meta.jsonl"), "ab") as f:
+            offset = f.tell()
+            f.write((json.dumps(metadata) + "\n").encode("utf-8"))
+
+        row = self.count
+        self._vectors[row] = vector
+        self._norms[row] = float(vector @ vector)
+        self._offsets[row] = offset
+        self.count += 1
+        self._ball_tree = None  # Stale; rebuilt on next ball-tree search
+        self._write_header()
+        return row
+
+    def _metadata(self, rows: np.ndarray) -> List[Dict[str, Any]]:
+        out = []
+        with open(self._path("meta.jsonl"), "rb") as f:
+            for row in rows:
+                f.seek(int(self._offsets[row]))
+                out.append(json.loads(f.readline().decode("utf-8")))
+        return out
+
+    def search(self, query: np.ndarray, k: int = 5, method: str = "brute", chunk_size: int = 262_144,
+               ignore: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Finds the k stored fingerprints closest to query (Euclidean).
+
+        Args:
+            query: Fingerprint vector.
+            k: Number of neighbours.
+            method: "brute" (chunked ||x||^2 - 2x.q + ||q||^2 scan) or "ball_tree" (sklearn BallTree,
+                    built lazily and invalidated on insert; worth it for repeated queries on a static index).
+            chunk_size: Rows scanned per block in brute mode, bounding temporary memory.
+            ignore: Feature names left out of the distance (see FingerprintVectorizer.ignored_features);
+                    searched brute force, since the ball tree is built over every feature.
+
+        Returns:
+            List of {"id", "distance", **metadata} ordered nearest first.
+        """
+        if self.count == 0 or k <= 0:
+            return []
+        q = np.asarray(query, dtype=np.float32).reshape(-1)
+        k = min(k, self.count)
+        dropped = [self.feature_names.index(name) for name in (ignore or []) if name in self.feature_names]
+        if dropped and method == "ball_tree":
+            method = "brute"
+
+        if method == "ball_tree":
+            if self._ball_tree is None:
+                from sklearn.neighbors import BallTree
+                self._ball_tree = BallTree(np.asarray(self._vectors[:self.count]))
+            dist, idx = self._ball_tree.query(q.reshape(1, -1), k=k)
+            rows, distances = idx[0], dist[0]
+        elif method == "brute":
+            q_norm = float(q @ q)
+            best_rows = np.empty(0, dtype=np.int64)
+            best_d2 = np.empty(0, dtype=np.float32)
+            for start in range(0, self.count, chunk_size):
+                stop = min(start + chunk_size, self.count)
+                d2 = self._norms[start:stop] - 2.0 * (self._vectors[start:stop] @ q) + q_norm
+                if dropped:
+                    d2 -= ((self._vectors[start:stop][:, dropped] - q[dropped]) ** 2).sum(axis=1)
+                if d2.shape[0] > k:
+                    part = np.argpartition(d2, k - 1)[:k]
+                else:
+                    part = np.arange(d2.shape[0])
+                best_rows = np.concatenate([best_rows, part + start])
+                best_d2 = np.concatenate([best_d2, d2[part]])
+                if best_rows.shape[0] > k:
+                    keep = np.argpartition(best_d2, k - 1)[:k]
+                    best_rows, best_d2 = best_rows[keep], best_d2[keep]
+            order = np.argsort(best_d2)
+            rows = best_rows[order]
+            distances = np.sqrt(np.maximum(best_d2[order], 0.0))  # Rounding can make d2 slightly negative
+        else:
+            raise ValueError(f"Unknown search method: {method}")
+
+        return [{"id": int(row), "distance": float(d), **meta}
+                for row, d, meta in zip(rows, distances, self._metadata(rows))]
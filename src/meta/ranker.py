@@ -0,0 +1,171 @@
+import numpy as np
+from typing import List, Dict, Any, Optional
+from src.algorithms.registry import AlgorithmRegistry
+from src.engine import HeuristicRanker
+from src.meta.fingerprint import FingerprintVectorizer, problem_type_of
+from src.meta.history import BenchmarkHistory
+
+# Predicted fit times below this count as equally fast: timings that small are noise,
+# and dividing by them would let one near-zero history row top the efficiency ranking
+MIN_FIT_SECONDS = 0.05
+
+
+class MetaRanker:
+    """
+    Ranks algorithms using what was actually measured on similar datasets.
+
+    A distance-weighted kNN over dataset fingerprints predicts each algorithm's
+    score and fit time; algorithms are then ordered by predicted score per second.
+    HeuristicRanker stays in charge of feasibility (hard exclusions) and is the
+    cold-start fallback whenever there is not enough history for an algorithm.
+    """
+
+    def __init__(self,
+                 history: Optional[BenchmarkHistory] = None,
+                 fallback: Optional[HeuristicRanker] = None,
+                 n_neighbors: int = 5,
+                 min_history: int = 3,
+                 objective: str = "score_per_second",
+                 min_fit_time: float = MIN_FIT_SECONDS):
+        """
+        Args:
+            history: Store of past benchmark results. Without one, the ranker is purely heuristic.
+            fallback: Ranker used for candidates, reasons and cold start.
+            n_neighbors: Number of past datasets each prediction is averaged over.
+            min_history: Records needed for an algorithm before its prediction is trusted.
+            objective: "score_per_second" (default) or "score".
+            min_fit_time: Floor (seconds) on predicted fit time in the score-per-second objective.
+        """
+        if objective not in ("score_per_second", "score"):
+            raise ValueError(f"Unknown objective: {objective}")
+        self.history = history
+        self.fallback = fallback or HeuristicRanker()
+        self.n_neighbors = n_neighbors
+        self.min_history = min_history
+        self.objective = objective
+        self.min_fit_time = min_fit_time
+        self.vectorizer = FingerprintVectorizer()
+        self._models: Dict[str, Dict[str, Dict[str, np.ndarray]]] = {}
+        self._mean = np.zeros(len(self.vectorizer.feature_names))
+        self._scale = np.ones(len(self.vectorizer.feature_names))
+        self._fitted_on = -1
+
+    def fit(self, records: Optional[List[Dict[str, Any]]] = None) -> "MetaRanker":
+        """
+        Builds the per-algorithm neighbour tables.
+
+        Args:
+            records: History records; defaults to everything in self.history.
+        """
+        if records is None:
+            records = self.history.load() if self.history is not None else []
+
+        self._models = {}
+        self._fitted_on = len(records)
+        if not records:
+            return self
+
+        X = np.vstack([self.vectorizer.vectorize(r["meta_features"]) for r in records])
+        self._mean = X.mean(axis=0)
+        scale = X.std(axis=0)
+        self._scale = np.where(scale > 0, scale, 1.0)
+        X = (X - self._mean) / self._scale
+
+        # Group rows per (problem_type, algorithm) so prediction is a handful of small array ops
+        groups: Dict[tuple, List[int]] = {}
+        for i, r in enumerate(records):
+            groups.setdefault((r["problem_type"], r["algorithm"]), []).append(i)
+
+        for (problem_type, algo_name), idx in groups.items():
+            idx = np.asarray(idx)
+            self._models.setdefault(problem_type, {})[algo_name] = {
+                "X": X[idx],
+                "score": np.array([records[i]["score"] for i in idx], dtype=np.float64),
+                # Fit time is averaged in log space; clamp so instant fits don't dominate
+                "log_time": np.log(np.maximum([records[i]["fit_time"] for i in idx], 1e-4)),
+            }
+        return self
+
+    def _refresh(self):
+        """Refits when the history has grown since the last fit."""
+        if self.history is not None and len(self.history) != self._fitted_on:
+            self.fit()
+
+    def predict(self, analysis_result: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+        """
+        Predicts score and fit time for every algorithm with enough history.
+
+        Args:
+            analysis_result: The dictionary output from DatasetAnalyzer.
+
+        Returns:
+            {algorithm name: {"score": float, "fit_time": float, "support": int}}
+        """
+        self._refresh()
+        models = self._models.get(problem_type_of(analysis_result), {})
+        if not models:
+            return {}
+
+        q = (self.vectorizer.transform(analysis_result) - self._mean) / self._scale
+        ignored = self.vectorizer.ignored_features(analysis_result)
+        keep = np.array([name not in ignored for name in self.vectorizer.feature_names])
+        predictions = {}
+        for algo_name, table in models.items():
+            n = len(table["score"])
+            if n < self.min_history:
+                continue
+            dist = np.sqrt(((table["X"][:, keep] - q[keep]) ** 2).sum(axis=1))
+            k = min(self.n_neighbors, n)
+            nearest = np.argpartition(dist, k - 1)[:k] if k < n else np.arange(n)
+            weights = 1.0 / (dist[nearest] + 1e-6)
+            weights /= weights.sum()
+            predictions[algo_name] = {
+                "score": float(weights @ table["score"][nearest]),
+                "fit_time": float(np.exp(weights @ table["log_time"][nearest])),
+                "support": int(k),
+            }
+        return predictions
+
+    def rank(self, analysis_result: Dict[str, Any], top_k: int = 3) -> List[Dict[str, Any]]:
+        """
+        Same contract as HeuristicRanker.rank, with learned predictions where available.
+
+        Returns:
+            List of dictionaries containing {"algorithm", "score", "reasons", "source"}
+            plus "predicted_score"/"predicted_fit_time" for history-backed entries.
+        """
+        # Full feasible candidate list from the heuristic (keeps hard exclusions and reasons)
+        candidates = self.fallback.rank(analysis_result, top_k=AlgorithmRegistry.count())
+        predictions = self.predict(analysis_result)
+
+        if not predictions:
+            for rec in candidates:
+                rec["source"] = "heuristic"
+            return candidates[:top_k]
+
+        learned, heuristic = [], []
+        for rec in candidates:
+            pred = predictions.get(rec["algorithm"].name)
+            if pred is None:
+                rec["source"] = "heuristic"
+                heuristic.append(rec)
+                continue
+            efficiency = pred["score"] / max(pred["fit_time"], self.min_fit_time)
+            learned.append({
+                "algorithm": rec["algorithm"],
+                # Keep "score" on the same 0-100 scale the frontend shows as confidence
+                "score": float(np.clip(pred["score"] * 100, 0, 100)),
+                "reasons": [
+                    f"Predicted score {pred['score']:.3f} in ~{pred['fit_time']:.2f}s "
+                    f"(from {pred['support']} similar past benchmarks)"
+                ] + rec["reasons"],
+                "predicted_score": pred["score"],
+                "predicted_fit_time": pred["fit_time"],
+                "efficiency": efficiency,
+                "source": "meta",
+            })
+
+        sort_key = "efficiency" if self.objective == "score_per_second" else "predicted_score"
+        learned.sort(key=lambda x: x[sort_key], reverse=True)
+        # Algorithms we have no measurements for keep their heuristic order after the learned ones
+        return (learned + heuristic)[:top_k]
@@ -0,0 +1,133 @@
+import cProfile
+import json
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Mapping
+
+PROFILE_DIR = "profiles"
+PROFILE_ENV_VAR = "MALGOCAT_PROFILE"
+_PROFILE_ID = re.compile(r"^[0-9a-f]{32}$")
+
+# cProfile and tracemalloc are process-wide; only one profiled request at a time
+_active = threading.Lock()
+
+
+def profiling_requested(headers: Mapping[str, str], query: Mapping[str, str]) -> bool:
+    """
+    True when a request asked for profiling ("X-Profile: 1" header or "?profile=1"),
+    or when MALGOCAT_PROFILE=1 enables it for every request.
+    """
+    if os.environ.get(PROFILE_ENV_VAR, "0") == "1":
+        return True
+    return headers.get("x-profile") == "1" or query.get("profile") in ("1", "true")
+
+
+def valid_profile_id(profile_id: str) -> bool:
+    """Profile ids are uuid4 hex strings; anything else is rejected before touching the filesystem."""
+    return bool(_PROFILE_ID.match(profile_id))
+
+
+class ProfileSession:
+    """
+    Collects a cProfile trace and tracemalloc allocation sites for one pipeline
+    run and stores them under PROFILE_DIR/<id>/.
+
+    Artifacts:
+        profile.prof  - pstats dump (open with snakeviz, pstats, etc.)
+        summary.json  - top-N functions by cumulative time and top-N allocation sites
+    """
+
+    def __init__(self, label: str, output_dir: str = PROFILE_DIR, top_n: int = 25):
+        """
+        Args:
+            label: Pipeline name stored in the summary (e.g. "analyze").
+            output_dir: Root directory for artifacts.
+            top_n: Number of functions / allocation sites kept in the summary.
+        """
+        self.id = uuid.uuid4().hex
+        self.label = label
+        self.directory = os.path.join(output_dir, self.id)
+        self.top_n = top_n
+        self.summary: Optional[Dict[str, Any]] = None
+
+    @contextmanager
+    def run(self):
+        profiler = cProfile.Profile()
+        owns_tracemalloc = not tracemalloc.is_tracing()
+        if owns_tracemalloc:
+            tracemalloc.start(10)
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield self
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - start
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            if owns_tracemalloc:
+                tracemalloc.stop()
+            self._save(profiler, snapshot, elapsed, peak)
+
+    def _save(self, profiler: cProfile.Profile, snapshot: tracemalloc.Snapshot, elapsed: float, peak: int):
+        os.makedirs(self.directory, exist_ok=True)
+        profiler.dump_stats(os.path.join(self.directory, "profile.prof"))
+
+        stats = pstats.Stats(profiler)
+        functions = []
+        for (filename, line, func), (cc, nc, tt, ct, _) in stats.stats.items():
+            functions.append({"function": f"{filename}:{line}({func})", "ncalls": nc, "primitive_calls": cc,
+                              "tottime": tt, "cumtime": ct})
+        functions.sort(key=lambda f: f["cumtime"], reverse=True)
+
+        # Skip our own frames so the summary shows the pipeline's allocations
+        snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__),
+                                           tracemalloc.Filter(False, __file__)])
+        allocations = [{"site": str(s.traceback[0]), "size_kb": s.size / 1024, "count": s.count}
+                       for s in snapshot.statistics("lineno")[:self.top_n]]
+
+        self.summary = {
+            "id": self.id,
+            "label": self.label,
+            "created_at": time.time(),
+            "wall_seconds": elapsed,
+            "peak_traced_mb": peak / 1024 ** 2,
+            "top_functions": functions[:self.top_n],
+            "top_allocations": allocations,
+        }
+        with open(os.path.join(self.directory, "summary.json"), "w", encoding="utf-8") as f:
+            json.dump(self.summary, f, indent=2)
+
+
+@contextmanager
+def maybe_profile(enabled: bool, label: str, output_dir: str = PROFILE_DIR):
+    """
+    Profiles the block when enabled; otherwise yields None and adds no work.
+
+    Yields:
+        The ProfileSession (its .id identifies the artifacts) or None.
+    """
+    if not enabled or not _active.acquire(blocking=False):
+        yield None
+        return
+    try:
+        session = ProfileSession(label, output_dir=output_dir)
+        with session.run():
+            yield session
+    finally:
+        _active.release()
+
+
+def load_summary(profile_id: str, output_dir: str = PROFILE_DIR) -> Optional[Dict[str, Any]]:
+    """Reads a stored summary, or None if the id is unknown."""
+    path = os.path.join(output_dir, profile_id, "summary.json")
+    if not valid_profile_id(profile_id) or not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
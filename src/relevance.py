@@ -0,0 +1,239 @@
+import time
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+# Defaults keep a full pass well under a second on wide frames
+MAX_SAMPLE_ROWS = 50_000
+N_BINS = 16            # Quantile bins for numeric features (and a numeric target)
+MAX_CATEGORIES = 64    # Rarer categories share one "other" bin
+COLUMN_BLOCK = 64      # Columns per vectorized histogram pass; the time budget is checked between blocks
+# A feature explaining this share of the target's entropy (or variance) on its own is a leakage suspect
+LEAKAGE_THRESHOLD = 0.98
+# Categorical columns with at least this share of distinct values are row identifiers: their MI is spurious
+ID_LIKE_SHARE = 0.9
+
+
+def quantile_codes(values: np.ndarray, n_bins: int = N_BINS) -> np.ndarray:
+    """
+    Bins each column of a float matrix into equal-frequency bins (0..n_bins-1).
+    NaN gets its own bin, n_bins.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        return quantile_codes(values[:, None], n_bins)[:, 0]
+    codes = np.full(values.shape, n_bins, dtype=np.int64)
+    # All-NaN columns keep every row in the NaN bin (nanquantile would warn on them)
+    filled = ~np.isnan(values).all(axis=0)
+    edges = np.full((n_bins - 1, values.shape[1]), np.nan)
+    if filled.any():
+        edges[:, filled] = np.nanquantile(values[:, filled], np.linspace(0, 1, n_bins + 1)[1:-1], axis=0)
+    for j in range(values.shape[1]):
+        column = values[:, j]
+        present = ~np.isnan(column)
+        if present.any():
+            codes[present, j] = np.searchsorted(np.unique(edges[:, j]), column[present], side="right")
+    return codes
+
+
+def category_codes(column: pd.Series, max_categories: int = MAX_CATEGORIES) -> np.ndarray:
+    """Codes for the most frequent categories; the rest share one bin, missing another."""
+    codes, uniques = pd.factorize(column, use_na_sentinel=True)
+    if len(uniques) >= max_categories:
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        keep = np.argsort(-counts, kind="stable")[:max_categories - 1]
+        remap = np.full(len(uniques), max_categories - 1)
+        remap[keep] = np.arange(len(keep))
+        codes = np.where(codes >= 0, remap[np.maximum(codes, 0)], -1)
+    return np.where(codes < 0, max_categories, codes).astype(np.int64)
+
+
+def _entropy(counts: np.ndarray, axis: int = -1) -> np.ndarray:
+    total = counts.sum(axis=axis, keepdims=True)
+    p = np.divide(counts, total, out=np.zeros(counts.shape), where=total > 0)
+    return -(p * np.log(p, out=np.zeros(p.shape), where=p > 0)).sum(axis=axis)
+
+
+def mutual_information(x_codes: np.ndarray, y_codes: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Binned mutual information between each column of x_codes (n, p) and y_codes (n,),
+    from one joint histogram per column computed in a single np.bincount.
+
+    Returns:
+        {"mi": Miller-Madow corrected MI in nats, "uncertainty": MI / H(y) (share of the
+         target's entropy a feature explains), "n_bins": occupied feature bins}
+    """
+    n, p = x_codes.shape
+    n_x = int(x_codes.max()) + 1 if x_codes.size else 1
+    n_y = int(y_codes.max()) + 1
+    # Joint histogram tensor (p, n_x, n_y) via flat indices
+    flat = (np.arange(p)[None, :] * n_x + x_codes) * n_y + y_codes[:, None]
+    joint = np.bincount(flat.ravel(), minlength=p * n_x * n_y).reshape(p, n_x, n_y).astype(float)
+    h_y = float(_entropy(np.bincount(y_codes, minlength=n_y).astype(float)))
+    h_x = _entropy(joint.sum(axis=2))
+    h_xy = _entropy(joint.reshape(p, -1))
+    mi = h_x + h_y - h_xy
+
+    # Miller-Madow bias correction: small samples and many bins inflate plug-in MI
+    occupied_x = (joint.sum(axis=2) > 0).sum(axis=1)
+    occupied_y = int((np.bincount(y_codes, minlength=n_y) > 0).sum())
+    mi = np.maximum(mi - (occupied_x - 1) * (occupied_y - 1) / (2.0 * max(n, 1)), 0.0)
+    uncertainty = mi / h_y if h_y > 0 else np.zeros(p)
+    return {"mi": mi, "uncertainty": np.minimum(uncertainty, 1.0), "n_bins": occupied_x}
+
+
+def correlation_ratio(codes: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Correlation ratio eta (0..1) of numeric `values` (n,) across the categories in each
+    column of codes (n, p): sqrt(between-group variance / total variance).
+    """
+    values = np.asarray(values, dtype=float)
+    n, p = codes.shape
+    total = ((values - values.mean()) ** 2).sum()
+    if total == 0:
+        return np.zeros(p)
+    n_groups = int(codes.max()) + 1
+    flat = (np.arange(p)[None, :] * n_groups + codes).ravel()
+    counts = np.bincount(flat, minlength=p * n_groups).reshape(p, n_groups)
+    sums = np.bincount(flat, weights=np.repeat(values, p), minlength=p * n_groups).reshape(p, n_groups)
+    means = np.divide(sums, counts, out=np.zeros(sums.shape), where=counts > 0)
+    between = (counts * (means - values.mean()) ** 2).sum(axis=1)
+    return np.sqrt(np.clip(between / total, 0.0, 1.0))
+
+
+def target_relevance(df: pd.DataFrame, target: str, is_classification: bool,
+                     max_rows: int = MAX_SAMPLE_ROWS, time_budget: Optional[float] = 2.0,
+                     seed: int = 0) -> Dict[str, Any]:
+    """
+    Relates every feature to the target in O(rows x cols): binned mutual information for
+    all features, correlation ratios for categorical features against a numeric target
+    (and numeric features across classes), Pearson r where it is defined, and a leakage
+    check for features that (almost) determine the target on their own.
+
+    Args:
+        df: Dataset including the target column.
+        target: Target column name.
+        is_classification: Treat the target as classes (else it is binned into quantiles).
+        max_rows: Rows sampled (uniformly) before computing anything.
+        time_budget: Seconds; columns left when it runs out are skipped ("truncated").
+        seed: Sampling seed.
+
+    Returns:
+        {"sample_rows", "truncated", "columns_evaluated", "elapsed", "features": {col: {...}},
+         "top_features", "leakage_suspects", "max_uncertainty", "mean_uncertainty", "nonlinear_features"};
+        top_features and the uncertainty summaries leave out ID-like categorical columns.
+    """
+    start = time.perf_counter()
+    data = df[df[target].notna()]
+    if len(data) > max_rows:
+        data = data.sample(n=max_rows, random_state=seed)
+    y_raw = data[target]
+    features = [c for c in data.columns if c != target]
+
+    y_numeric = pd.api.types.is_numeric_dtype(y_raw.dtype) and not pd.api.types.is_bool_dtype(y_raw.dtype)
+    if is_classification:
+        y_codes = category_codes(y_raw, max_categories=max(MAX_CATEGORIES, 2))
+    else:
+        y_codes = quantile_codes(y_raw.to_numpy(dtype=float))
+    y_values = y_raw.to_numpy(dtype=float) if y_numeric else None
+    # Pearson r is meaningful for a numeric target and for binary classes
+    r_target = y_values if y_numeric and (not is_classification or y_raw.nunique() == 2) else None
+
+    numeric = [c for c in features if pd.api.types.is_numeric_dtype(data[c].dtype) and not pd.api.types.is_bool_dtype(data[c].dtype)]
+    categorical = [c for c in features if c not in set(numeric)]
+    # Nothing to relate in an all-missing column (and its quantiles/means are undefined)
+    numeric = [c for c in numeric if data[c].notna().any()]
+
+    results: Dict[str, Dict[str, Any]] = {}
+    truncated = False
+    for kind, columns in (("numeric", numeric), ("categorical", categorical)):
+        for offset in range(0, len(columns), COLUMN_BLOCK):
+            if time_budget is not None and time.perf_counter() - start > time_budget:
+                truncated = True
+                break
+            block = columns[offset:offset + COLUMN_BLOCK]
+            if kind == "numeric":
+                values = data[block].to_numpy(dtype=float)
+                codes = quantile_codes(values)
+            else:
+                codes = np.column_stack([category_codes(data[c]) for c in block])
+                id_like = [data[c].nunique() >= ID_LIKE_SHARE * len(data) for c in block]
+            info = mutual_information(codes, y_codes)
+
+            eta = None
+            if kind == "categorical" and y_values is not None and not is_classification:
+                eta = correlation_ratio(codes, y_values)
+            elif kind == "numeric" and is_classification:
+                # How much of each feature's variance the classes explain
+                filled = np.where(np.isnan(values), np.nanmean(values, axis=0), values)
+                eta = np.array([correlation_ratio(y_codes[:, None], filled[:, j])[0] for j in range(len(block))])
+            pearson = None
+            if kind == "numeric" and r_target is not None:
+                pearson = _pearson(values, r_target)
+
+            for j, col in enumerate(block):
+                results[col] = {
+                    "kind": kind,
+                    "mutual_information": float(info["mi"][j]),
+                    "uncertainty": float(info["uncertainty"][j]),
+                    "correlation_ratio": None if eta is None else float(eta[j]),
+                    "pearson": None if pearson is None or np.isnan(pearson[j]) else float(pearson[j]),
+                    "id_like": kind == "categorical" and bool(id_like[j]),
+                }
+        if truncated:
+            break
+
+    leakage = _leakage_suspects(results)
+    # ID-like columns "explain" any target on a sample; they stay in features but are not ranked
+    informative = [c for c, r in results.items() if not r["id_like"]]
+    ranked = sorted(informative, key=lambda c: results[c]["uncertainty"], reverse=True)
+    uncertainties = [results[c]["uncertainty"] for c in informative]
+    return {
+        "sample_rows": int(len(data)),
+        "truncated": truncated,
+        "columns_evaluated": len(results),
+        "elapsed": time.perf_counter() - start,
+        "features": results,
+        "top_features": ranked[:10],
+        "leakage_suspects": leakage,
+        "max_uncertainty": float(max(uncertainties)) if uncertainties else 0.0,
+        "mean_uncertainty": float(np.mean(uncertainties)) if uncertainties else 0.0,
+        # Informative (MI) but not linearly related: favours non-linear models
+        "nonlinear_features": [c for c, r in results.items()
+                               if r["uncertainty"] >= 0.05 and r["pearson"] is not None and abs(r["pearson"]) < 0.1],
+    }
+
+
+def _pearson(values: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """Pearson r of each column against target, ignoring NaN rows per column."""
+    present = ~np.isnan(values)
+    count = present.sum(axis=0)
+    x = np.where(present, values, 0.0)
+    t = np.where(present, target[:, None], 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_x, mean_t = x.sum(axis=0) / count, t.sum(axis=0) / count
+        cov = (x * t).sum(axis=0) / count - mean_x * mean_t
+        var_x = (x * x).sum(axis=0) / count - mean_x ** 2
+        var_t = (t * t).sum(axis=0) / count - mean_t ** 2
+        return cov / np.sqrt(var_x * var_t)
+
+
+def _leakage_suspects(results: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    suspects = []
+    for col, r in results.items():
+        reasons = []
+        if r["uncertainty"] >= LEAKAGE_THRESHOLD:
+            reasons.append(f"explains {r['uncertainty']:.0%} of the target's entropy")
+        if r["correlation_ratio"] is not None and r["kind"] == "categorical" and r["correlation_ratio"] ** 2 >= LEAKAGE_THRESHOLD:
+            reasons.append(f"categories explain {r['correlation_ratio'] ** 2:.0%} of the target's variance")
+        if r["pearson"] is not None and r["pearson"] ** 2 >= LEAKAGE_THRESHOLD:
+            reasons.append(f"Pearson r = {r['pearson']:.3f}")
+        if not reasons:
+            continue
+        # A column unique per row trivially "predicts" anything; that's an ID, not leakage
+        if r["id_like"]:
+            continue
+        suspects.append({"column": col, "score": max(r["uncertainty"], (r["pearson"] or 0.0) ** 2,
+                                                     (r["correlation_ratio"] or 0.0) ** 2 if r["kind"] == "categorical" else 0.0),
+                         "reason": "; ".join(reasons)})
+    return sorted(suspects, key=lambda s: s["score"], reverse=True)
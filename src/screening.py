@@ -0,0 +1,121 @@
+import time
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+# A column whose most frequent value covers at least this share of rows is near-constant
+NEAR_CONSTANT_SHARE = 0.99
+# Integer/string columns with at least this share of distinct values look like row identifiers
+ID_UNIQUE_RATIO = 0.95
+# ID detection needs enough rows for "all distinct" to mean anything
+MIN_ID_ROWS = 50
+
+
+def _weights(n: int, seed: int) -> np.ndarray:
+    """Fixed odd uint64 multipliers, one per position."""
+    return np.random.default_rng(seed).integers(0, 2 ** 63, size=n, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+
+
+def _is_id_dtype(dtype) -> bool:
+    # Floats are continuous measurements, where "all distinct" is normal
+    return (pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_object_dtype(dtype)
+            or pd.api.types.is_string_dtype(dtype))
+
+
+def screen_columns(df: pd.DataFrame, target: Optional[str] = None, near_constant: float = NEAR_CONSTANT_SHARE,
+                   id_ratio: float = ID_UNIQUE_RATIO) -> Dict[str, Any]:
+    """
+    Finds columns that carry no usable signal, in one hashing pass per column:
+    each column's values are hashed with pd.util.hash_array, the sorted hashes give
+    its distinct count and dominant-value share (the value-count sketch), a
+    position-weighted sum gives a content signature for duplicate detection, and
+    the same hashes combined across columns give row hashes for duplicate rows.
+
+    Args:
+        df: Dataset.
+        target: Target column; never flagged.
+        near_constant: Dominant-value share above which a column is near-constant.
+        id_ratio: Distinct-value share above which an integer/string column is ID-like.
+
+    Returns:
+        {"constant_columns", "near_constant_columns": {col: share}, "duplicate_columns": {col: kept twin},
+         "id_columns", "duplicate_rows", "drop" (all flagged columns), "n_rows", "n_columns", "elapsed"}
+    """
+    start = time.perf_counter()
+    n = len(df)
+    weights = _weights(n, seed=0)
+    column_weights = _weights(df.shape[1], seed=1)
+    row_hashes = np.zeros(n, dtype=np.uint64)
+    signatures: Dict[Any, List[Any]] = {}
+    report: Dict[str, Any] = {"constant_columns": [], "near_constant_columns": {}, "duplicate_columns": {},
+                              "id_columns": []}
+
+    with np.errstate(over="ignore"):
+        for j, col in enumerate(df.columns):
+            series = df[col]
+            hashes = pd.util.hash_array(series.to_numpy())
+            row_hashes += hashes * column_weights[j]
+            if col == target or n == 0:
+                continue
+
+            ordered = np.sort(hashes)
+            boundaries = np.flatnonzero(ordered[1:] != ordered[:-1]) + 1
+            n_unique = len(boundaries) + 1
+            if n_unique == 1:
+                report["constant_columns"].append(col)
+                continue
+            top_share = np.diff(np.concatenate(([0], boundaries, [n]))).max() / n
+            if top_share >= near_constant:
+                report["near_constant_columns"][col] = float(top_share)
+                continue
+            if n >= MIN_ID_ROWS and n_unique >= id_ratio * n and _is_id_dtype(series.dtype):
+                report["id_columns"].append(col)
+                continue
+
+            # Same signature -> confirm with an exact comparison (hash collisions are possible, just unlikely)
+            signature = (str(series.dtype), int((hashes * weights).sum()))
+            twin = next((other for other in signatures.get(signature, []) if series.equals(df[other])), None)
+            if twin is not None:
+                report["duplicate_columns"][col] = twin
+            else:
+                signatures.setdefault(signature, []).append(col)
+
+    report["duplicate_rows"] = int(pd.Series(row_hashes).duplicated().sum()) if n else 0
+    report["drop"] = (report["constant_columns"] + list(report["near_constant_columns"])
+                      + report["id_columns"] + list(report["duplicate_columns"]))
+    report.update(n_rows=n, n_columns=df.shape[1], elapsed=time.perf_counter() - start)
+    return report
+
+
+def apply_screening(df: pd.DataFrame, report: Dict[str, Any], drop_duplicate_rows: bool = False) -> pd.DataFrame:
+    """Drops the report's flagged columns (and optionally repeated rows, keeping the first)."""
+    pruned = df.drop(columns=report["drop"])
+    if drop_duplicate_rows and report["duplicate_rows"]:
+        pruned = pruned[~pd.util.hash_pandas_object(df, index=False).duplicated().to_numpy()]
+    return pruned
+
+
+def pruning_summary(report: Dict[str, Any], pruned: pd.DataFrame, seconds: float = 0.0,
+                    cost_exponent: float = 1.0) -> Dict[str, Any]:
+    """
+    What screening removed, plus an estimate of the time it saved downstream.
+
+    Args:
+        report: screen_columns() output.
+        pruned: The frame after apply_screening().
+        seconds: Time the downstream work took on the pruned frame.
+        cost_exponent: How that work scales with the column count (1 for model fits,
+                       2 for pairwise statistics such as correlations).
+
+    Returns:
+        {"columns_pruned", "rows_pruned", "columns", "screening_seconds", "estimated_seconds_saved"}
+    """
+    kept_columns = max(pruned.shape[1], 1)
+    scale = (report["n_columns"] / kept_columns) ** cost_exponent * (report["n_rows"] / max(len(pruned), 1))
+    return {
+        "columns_pruned": report["n_columns"] - pruned.shape[1],
+        "rows_pruned": report["n_rows"] - len(pruned),
+        "columns": report["drop"],
+        "screening_seconds": report["elapsed"],
+        "estimated_seconds_saved": max(seconds * (scale - 1.0) - report["elapsed"], 0.0),
+    }
@@ -0,0 +1,142 @@
+import json
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List
+
+# orjson is optional: much faster, and maps NaN/inf to null natively
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_NATIVE_SCALARS = (str, int, bool, type(None))
+
+
+def array_to_list(arr: np.ndarray) -> List[Any]:
+    """
+    Converts a NumPy array to nested Python lists in bulk, with NaN/inf -> None.
+    """
+    arr = np.asarray(arr)
+    kind = arr.dtype.kind
+    if kind == "f":
+        out = arr.astype(object)
+        out[~np.isfinite(arr)] = None  # One vectorized mask instead of a per-element pd.isna
+        return out.tolist()
+    if kind in "iub":
+        return arr.tolist()
+    if kind in "mM":
+        out = arr.astype(str).astype(object)
+        out[np.isnat(arr)] = None
+        return out.tolist()
+    return to_native(arr.tolist())
+
+
+def series_to_dict(series: pd.Series) -> Dict[Any, Any]:
+    """Series -> {index: value} with JSON-native keys and values."""
+    return dict(zip(_native_keys(series.index), array_to_list(series.to_numpy())))
+
+
+def frame_to_dict(df: pd.DataFrame) -> Dict[Any, Dict[Any, Any]]:
+    """
+    Same shape as DataFrame.to_dict() ({column: {index: value}}) but converted in
+    bulk: one masked conversion of the whole block instead of one call per cell.
+    """
+    index = _native_keys(df.index)
+    columns = _native_keys(df.columns)
+    # Transpose so each column becomes one contiguous row of the list
+    rows = array_to_list(df.to_numpy().T)
+    return {col: dict(zip(index, row)) for col, row in zip(columns, rows)}
+
+
+def _native_keys(index: pd.Index) -> List[Any]:
+    return [_native_key(k) for k in index.tolist()]
+
+
+def _native_key(key: Any) -> Any:
+    if isinstance(key, _NATIVE_SCALARS) or type(key) is float:
+        return key
+    if isinstance(key, np.generic):
+        return key.item()
+    return str(key)
+
+
+def _native_scalar(obj: Any) -> Any:
+    """Converts a single non-container value that is not already a JSON-native scalar."""
+    if isinstance(obj, np.generic):
+        obj = obj.item()
+        if type(obj) is float and not np.isfinite(obj):
+            return None
+        return obj
+    if isinstance(obj, (pd.Timestamp, pd.Timedelta)):
+        return None if pd.isna(obj) else str(obj)
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    return obj
+
+
+def to_native(obj: Any) -> Any:
+    """
+    Converts an arbitrary analysis result to JSON-native Python types.
+
+    Iterative (no recursion limit on deep payloads). Native scalars are passed
+    through with a type check only. NumPy arrays and pandas objects are converted
+    in bulk with vectorized NaN masks. NaN/inf become None.
+    """
+    root = [obj]
+    stack = [(root, 0, obj)]
+    while stack:
+        parent, key, value = stack.pop()
+        t = type(value)
+        if t in _NATIVE_SCALARS:
+            continue
+        if t is float:
+            if value != value or value in (float("inf"), float("-inf")):
+                parent[key] = None
+            continue
+        if t is dict:
+            new = {}
+            parent[key] = new
+            for k, v in value.items():
+                k = _native_key(k)
+                new[k] = v
+                if type(v) not in _NATIVE_SCALARS:
+                    stack.append((new, k, v))
+            continue
+        if t is list or t is tuple:
+            new = list(value)
+            parent[key] = new
+            for i, v in enumerate(new):
+                if type(v) not in _NATIVE_SCALARS:
+                    stack.append((new, i, v))
+            continue
+        if isinstance(value, np.ndarray):
+            parent[key] = array_to_list(value)
+        elif isinstance(value, pd.DataFrame):
+            parent[key] = frame_to_dict(value)
+        elif isinstance(value, pd.Series):
+            parent[key] = series_to_dict(value)
+        elif isinstance(value, pd.Index):
+            parent[key] = array_to_list(value.to_numpy())
+        else:
+            parent[key] = _native_scalar(value)
+    return root[0]
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback for types orjson does not know (pandas objects, numpy object arrays, ...)."""
+    native = to_native(obj)
+    if native is obj:
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+    return native
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serializes to compact UTF-8 JSON bytes (NaN/inf -> null).
+
+    Uses orjson when installed, otherwise to_native + stdlib json.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_orjson_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(to_native(obj), ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
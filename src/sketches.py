@@ -0,0 +1,213 @@
+import math
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional
+
+HLL_PRECISION = 12          # 4096 one-byte registers, ~1.6% standard error
+CMS_WIDTH = 4096            # Counters per row (power of two)
+CMS_DEPTH = 4               # Independent rows; estimates take the minimum
+HEAVY_HITTER_CAPACITY = 512 # Candidate values tracked per column
+RARE_SHARE = 0.01           # Categories below this share of rows count as rare
+HIGH_CARDINALITY = 50       # Distinct values above which label codes stop making sense
+DEFAULT_CHUNKSIZE = 1_000_000
+
+# Odd 64-bit multipliers for the count-min rows (multiply-shift hashing)
+_CMS_MULTIPLIERS = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93,
+                             0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53, 0x94D049BB133111EB, 0xBF58476D1CE4E5B9],
+                            dtype=np.uint64)
+
+
+def hash_values(values: Any) -> np.ndarray:
+    """64-bit hashes of category values (compared as objects, so 1 and "1" differ)."""
+    return pd.util.hash_array(np.asarray(values, dtype=object))
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Exact bit length of uint64 values (frexp is exact on 32-bit halves)."""
+    hi = (x >> np.uint64(32)).astype(np.float64)
+    lo = (x & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(hi > 0, 32 + np.frexp(hi)[1], np.frexp(lo)[1])
+
+
+class HyperLogLog:
+    """Distinct-count sketch: 2^precision registers, merged by elementwise max."""
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray):
+        if not len(hashes):
+            return
+        rest = 64 - self.precision
+        index = (hashes >> np.uint64(rest)).astype(np.intp)
+        # Position of the first 1-bit in the remaining bits (rest + 1 when they are all zero)
+        rank = (rest + 1 - _bit_length(hashes & np.uint64((1 << rest) - 1))).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int((self.registers == 0).sum())
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros) # Linear counting is more accurate for small sets
+        return float(raw)
+
+
+class CountMinSketch:
+    """Frequency sketch: depth x width counters, merged by addition; estimates never undercount."""
+
+    def __init__(self, width: int = CMS_WIDTH, depth: int = CMS_DEPTH):
+        if width & (width - 1):
+            raise ValueError("width must be a power of two")
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+
+    def _columns(self, hashes: np.ndarray, row: int) -> np.ndarray:
+        shift = np.uint64(64 - int(math.log2(self.width)))
+        with np.errstate(over="ignore"):
+            return ((hashes * _CMS_MULTIPLIERS[row]) >> shift).astype(np.intp)
+
+    def add_hashes(self, hashes: np.ndarray):
+        for row in range(self.depth):
+            self.table[row] += np.bincount(self._columns(hashes, row), minlength=self.width)
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        self.table += other.table
+        return self
+
+    def estimate(self, hashes: np.ndarray) -> np.ndarray:
+        return np.min([self.table[row, self._columns(hashes, row)] for row in range(self.depth)], axis=0)
+
+
+class CategoricalSketch:
+    """
+    Bounded-memory profile of one categorical column, built chunk by chunk and
+    mergeable across chunks/workers: HyperLogLog distinct count, count-min
+    frequencies, and a capped set of heavy-hitter candidates (each chunk's most
+    frequent values, re-ranked by their count-min estimate).
+    """
+
+    def __init__(self, capacity: int = HEAVY_HITTER_CAPACITY):
+        self.capacity = capacity
+        self.hll = HyperLogLog()
+        self.cms = CountMinSketch()
+        self.candidates: Dict[Any, int] = {} # value -> hash
+        self.n = 0
+        self.n_missing = 0
+
+    def update(self, values: pd.Series) -> "CategoricalSketch":
+        present = values.dropna()
+        self.n_missing += len(values) - len(present)
+        self.n += len(present)
+        if len(present):
+            hashes = hash_values(present.to_numpy(dtype=object))
+            self.hll.add_hashes(hashes)
+            self.cms.add_hashes(hashes)
+            # Any value holding a meaningful share overall is among some chunk's top values
+            top = present.value_counts().index[:self.capacity]
+            self.candidates.update(zip(top, hash_values(top.to_numpy(dtype=object)).tolist()))
+            self._prune()
+        return self
+
+    def merge(self, other: "CategoricalSketch") -> "CategoricalSketch":
+        self.hll.merge(other.hll)
+        self.cms.merge(other.cms)
+        self.candidates.update(other.candidates)
+        self.n += other.n
+        self.n_missing += other.n_missing
+        self._prune()
+        return self
+
+    def _prune(self):
+        if len(self.candidates) <= self.capacity:
+            return
+        values = list(self.candidates)
+        counts = self.cms.estimate(np.fromiter(self.candidates.values(), dtype=np.uint64, count=len(values)))
+        keep = np.argsort(-counts, kind="stable")[:self.capacity]
+        self.candidates = {values[i]: self.candidates[values[i]] for i in keep}
+
+    def heavy_hitters(self, top_k: int = 10) -> List[Dict[str, Any]]:
+        """Most frequent values with their (over-)estimated counts and shares."""
+        if not self.candidates:
+            return []
+        values = list(self.candidates)
+        counts = self.cms.estimate(np.fromiter(self.candidates.values(), dtype=np.uint64, count=len(values)))
+        order = np.argsort(-counts, kind="stable")[:top_k]
+        return [{"value": values[i], "count": int(min(counts[i], self.n)),
+                 "share": float(min(counts[i], self.n) / self.n)} for i in order]
+
+    def summary(self, top_k: int = 10, rare_share: float = RARE_SHARE) -> Dict[str, Any]:
+        """
+        Returns:
+            {"n", "n_missing", "distinct", "cardinality_ratio", "heavy_hitters", "top_share",
+             "rare_share" (rows in categories below rare_share of rows), "high_cardinality"}
+        """
+        distinct = min(int(round(self.hll.estimate())), self.n)
+        hitters = self.heavy_hitters(self.capacity)
+        frequent = sum(h["count"] for h in hitters if h["share"] >= rare_share)
+        return {
+            "n": self.n,
+            "n_missing": self.n_missing,
+            "distinct": distinct,
+            "cardinality_ratio": distinct / self.n if self.n else 0.0,
+            "heavy_hitters": hitters[:top_k],
+            "top_share": hitters[0]["share"] if hitters else 0.0,
+            "rare_share": float(min(max(1.0 - frequent / self.n, 0.0), 1.0)) if self.n else 0.0,
+            "high_cardinality": distinct > HIGH_CARDINALITY,
+        }
+
+
+def categorical_columns(df: pd.DataFrame) -> List[str]:
+    """Object, string and category columns (pandas 2 and 3 string dtypes alike)."""
+    return [col for col, dtype in df.dtypes.items()
+            if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+            or isinstance(dtype, pd.CategoricalDtype)]
+
+
+def sketch_chunks(chunks: Iterable[pd.DataFrame], columns: Optional[List[str]] = None) -> Dict[str, CategoricalSketch]:
+    """
+    Sketches categorical columns over a stream of frames (e.g. pd.read_csv(..., chunksize=...)),
+    so memory is bounded by the chunk size whatever the total row count.
+    """
+    sketches: Dict[str, CategoricalSketch] = {}
+    for chunk in chunks:
+        for col in (columns if columns is not None else categorical_columns(chunk)):
+            sketches.setdefault(col, CategoricalSketch()).update(chunk[col])
+    return sketches
+
+
+def profile_categoricals(df: pd.DataFrame, exclude: Iterable[str] = (), chunksize: int = DEFAULT_CHUNKSIZE,
+                         top_k: int = 10) -> Dict[str, Any]:
+    """
+    Sketch-based cardinality/frequency profile of every categorical column in df.
+
+    Returns:
+        {"columns": {col: CategoricalSketch.summary()}, "high_cardinality_columns", "rare_heavy_columns"}
+    """
+    columns = [c for c in categorical_columns(df) if c not in set(exclude)]
+    chunks = (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize))
+    sketches = sketch_chunks(chunks, columns)
+    summaries = {col: sketches[col].summary(top_k) if col in sketches else CategoricalSketch().summary(top_k)
+                 for col in columns}
+    return {
+        "columns": summaries,
+        "high_cardinality_columns": [c for c, s in summaries.items() if s["high_cardinality"]],
+        # Many rows spread over rare values: label codes for those are mostly noise
+        "rare_heavy_columns": [c for c, s in summaries.items() if s["rare_share"] >= 0.2],
+    }
+
+
+def choose_encodings(profile: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Per-column encoding from a profile_categoricals() result: "frequency" (share of rows
+    with the value) for high-cardinality columns, "label" codes otherwise.
+    """
+    return {col: "frequency" if summary["high_cardinality"] else "label"
+            for col, summary in (profile.get("columns") or {}).items()}
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Optional
+from src.serialization import series_to_dict, to_native
+
+# Integer-like numeric targets with fewer distinct values than this are treated as class labels
+CLASSIFICATION_MAX_CLASSES = 20
+
+
+def classify_target(n_unique: int, is_numeric: bool, integer_like: bool) -> str:
+    """The one problem-type rule: non-numeric, or integer-like with few values -> classification."""
+    if not is_numeric or (integer_like and n_unique < CLASSIFICATION_MAX_CLASSES):
+        return "classification"
+    return "regression"
+
+
+def profile_series(target: pd.Series) -> Dict[str, Any]:
+    """
+    Everything the pipeline needs to know about a target, from one factorize pass:
+    distinct values and their counts give the problem type, class distribution and
+    imbalance; integer-likeness is checked on the distinct values only.
+
+    Returns:
+        {"problem_type", "sub_type", "n_unique", "n_missing", "is_numeric", "integer_like",
+         "class_distribution", "num_classes", "is_imbalanced"} for classification, or
+        {"problem_type", "n_unique", "n_missing", "is_numeric", "integer_like", "skewness"} for regression.
+    """
+    codes, uniques = pd.factorize(target, use_na_sentinel=True)
+    present = codes[codes >= 0]
+    counts = np.bincount(present, minlength=len(uniques))
+    is_numeric = pd.api.types.is_numeric_dtype(target.dtype)
+    values = np.asarray(uniques)
+    if not is_numeric:
+        integer_like = False
+    elif values.dtype.kind in "biu":
+        integer_like = True
+    else:
+        integer_like = bool(np.all(np.mod(values.astype(float), 1) == 0))
+
+    profile = {
+        "problem_type": classify_target(len(uniques), is_numeric, integer_like),
+        "n_unique": int(len(uniques)),
+        "n_missing": int(len(codes) - len(present)),
+        "is_numeric": bool(is_numeric),
+        "integer_like": integer_like,
+    }
+    if profile["problem_type"] == "regression":
+        profile["skewness"] = to_native(target.skew())
+        return profile
+
+    order = np.argsort(-counts, kind="stable") # value_counts order
+    shares = counts[order] / max(len(present), 1)
+    profile.update(
+        sub_type="binary" if len(uniques) == 2 else "multiclass",
+        class_distribution=series_to_dict(pd.Series(shares, index=uniques[order])),
+        num_classes=int(len(uniques)),
+        is_imbalanced=bool(len(shares) and (shares < (1.0 / len(shares) * 0.5)).any()),
+    )
+    if is_numeric:
+        profile["note"] = "Numeric target with low cardinality"
+    return profile
+
+
+def problem_type_of(analysis: Dict[str, Any]) -> str:
+    """
+    Problem type of an analysis result: the target profile in imbalance_stats, else an
+    explicit "problem_type", else classify_target on a {"n_unique", "dtype"} target_analysis
+    block; classification by default.
+    """
+    target_stats = analysis.get("imbalance_stats") or {}
+    for key in ("problem_type", "type"):
+        if target_stats.get(key) in ("classification", "regression"):
+            return target_stats[key]
+    if analysis.get("problem_type") in ("classification", "regression"):
+        return analysis["problem_type"]
+    target_info = analysis.get("target_analysis") or {}
+    if target_info:
+        dtype = str(target_info.get("dtype", ""))
+        is_numeric = any(kind in dtype for kind in ("int", "float", "bool"))
+        return classify_target(target_info.get("n_unique", 0), is_numeric, "float" not in dtype)
+    return "classification"
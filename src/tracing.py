@@ -0,0 +1,137 @@
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import List, Dict, Optional, Tuple
+
+# Upper bounds in seconds; covers sub-millisecond stages up to multi-minute model fits
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                                      1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# Per-request list of (stage, seconds); set by the API middleware, None outside a request
+_request_timings: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("request_timings", default=None)
+
+
+class Histogram:
+    """
+    Prometheus-style cumulative histogram with a fixed label set per series.
+    """
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...], buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], Dict[str, object]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str):
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        index = bisect_left(self.buckets, value)  # First bucket with upper bound >= value
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+            series["counts"][index] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def snapshot(self) -> Dict[Tuple[str, ...], Dict[str, object]]:
+        with self._lock:
+            return {k: {"counts": list(v["counts"]), "sum": v["sum"], "count": v["count"]} for k, v in self._series.items()}
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    def render(self) -> List[str]:
+        """Lines in Prometheus text exposition format (version 0.0.4)."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for key, series in sorted(self.snapshot().items()):
+            base = [f'{n}="{self._escape(v)}"' for n, v in zip(self.label_names, key)]
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series["counts"]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                bucket_labels = ",".join(base + ['le="%s"' % le])
+                lines.append(f"{self.name}_bucket{{{bucket_labels}}} {cumulative}")
+            label_str = "{" + ",".join(base) + "}" if base else ""
+            lines.append(f"{self.name}_sum{label_str} {series['sum']}")
+            lines.append(f"{self.name}_count{label_str} {series['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds the histograms exposed on /metrics."""
+
+    def __init__(self):
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, help_text: str, label_names: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram(name, help_text, label_names, buckets)
+            return self._histograms[name]
+
+    def render(self) -> str:
+        lines = []
+        for name in sorted(self._histograms):
+            lines.extend(self._histograms[name].render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+STAGE_SECONDS = metrics.histogram("malgocat_stage_seconds", "Time spent in each pipeline stage.", ("stage", "algorithm"))
+REQUEST_SECONDS = metrics.histogram("malgocat_request_seconds", "HTTP request latency.", ("method", "path", "status"))
+
+
+@contextmanager
+def stage(name: str, algorithm: str = ""):
+    """
+    Times a block, records it in the stage histogram and in the current request's timings.
+
+    Args:
+        name: Stage name, e.g. "analyzer.correlations".
+        algorithm: Optional algorithm label for model fit/predict stages.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        STAGE_SECONDS.observe(elapsed, stage=name, algorithm=algorithm)
+        timings = _request_timings.get()
+        if timings is not None:
+            timings.append((f"{name}.{algorithm}" if algorithm else name, elapsed))
+
+
+def traced(name: str):
+    """Decorator form of stage()."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def start_request_timings() -> List[Tuple[str, float]]:
+    """Starts collecting stage timings for the current request; returns the shared list."""
+    timings: List[Tuple[str, float]] = []
+    _request_timings.set(timings)
+    return timings
+
+
+def server_timing_header(timings: List[Tuple[str, float]]) -> str:
+    """Formats collected timings as a Server-Timing header value (durations in ms, repeated stages summed)."""
+    totals: Dict[str, float] = {}
+    for name, seconds in timings:
+        token = re.sub(r"[^A-Za-z0-9_.\-]", "_", name)
+        totals[token] = totals.get(token, 0.0) + seconds
+    return ", ".join(f"{name};dur={seconds * 1000:.2f}" for name, seconds in totals.items())
@@ -1,8 +1,25 @@
 import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 import os
+import threading
 from typing import Optional
+from src.tracing import traced
+from src.target_profile import profile_series
+
+# matplotlib/seaborn take ~0.5s to import; they load on first plot (or the API's startup pre-warm)
+_plotting = None
+_plotting_lock = threading.Lock()
+
+def load_plotting():
+    """Imports pyplot and seaborn once and applies the theme. Returns (plt, sns)."""
+    global _plotting
+    if _plotting is None:
+        with _plotting_lock:
+            if _plotting is None:
+                import matplotlib.pyplot as plt
+                import seaborn as sns
+                sns.set_theme(style="whitegrid")
+                _plotting = (plt, sns)
+    return _plotting
 
 class DatasetVisualizer:
     """
@@ -12,11 +29,10 @@ class DatasetVisualizer:
     def __init__(self, df: pd.DataFrame, target_column: Optional[str] = None):
         self.df = df
         self.target_column = target_column
-        # Set style
-        sns.set_theme(style="whitegrid")
 
     def _save_plot(self, fig, filename: str, output_dir: str):
         if output_dir:
+            plt, _ = load_plotting()
             os.makedirs(output_dir, exist_ok=True)
             path = os.path.join(output_dir, filename)
             fig.savefig(path, bbox_inches='tight')
@@ -24,15 +40,17 @@ class DatasetVisualizer:
             return path
         return None
 
+    @traced("visualizer.target_distribution")
     def plot_target_distribution(self, output_dir: Optional[str] = None):
         """Plots the distribution of the target variable."""
+        plt, sns = load_plotting()
         if not self.target_column or self.target_column not in self.df.columns:
             return None
 
         target = self.df[self.target_column]
         fig, ax = plt.subplots(figsize=(10, 6))
         
-        if pd.api.types.is_numeric_dtype(target.dtype) and target.nunique() > 20:
+        if profile_series(target)["problem_type"] == "regression":
             # Regression check - Histogram
             sns.histplot(target, kde=True, ax=ax)
             ax.set_title(f"Distribution of Target: {self.target_column}")
@@ -43,8 +61,10 @@ class DatasetVisualizer:
         
         return self._save_plot(fig, "target_distribution.png", output_dir)
 
+    @traced("visualizer.correlation_heatmap")
     def plot_correlation_heatmap(self, output_dir: Optional[str] = None):
         """Plots correlation heatmap for numerical features."""
+        plt, sns = load_plotting()
         numeric_df = self.df.select_dtypes(include=['number'])
         if numeric_df.shape[1] < 2:
             return None
@@ -56,8 +76,10 @@ class DatasetVisualizer:
         
         return self._save_plot(fig, "correlation_heatmap.png", output_dir)
 
+    @traced("visualizer.missing_matrix")
     def plot_missing_matrix(self, output_dir: Optional[str] = None):
         """Visualizes missing values."""
+        plt, sns = load_plotting()
         if not self.df.isna().any().any():
             return None
             
@@ -67,8 +89,10 @@ class DatasetVisualizer:
         
         return self._save_plot(fig, "missing_matrix.png", output_dir)
 
+    @traced("visualizer.feature_distributions")
     def plot_feature_distributions(self, output_dir: Optional[str] = None):
         """Plots distributions for top numerical and categorical features."""
+        plt, sns = load_plotting()
         # limit to top 3 numerical by variance
         numeric_df = self.df.select_dtypes(include=['number'])
         plot_paths = []
@@ -41,3 +41,58 @@ def test_neural_networks_existence():
     assert mlp is not None
     assert cnn is not None
     assert mlp.complexity_score >= 8
+
+def test_secondary_indexes_match_linear_scan():
+    algos = AlgorithmRegistry.get_all()
+    assert AlgorithmRegistry.get_by_type("regression") == [a for a in algos if a.type == "regression"]
+    assert AlgorithmRegistry.get_by_capability("handle_sparse") == [a for a in algos if a.handle_sparse]
+    low = AlgorithmRegistry.query(problem_type="classification", capabilities=["handle_sparse"], complexity_band="low")
+    assert low == [a for a in algos if a.type == "classification" and a.handle_sparse and a.complexity_score <= 3]
+    with pytest.raises(ValueError):
+        AlgorithmRegistry.query(capabilities=["can_fly"])
+
+def test_reregister_updates_indexes():
+    first = Algorithm(name="Reindexed Algo", type="test_type", description="", pros=[], cons=[],
+                      complexity_score=9, handle_missing=True)
+    AlgorithmRegistry.register(first)
+    second = Algorithm(name="Reindexed Algo", type="other_type", description="", pros=[], cons=[], complexity_score=2)
+    AlgorithmRegistry.register(second)
+    assert first not in AlgorithmRegistry.get_by_capability("handle_missing")
+    assert first not in AlgorithmRegistry.get_by_complexity_band("high")
+    assert AlgorithmRegistry.query(problem_type="other_type", complexity_band="low") == [second]
+    assert AlgorithmRegistry.get_many(["reindexed algo", "Nope"]) == [second]
+
+def test_mapping_import_is_lazy():
+    import subprocess
+    code = ("import sys; from src.automl.mappings import SKLEARN_MAPPING; "
+            "assert 'sklearn.ensemble' not in sys.modules; "
+            "SKLEARN_MAPPING['Random Forest']; assert 'sklearn.ensemble' in sys.modules")
+    root = os.path.join(os.path.dirname(__file__), '..')
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+def test_plugin_algorithms_register_with_lazy_estimator(monkeypatch):
+    from src.algorithms import plugins
+    from src.automl.mappings import SKLEARN_MAPPING
+
+    plugin = Algorithm(name="Plugin Tree", type="classification", description="", pros=[], cons=[],
+                       complexity_score=3, estimator="sklearn.tree:DecisionTreeClassifier")
+
+    class FakeEntryPoint:
+        name = "plugin_tree"
+        def load(self):
+            return lambda: [plugin]
+
+    import importlib.metadata
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda group: [FakeEntryPoint()] if group == plugins.ENTRY_POINT_GROUP else [])
+    monkeypatch.setattr(plugins, "_plugins_loaded", False)
+    assert plugins.load_entry_point_plugins() == 1
+    assert AlgorithmRegistry.get_by_name("Plugin Tree") is plugin
+    assert "Plugin Tree" in SKLEARN_MAPPING
+    assert SKLEARN_MAPPING["Plugin Tree"]().__class__.__name__ == "DecisionTreeClassifier"
+
+def test_missing_library_uses_fallback():
+    from src.algorithms.plugins import load_estimator_factory
+    factory = load_estimator_factory("not_a_real_ml_lib:Model", "sklearn.naive_bayes:GaussianNB")
+    assert factory.__name__ == "GaussianNB"
+    with pytest.raises(ImportError):
+        load_estimator_factory("not_a_real_ml_lib:Model")
@@ -0,0 +1,66 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.analyzer import DatasetAnalyzer
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(rng.normal(size=(100, 3)), columns=["a", "b", "c"])
+    frame.loc[::10, "b"] = np.nan
+    frame["target"] = rng.integers(0, 2, 100)
+    return frame
+
+def test_selected_sections_only(df, monkeypatch):
+    analyzer = DatasetAnalyzer(df, target_column="target")
+    monkeypatch.setattr(analyzer, "_get_correlations", lambda: pytest.fail("correlations should not run"))
+    result = analyzer.analyze(sections=["imbalance_stats", "basic_stats"])
+    # Output follows the usual section order, not the request order
+    assert list(result) == ["basic_stats", "imbalance_stats"]
+    assert result["imbalance_stats"]["problem_type"] == "classification"
+
+def test_shared_intermediates_computed_once(df, monkeypatch):
+    calls = []
+    original = pd.DataFrame.select_dtypes
+    def counting(self, *args, **kwargs):
+        calls.append(1)
+        return original(self, *args, **kwargs)
+    monkeypatch.setattr(pd.DataFrame, "select_dtypes", counting)
+
+    analyzer = DatasetAnalyzer(df)
+    analyzer.analyze(sections=["skewness", "correlations", "outliers"])
+    analyzer.analyze(sections=["skewness"])
+    assert len(calls) == 1
+
+def test_default_is_full_analysis(df):
+    result = DatasetAnalyzer(df, target_column="target").analyze()
+    assert list(result) == list(DatasetAnalyzer.SECTIONS)
+    assert result["missing_stats"]["columns_with_missing"] == ["b"]
+
+def test_unknown_section_rejected(df):
+    with pytest.raises(ValueError, match="bogus"):
+        DatasetAnalyzer(df).analyze(sections=["bogus"])
+
+def test_analyze_endpoint_fields(df, tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    from src.api.main import app
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("temp_uploads")
+    os.makedirs("plots")
+    client = TestClient(app)
+    csv = df.to_csv(index=False).encode()
+
+    resp = client.post("/analyze?fields=basic_stats,feature_types", files={"file": ("f.csv", csv, "text/csv")})
+    assert resp.status_code == 200
+    assert set(resp.json()["analysis"]) == {"basic_stats", "feature_types"}
+    assert resp.json()["plots"] == []
+
+    bad = client.post("/analyze?fields=nope", files={"file": ("f.csv", csv, "text/csv")})
+    assert bad.status_code == 400
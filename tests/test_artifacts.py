@@ -0,0 +1,122 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.automl.artifacts import ModelArtifactStore, dataset_key
+from src.automl.preprocessing import TabularPreprocessor
+from src.automl.runner import AutoMLRunner
+from src.algorithms.registry import AlgorithmRegistry
+import src.algorithms.definitions # Register algorithms
+
+def _frame(rows=80):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"x": rng.normal(size=rows), "color": rng.choice(["red", "blue"], rows),
+                         "target": rng.choice(["yes", "no"], rows)})
+
+def test_preprocessor_transform_matches_fit():
+    df = _frame()
+    df.loc[3, "x"] = np.nan
+    pre = TabularPreprocessor("target")
+    X, y, is_classification = pre.fit_transform(df)
+    pre.fit_scaler(X)
+    assert is_classification
+    assert np.allclose(pre.transform(df.drop(columns=["target"])), pre.scaler.transform(np.asarray(X, dtype=float)))
+    new = pre.transform(pd.DataFrame({"x": [None], "color": ["green"]}))
+    assert new.shape == (1, 2)
+    assert list(pre.decode_target([0, 1])) == ["no", "yes"]
+    with pytest.raises(ValueError):
+        pre.transform(pd.DataFrame({"x": [1.0]}))
+
+def test_benchmark_models_are_stored_and_reloaded(tmp_path):
+    df = _frame()
+    store = ModelArtifactStore(str(tmp_path / "models"))
+    runner = AutoMLRunner(artifact_store=store)
+    recs = [{"algorithm": AlgorithmRegistry.get_by_name(n)} for n in ["Random Forest", "Logistic Regression"]]
+    results = runner.run_benchmark(df, "target", recs)
+
+    ids = results["Artifact Id"].tolist()
+    assert all(ids) and len(store) == 2
+    # Same dataset, algorithm and params -> same id
+    assert runner.run_benchmark(df, "target", recs)["Artifact Id"].tolist() == ids
+    assert store.metadata(ids[0])["dataset"] == dataset_key(df)
+
+    reopened = ModelArtifactStore(str(tmp_path / "models"))
+    model, pre = reopened.load(ids[0])
+    predictions = pre.decode_target(model.predict(pre.transform(df)))
+    assert set(predictions) <= {"yes", "no"}
+    assert reopened.load(ids[0])[0] is model # Warm reuse
+    assert reopened.load("missing") is None
+
+def test_store_evicts_least_recently_used(tmp_path):
+    from sklearn.linear_model import LogisticRegression
+    df = _frame()
+    pre = TabularPreprocessor("target")
+    X, y, _ = pre.fit_transform(df)
+    store = ModelArtifactStore(str(tmp_path / "models"), max_bytes=10 ** 9)
+    first = store.save(LogisticRegression(C=1.0).fit(X, y), pre, "d", "Logistic Regression")
+    second = store.save(LogisticRegression(C=2.0).fit(X, y), pre, "d", "Logistic Regression")
+    store.load(first)
+
+    store.max_bytes = store.metadata(first)["bytes"] + store.metadata(second)["bytes"] + 1
+    third = store.save(LogisticRegression(C=3.0).fit(X, y), pre, "d", "Logistic Regression")
+    assert second not in store and not os.path.exists(tmp_path / "models" / second)
+    assert first in store and third in store
+    assert store.evictions == 1
+
+def test_score_csv_streams_in_chunks(tmp_path):
+    from src.automl.scoring import score_csv
+    df = _frame(200)
+    df.insert(0, "id", range(200))
+    store = ModelArtifactStore(str(tmp_path / "models"))
+    results = AutoMLRunner(artifact_store=store).run_benchmark(
+        df.drop(columns=["id"]), "target", [{"algorithm": AlgorithmRegistry.get_by_name("Logistic Regression")}])
+    artifact = results["Artifact Id"].iloc[0]
+    df.drop(columns=["target"]).to_csv(tmp_path / "in.csv", index=False)
+
+    stats = score_csv(store, artifact, str(tmp_path / "in.csv"), str(tmp_path / "out.csv"),
+                      chunksize=64, proba=True, keep_columns=["id"])
+    out = pd.read_csv(tmp_path / "out.csv")
+    assert stats["rows"] == 200 and stats["chunks"] == 4 and stats["rows_per_sec"] > 0
+    assert list(out.columns) == ["id", "prediction", "proba_no", "proba_yes"]
+    assert out["id"].tolist() == list(range(200))
+
+    model, pre = store.load(artifact)
+    assert out["prediction"].tolist() == list(pre.decode_target(model.predict(pre.transform(df))))
+    with pytest.raises(KeyError):
+        score_csv(store, "missing", str(tmp_path / "in.csv"), str(tmp_path / "x.csv"))
+
+def test_api_predict_streams_csv(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    from src.api import main
+    from src.api.main import app
+
+    monkeypatch.chdir(tmp_path)
+    # The fingerprint index stays bound to the first working directory it opened
+    monkeypatch.setattr(main, "benchmark_history", None)
+    os.makedirs("temp_uploads")
+    os.makedirs("plots")
+    client = TestClient(app)
+    df = _frame(120)
+    dataset_id = client.post("/analyze?fields=basic_stats", files={"file": ("d.csv", df.to_csv(index=False).encode(), "text/csv")}).json()["dataset_id"]
+    bench = client.post("/benchmark", json={"dataset_id": dataset_id, "target_col": "target",
+                                            "recommmendations": [{"algorithm": "Random Forest"}]}).json()
+    artifact = bench["results"][0]["Artifact Id"]
+    assert client.get(f"/models/{artifact}").json()["algorithm"] == "Random Forest"
+
+    csv = df.drop(columns=["target"]).to_csv(index=False).encode()
+    response = client.post(f"/predict?artifact_id={artifact}&chunksize=50", files={"file": ("new.csv", csv, "text/csv")})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.strip().splitlines()
+    assert lines[0] == "prediction" and len(lines) == 121
+    assert set(lines[1:]) <= {"yes", "no"}
+
+    assert client.post("/predict?artifact_id=missing", files={"file": ("new.csv", csv, "text/csv")}).status_code == 404
+    bad = pd.DataFrame({"other": [1, 2]}).to_csv(index=False).encode()
+    assert client.post(f"/predict?artifact_id={artifact}", files={"file": ("bad.csv", bad, "text/csv")}).status_code == 400
+    assert "malgocat_predict_rows_per_second" in client.get("/metrics").text
@@ -32,3 +32,135 @@ def test_automl_classification():
     assert not results.empty
     assert "Accuracy" in results["Metric"].values
     assert results.iloc[0]["Status"] == "Success"
+
+def test_voting_ensemble_reuses_member_predictions():
+    import numpy as np
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.naive_bayes import GaussianNB
+    from src.automl.oof import PredictionCache, evaluate_ensemble
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 3))
+    y = (X[:, 0] > 0).astype(int)
+    fits = []
+    def counted(cls):
+        def factory():
+            fits.append(cls.__name__)
+            return cls()
+        return factory
+    factories = {"lr": counted(LogisticRegression), "nb": counted(GaussianNB)}
+
+    cache = PredictionCache(X[:150], y[:150], X[150:], is_classification=True, n_jobs=1)
+    lr = factories["lr"]().fit(X[:150], y[:150])
+    cache.put_test("lr", lr, fit_seconds=2.0)
+    y_pred, ensemble = evaluate_ensemble({"kind": "voting", "members": ["lr", "nb"]}, cache, factories)
+
+    nb = GaussianNB().fit(X[:150], y[:150])
+    expected = ((lr.predict_proba(X[150:]) + nb.predict_proba(X[150:])) / 2).argmax(axis=1)
+    assert (y_pred == expected).all()
+    assert (ensemble.predict(X[150:]) == expected).all()
+    assert fits == ["LogisticRegression", "GaussianNB"] # lr was not refitted
+    assert ensemble.fit_seconds == pytest.approx(2.0 + cache.member_seconds["nb"])
+    evaluate_ensemble({"kind": "voting", "members": ["lr", "nb"]}, cache, factories)
+    assert len(fits) == 2
+
+def test_stacking_ensemble_from_oof_predictions():
+    import numpy as np
+    from sklearn.linear_model import LinearRegression, Ridge
+    from src.automl.oof import PredictionCache, evaluate_ensemble
+
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(300, 4))
+    y = X @ np.array([1.0, -2.0, 0.5, 0.0]) + rng.normal(scale=0.1, size=300)
+    cache = PredictionCache(X[:240], y[:240], X[240:], is_classification=False, n_folds=3, n_jobs=1)
+    spec = {"kind": "stacking", "members": ["lin", "ridge"], "final_estimator": "sklearn.linear_model:LinearRegression"}
+    y_pred, ensemble = evaluate_ensemble(spec, cache, {"lin": LinearRegression, "ridge": Ridge})
+
+    assert cache.oof("lin", LinearRegression).shape == (240,)
+    assert np.corrcoef(y_pred, y[240:])[0, 1] > 0.99
+    assert np.allclose(ensemble.predict(X[240:]), y_pred)
+    assert ensemble.fit_seconds >= sum(cache.member_seconds.values()) + sum(cache.oof_seconds.values())
+
+def test_runner_scores_ensembles_without_refitting(tmp_path):
+    from src.algorithms.registry import AlgorithmRegistry
+    from src.meta.history import BenchmarkHistory
+    register_all_algorithms()
+    df = pd.DataFrame({
+        "A": list(range(40)) * 2,
+        "B": [0.5, 1.5] * 40,
+        "target": ["Yes", "No"] * 40
+    })
+    names = ["XGBoost", "LightGBM Classifier", "Random Forest", "Voting Classifier"]
+    history = BenchmarkHistory(str(tmp_path / "history.jsonl"))
+    results = AutoMLRunner(history=history).run_benchmark(df, "target", [{"algorithm": AlgorithmRegistry.get_by_name(n)} for n in names])
+    results = results.set_index("Algorithm")
+    voting = results.loc["Voting Classifier"]
+    assert voting["Status"] == "Success"
+    # All three members were benchmarked already, but the ensemble still costs their fits
+    members_total = results.loc[names[:3], "Fit Time"].sum()
+    assert voting["Fit Time"] >= members_total > 0
+    recorded = {r["algorithm"]: r["fit_time"] for r in history.load()}
+    assert recorded["Voting Classifier"] >= members_total
+
+def test_boosted_trees_early_stop_and_report_time_saved():
+    import numpy as np
+    from src.algorithms.registry import AlgorithmRegistry
+    from src.automl.gbdt import time_saved
+    register_all_algorithms()
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"A": rng.normal(size=300), "B": rng.normal(size=300)})
+    df["target"] = (df["A"] > 0).astype(int)
+
+    runner = AutoMLRunner(early_stopping_rounds=3)
+    recs = [
+        {"algorithm": Algorithm("Gradient Boosting", "classification", "", [], [], 5)},
+        {"algorithm": AlgorithmRegistry.get_by_name("Logistic Regression")}
+    ]
+    results = runner.run_benchmark(df, "target", recs)
+    rows = results.set_index("Algorithm")
+    assert rows.loc["Gradient Boosting", "Status"] == "Success"
+    assert rows.loc["Gradient Boosting", "Best Iteration"] < 100
+    assert rows.loc["Gradient Boosting", "Time Saved"] > 0
+    assert np.isnan(rows.loc["Logistic Regression", "Best Iteration"])
+
+    info = {"early_stopped": True, "trained_iterations": 25, "max_iterations": 100}
+    assert time_saved(2.0, info) == 6.0
+    assert time_saved(2.0, dict(info, early_stopped=False)) == 0.0
+
+def test_native_preprocessing_keeps_missing_values():
+    import numpy as np
+    from src.automl.preprocessing import TabularPreprocessor
+    df = pd.DataFrame({"x": [1.0, None, 3.0, 4.0], "c": ["a", "b", None, "a"], "target": [0, 1, 0, 1]})
+    pre = TabularPreprocessor("target")
+    X, _, _ = pre.fit_transform(df)
+    pre.fit_scaler(X)
+    native = pre.native_copy().transform(pd.DataFrame({"x": [None, 2.0], "c": ["a", "unseen"]}))
+    assert np.isnan(native[0, 0]) and native[1, 0] == 2.0
+    assert native[0, 1] == pre.category_codes["c"]["a"] and np.isnan(native[1, 1])
+    assert pre.categorical_indices == [1]
+    assert not np.isnan(pre.transform(pd.DataFrame({"x": [None], "c": ["unseen"]}))).any()
+
+def test_native_categorical_arguments_cover_every_feature():
+    import numpy as np
+    from src.automl.gbdt import prepare_native
+
+    class FakeXGB:
+        params = {}
+        def set_params(self, **params):
+            self.params.update(params)
+        def fit(self, X, y, **kwargs):
+            self.fit_kwargs = kwargs
+    FakeXGB.__module__ = "xgboost.sklearn"
+
+    class FakeLGBM(FakeXGB):
+        pass
+    FakeLGBM.__module__ = "lightgbm.sklearn"
+
+    # Numeric columns after the last categorical one must still get a feature type
+    X, y = np.zeros((10, 4)), np.zeros(10, dtype=int)
+    model = FakeXGB()
+    AutoMLRunner(early_stopping_rounds=None)._fit(model, "xgboost", X, y, True, [0, 2])
+    assert model.params["feature_types"] == ["c", "q", "c", "q"]
+    assert len(model.params["feature_types"]) == X.shape[1]
+    assert prepare_native(FakeLGBM(), [0, 2], 4) == {"categorical_feature": [0, 2]}
+    assert prepare_native(FakeXGB(), [], 4) == {}
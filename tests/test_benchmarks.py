@@ -0,0 +1,57 @@
+import pytest
+import sys
+import os
+
+# Ensure repo root is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.run_benchmarks import bench_algorithms, compare, machine_info
+
+def test_algorithm_bench_smoke():
+    rows = bench_algorithms([(200, 4, 0.25, 0.1)], algorithms=["Logistic Regression", "Gaussian Naive Bayes"])
+    assert [r["status"] for r in rows] == ["ok", "ok"]
+    assert all(r["fit_rows_per_sec"] > 0 and r["peak_memory_mb"] >= 0 for r in rows)
+
+def test_compare_flags_regressions():
+    base = {"algorithms": [{"algorithm": "A", "shape": "s", "status": "ok", "fit_seconds": 1.0,
+                            "predict_seconds": 0.1, "peak_memory_mb": 10.0}],
+            "analysis": [{"shape": "s", "analyze_seconds": 0.5}]}
+    new = {"algorithms": [{"algorithm": "A", "shape": "s", "status": "ok", "fit_seconds": 2.0,
+                           "predict_seconds": 0.1, "peak_memory_mb": 10.0}],
+           "analysis": [{"shape": "s", "analyze_seconds": 0.5}]}
+    rows = {r["metric"]: r for r in compare(base, new)}
+    assert rows["algorithms/A/s/fit_seconds"]["regression"]
+    assert not rows["analysis/s/analyze_seconds"]["regression"]
+
+def test_machine_info():
+    info = machine_info()
+    assert info["cpu_count"] >= 1
+    assert "sklearn" in info
+
+def test_load_summary_percentiles():
+    from benchmarks.load_test import summarize
+    s = summarize([0.01] * 98 + [1.0, 2.0], errors=0, duration=10.0)
+    assert s["requests"] == 100
+    assert s["throughput_rps"] == pytest.approx(10.0)
+    assert s["p50_ms"] == pytest.approx(10.0)
+    assert s["p99_ms"] > 900
+    assert summarize([], errors=3, duration=1.0)["error_rate"] == 1.0
+
+def test_load_scenarios_are_valid():
+    import json
+    from benchmarks.load_test import ENDPOINTS
+    scenario_dir = os.path.join(os.path.dirname(__file__), '..', 'benchmarks', 'scenarios')
+    files = [f for f in os.listdir(scenario_dir) if f.endswith(".json")]
+    assert files
+    for name in files:
+        with open(os.path.join(scenario_dir, name)) as f:
+            scenario = json.load(f)
+        assert set(scenario["mix"]) <= set(ENDPOINTS), name
+        assert all(s["concurrency"] >= 1 and s["duration_seconds"] > 0 for s in scenario["stages"]), name
+
+def test_api_cold_import_is_lean():
+    from benchmarks.run_benchmarks import bench_startup
+    row = bench_startup(repeats=1)[0]
+    # Plotting and ML stacks must stay deferred to first use / background pre-warm
+    # (the import-time budget is enforced by the harness run, not here)
+    assert row["deferred_loaded"] == []
@@ -0,0 +1,58 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.column_types import infer_column_types, detect_date_format
+from src.analyzer import DatasetAnalyzer
+
+def _frame(rows=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.Series(pd.date_range("2021-01-01", periods=rows, freq="D"))
+    words = np.array(["great", "food", "slow", "service", "the", "was", "not", "very", "friendly"])
+    return pd.DataFrame({
+        "signup": dates.dt.strftime("%Y-%m-%d"),
+        "visit": dates.dt.strftime("%d/%m/%Y"),
+        "review": [" ".join(rng.choice(words, rng.integers(4, 12))) for _ in range(rows)],
+        "city": rng.choice(["New York", "Paris", "Rome"], rows),
+        "code": [str(i) for i in range(rows)],
+        "amount": rng.normal(size=rows),
+    })
+
+def test_infer_column_types():
+    df = _frame()
+    df.loc[::7, "signup"] = None
+    profiles = infer_column_types(df)
+    assert {col: p["inferred"] for col, p in profiles.items()} == {
+        "signup": "datetime", "visit": "datetime", "review": "text", "city": "categorical", "code": "categorical"}
+    assert profiles["visit"]["format"] == "%d/%m/%Y" and not profiles["visit"]["ambiguous"]
+    assert profiles["review"]["mean_tokens"] >= 4
+    # Columns are profiled, not converted
+    assert df["signup"].dtype == object or pd.api.types.is_string_dtype(df["signup"].dtype)
+
+def test_detect_date_format_edge_cases():
+    # Day and month both <= 12: parses either way, flagged as ambiguous
+    ambiguous = detect_date_format(pd.Series(["01/02/2020", "03/04/2021", "12/11/2019"]))
+    assert ambiguous["format"] == "%d/%m/%Y" and ambiguous["ambiguous"]
+    assert detect_date_format(pd.Series(["03/25/2020", "12/31/2021"]))["format"] == "%m/%d/%Y"
+    assert detect_date_format(pd.Series(["Mar 5, 2020", "Dec 31, 2021"]))["format"] == "%b %d, %Y"
+    # Plain numbers and mostly-unparseable values are not dates
+    assert detect_date_format(pd.Series(["2020", "2021", "1999"])) is None
+    assert detect_date_format(pd.Series(["2020-01-01"] + ["n/a"] * 9)) is None
+
+def test_analyzer_feature_types_and_advisor():
+    from src.competition.advisor import CompetitionAdvisor
+
+    analysis = DatasetAnalyzer(_frame()).analyze(sections=["feature_types", "feature_columns", "column_types"])
+    types = analysis["feature_types"]
+    assert types["date_columns"] == types["datetime"] == 2
+    assert types["text_columns"] == 1 and types["categorical"] == 2 and types["numerical"] == 1
+    assert analysis["feature_columns"]["text"] == ["review"]
+    assert analysis["column_types"]["signup"]["format"] == "ISO8601"
+
+    fe_tips = CompetitionAdvisor().generate_competition_plan(analysis)["featureEngineering"]
+    assert any("Date columns" in tip for tip in fe_tips) and any("TF-IDF" in tip for tip in fe_tips)
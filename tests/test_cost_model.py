@@ -0,0 +1,77 @@
+import pytest
+import sys
+import os
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.algorithms.registry import AlgorithmRegistry
+from src.automl.calibration import make_synthetic_frame, run_calibration
+from src.automl.cost_model import CostModel
+from src.automl.runner import AutoMLRunner
+from src.competition.advisor import CompetitionAdvisor
+import src.algorithms.definitions # Triggers registration
+
+def test_fitted_curve_extrapolates():
+    model = CostModel(path=None)
+    # Time linear in rows, memory linear in cells
+    for rows, cols in [(100, 5), (200, 5), (400, 10), (800, 20)]:
+        model.add_measurement("Random Forest", rows, cols, fit_time=rows * 1e-3,
+                              peak_memory_mb=rows * cols * 1e-3, complexity_score=5)
+
+    pred = model.predict("Random Forest", 1600, 5)
+    assert pred["source"] == "fitted"
+    assert pred["seconds"] == pytest.approx(1.6, rel=0.05)
+    assert pred["peak_memory_mb"] == pytest.approx(8.0, rel=0.05)
+
+def test_prior_uses_machine_factor():
+    model = CostModel(path=None)
+    prior = model.predict("Unmeasured", 1000, 10, complexity_score=4)
+    assert prior["source"] == "prior"
+
+    # A machine measured 10x slower than the prior should slow unmeasured predictions down too
+    for rows in (100, 200, 400):
+        model.add_measurement("Random Forest", rows, 10, fit_time=10 * model._prior_seconds(rows, 10, 5, factor=1.0),
+                              complexity_score=5)
+    slower = model.predict("Unmeasured", 1000, 10, complexity_score=4)
+    assert slower["seconds"] == pytest.approx(prior["seconds"] * 10, rel=0.01)
+
+def test_measurements_persist(tmp_path):
+    path = str(tmp_path / "costs.jsonl")
+    model = CostModel(path)
+    run_calibration(model, algorithms=["Logistic Regression"], shapes=[(100, 3), (200, 3), (400, 6)])
+    reloaded = CostModel(path)
+    assert len(reloaded.measurements()) == 3
+    assert reloaded.measurements()[0]["peak_memory_mb"] > 0
+    assert reloaded.predict("Logistic Regression", 800, 6)["source"] == "fitted"
+
+def test_synthetic_frame_shape():
+    df = make_synthetic_frame(200, 10, categorical_share=0.3, missing_rate=0.1, problem_type="classification", n_classes=3)
+    assert df.shape == (200, 11)
+    assert sum(c.startswith("cat_") for c in df.columns) == 3
+    assert df["target"].nunique() == 3
+    assert 0.05 < df.drop(columns=["target"]).isna().mean().mean() < 0.15
+
+def test_runner_schedules_within_budget():
+    model = CostModel(path=None)
+    for rows in (100, 200, 400):
+        model.add_measurement("Random Forest", rows, 2, fit_time=1e6) # Predicted to never fit the budget
+
+    df = make_synthetic_frame(120, 2)
+    recs = [{"algorithm": AlgorithmRegistry.get_by_name("Random Forest")},
+            {"algorithm": AlgorithmRegistry.get_by_name("Logistic Regression")}]
+    results = AutoMLRunner(cost_model=model).run_benchmark(df, "target", recs, time_budget=60)
+
+    status = dict(zip(results["Algorithm"], results["Status"]))
+    assert status["Logistic Regression"] == "Success"
+    assert status["Random Forest"].startswith("Skipped")
+    # The successful fit was fed back as a measurement
+    assert any(m["algorithm"] == "Logistic Regression" for m in model.measurements())
+
+def test_advisor_numeric_estimate():
+    advisor = CompetitionAdvisor()
+    small = advisor.estimate_training_cost("Random Forest", 100, 10, 5)
+    large = advisor.estimate_training_cost("Random Forest", 100000, 100, 5)
+    assert 0 < small["seconds"] < large["seconds"]
+    assert large["peak_memory_mb"] > small["peak_memory_mb"]
@@ -0,0 +1,75 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.automl.learning_curve import subsample_sizes, fit_power_law, summarize_curve
+from src.automl.runner import AutoMLRunner
+from src.algorithms.registry import AlgorithmRegistry
+import src.algorithms.definitions # Register algorithms
+
+def _frame(rows=800, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(rows, 3))
+    df = pd.DataFrame(X, columns=["a", "b", "c"])
+    df["target"] = (X[:, 0] - X[:, 1] > 0).astype(int)
+    return df
+
+def test_subsample_sizes_are_geometric():
+    assert subsample_sizes(1000, min_size=100) == [100, 200, 400, 800, 1000]
+    assert subsample_sizes(30, min_size=50) == [30]
+
+def test_power_law_fit_recovers_curve():
+    sizes = [50, 100, 200, 400, 800, 1600, 3200]
+    scores = [0.9 - 2.0 * n ** -0.5 for n in sizes]
+    curve = fit_power_law(sizes, scores)
+    assert curve["a"] == pytest.approx(0.9, abs=1e-3)
+    assert curve["c"] == pytest.approx(0.5, abs=1e-2)
+    assert fit_power_law(sizes[:2], scores[:2]) is None
+
+    report = summarize_curve([{"n_samples": n, "score": s} for n, s in zip(sizes, scores)], n_train=3200)
+    # 2 / sqrt(n) <= 0.005  <=>  n >= 160000
+    assert report["saturation_size"] == pytest.approx(160000, rel=0.02)
+    assert not report["saturated"]
+    assert report["projected_gain"] == pytest.approx(2.0 / np.sqrt(3200), rel=0.02)
+    assert report["recommended_sample_size"] == 3200
+
+def test_flat_curve_is_saturated():
+    sizes = [50, 100, 200, 400, 800]
+    report = summarize_curve([{"n_samples": n, "score": 0.8 - 0.02 * n ** -1.0} for n in sizes], n_train=800)
+    assert report["saturated"]
+    assert report["recommended_sample_size"] < 800
+
+def test_runner_learning_curves():
+    recs = [{"algorithm": AlgorithmRegistry.get_by_name(n)}
+            for n in ["Voting Classifier", "Logistic Regression", "Gaussian Naive Bayes", "Random Forest"]]
+    curves = AutoMLRunner().run_learning_curves(_frame(), "target", recs, top_k=2, min_size=40, n_jobs=1)
+    # Ensembles are skipped; top_k runnable candidates in ranking order
+    assert [c["algorithm"] for c in curves] == ["Logistic Regression", "Gaussian Naive Bayes"]
+    lr = curves[0]
+    assert [p["n_samples"] for p in lr["points"]] == [40, 80, 160, 320, 640]
+    assert all(p["score"] is not None for p in lr["points"])
+    assert lr["metric"] == "Accuracy" and lr["curve"] is not None
+    assert 0 < lr["recommended_sample_size"] <= lr["n_train"]
+
+def test_api_learning_curve(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    from src.api.main import app
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("temp_uploads")
+    os.makedirs("plots")
+    client = TestClient(app)
+    csv = _frame(300).to_csv(index=False).encode()
+    dataset_id = client.post("/analyze?fields=basic_stats", files={"file": ("d.csv", csv, "text/csv")}).json()["dataset_id"]
+
+    assert client.post("/learning-curve", json={"dataset_id": dataset_id, "target_col": "target"}).status_code == 400
+    response = client.post("/learning-curve", json={"dataset_id": dataset_id, "target_col": "target",
+                                                    "algorithms": ["Logistic Regression"], "min_size": 30})
+    assert response.status_code == 200
+    curve = response.json()["curves"][0]
+    assert curve["algorithm"] == "Logistic Regression" and len(curve["points"]) == 4
@@ -0,0 +1,163 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.algorithms.registry import AlgorithmRegistry
+from src.automl.runner import AutoMLRunner
+from src.meta.fingerprint import FingerprintVectorizer
+from src.meta.history import BenchmarkHistory
+from src.meta.index import FingerprintIndex
+from src.meta.ranker import MetaRanker
+import src.algorithms.definitions # Triggers registration
+
+def make_analysis(n_rows):
+    return {
+        "basic_stats": {"n_rows": n_rows, "n_columns": 10},
+        "feature_types": {"numerical": 8, "categorical": 2},
+        "missing_stats": {"has_missing_values": False, "missing_ratio": 0.0},
+        "imbalance_stats": {"type": "classification", "is_imbalanced": False, "num_classes": 2}
+    }
+
+def fake_results(rf_time):
+    return [
+        {"Algorithm": "Random Forest", "Metric": "Accuracy", "Value": 0.90, "Status": "Success", "Fit Time": rf_time},
+        {"Algorithm": "Logistic Regression", "Metric": "Accuracy", "Value": 0.85, "Status": "Success", "Fit Time": 0.01},
+        {"Algorithm": "K-Nearest Neighbors", "Metric": "Error", "Value": 0.0, "Status": "Failed: boom", "Fit Time": 0.0},
+    ]
+
+def test_history_roundtrip(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    history = BenchmarkHistory(path)
+    written = history.record(make_analysis(500), fake_results(1.0), dataset_name="a.csv")
+    assert written == 2 # Failed rows are not stored
+
+    reloaded = BenchmarkHistory(path)
+    records = reloaded.load()
+    assert len(records) == 2
+    assert records[0]["meta_features"]["log_rows"] > 0
+    assert {r["algorithm"] for r in records} == {"Random Forest", "Logistic Regression"}
+
+def test_cold_start_matches_heuristic(tmp_path):
+    ranker = MetaRanker(history=BenchmarkHistory(str(tmp_path / "empty.jsonl")))
+    recs = ranker.rank(make_analysis(500), top_k=3)
+    assert len(recs) == 3
+    assert all(r["source"] == "heuristic" for r in recs)
+
+def test_ranks_by_score_per_second(tmp_path):
+    history = BenchmarkHistory(str(tmp_path / "history.jsonl"))
+    for n_rows in (400, 500, 600):
+        history.record(make_analysis(n_rows), fake_results(2.0))
+
+    ranker = MetaRanker(history=history)
+    recs = ranker.rank(make_analysis(550), top_k=3)
+    assert recs[0]["algorithm"].name == "Logistic Regression" # Slightly worse but 200x faster
+    assert recs[0]["source"] == "meta"
+    assert recs[0]["predicted_score"] == pytest.approx(0.85)
+    assert recs[1]["algorithm"].name == "Random Forest"
+    assert recs[1]["predicted_fit_time"] == pytest.approx(2.0)
+    # Unmeasured algorithms fall back to their heuristic order
+    assert recs[2]["source"] == "heuristic"
+
+    by_score = MetaRanker(history=history, objective="score").rank(make_analysis(550), top_k=1)
+    assert by_score[0]["algorithm"].name == "Random Forest"
+
+def test_near_zero_fit_times_do_not_dominate(tmp_path):
+    history = BenchmarkHistory(str(tmp_path / "history.jsonl"))
+    results = [
+        {"Algorithm": "Random Forest", "Metric": "Accuracy", "Value": 0.95, "Status": "Success", "Fit Time": 0.03},
+        {"Algorithm": "Logistic Regression", "Metric": "Accuracy", "Value": 0.70, "Status": "Success", "Fit Time": 0.0},
+    ]
+    for n_rows in (400, 500, 600):
+        history.record(make_analysis(n_rows), results)
+
+    # Both are below the floor, so the better score wins
+    recs = MetaRanker(history=history).rank(make_analysis(550), top_k=2)
+    assert [r["algorithm"].name for r in recs] == ["Random Forest", "Logistic Regression"]
+    unfloored = MetaRanker(history=history, min_fit_time=1e-3).rank(make_analysis(550), top_k=1)
+    assert unfloored[0]["algorithm"].name == "Logistic Regression"
+
+def test_runner_records_history(tmp_path):
+    history = BenchmarkHistory(str(tmp_path / "history.jsonl"))
+    df = pd.DataFrame({
+        "A": [1, 2, 3, 4, 1, 2, 3, 4] * 10,
+        "B": [5.0, 2.0, 1.0, 0.0, 5.0, 2.0, 1.0, 0.0] * 10,
+        "target": ["Yes", "No", "Yes", "No", "Yes", "No", "Yes", "No"] * 10
+    })
+    recs = [{"algorithm": AlgorithmRegistry.get_by_name("Logistic Regression")}]
+
+    results = AutoMLRunner(history=history).run_benchmark(df, "target", recs, dataset_name="toy.csv")
+
+    assert results.iloc[0]["Fit Time"] > 0
+    records = history.load()
+    assert len(records) == 1
+    assert records[0]["dataset"] == "toy.csv"
+    assert records[0]["problem_type"] == "classification"
+
+def test_fingerprint_summaries():
+    analysis = make_analysis(500)
+    analysis["skewness"] = {"a": 3.0, "b": None, "c": -1.0}
+    analysis["correlations"] = {"a": {"a": 1.0, "c": -0.8}, "c": {"a": -0.8, "c": 1.0}}
+    analysis["imbalance_stats"]["class_distribution"] = {"Yes": 0.9, "No": 0.1}
+
+    features = FingerprintVectorizer().extract(analysis)
+    assert features["max_abs_corr"] == pytest.approx(0.8)
+    assert features["max_abs_skew"] == pytest.approx(np.log1p(3.0))
+    assert features["minority_class_ratio"] == pytest.approx(0.1)
+    assert FingerprintVectorizer().transform({}).shape == (len(FingerprintVectorizer.feature_names),)
+
+def test_index_insert_search_and_reopen(tmp_path):
+    directory = str(tmp_path / "index")
+    index = FingerprintIndex(directory, initial_capacity=4) # Forces several resizes
+    rng = np.random.default_rng(0)
+    vectors = rng.random((50, index.dim)).astype(np.float32)
+    for i, v in enumerate(vectors):
+        index.add(v, {"dataset": f"d{i}", "best_algorithm": "Random Forest"})
+
+    hits = index.search(vectors[17], k=3)
+    assert hits[0]["id"] == 17
+    assert hits[0]["dataset"] == "d17"
+    assert hits[0]["distance"] == pytest.approx(0.0, abs=1e-3)
+    assert [h["distance"] for h in hits] == sorted(h["distance"] for h in hits)
+
+    # Chunked scan and ball tree agree with a single-block scan
+    assert [h["id"] for h in index.search(vectors[3], k=5, chunk_size=7)] == [h["id"] for h in index.search(vectors[3], k=5)]
+    assert [h["id"] for h in index.search(vectors[3], k=5, method="ball_tree")] == [h["id"] for h in index.search(vectors[3], k=5)]
+
+    reopened = FingerprintIndex(directory)
+    assert len(reopened) == 50
+    assert reopened.search(vectors[42], k=1)[0]["dataset"] == "d42"
+
+def test_history_feeds_index(tmp_path):
+    index = FingerprintIndex(str(tmp_path / "index"))
+    history = BenchmarkHistory(str(tmp_path / "history.jsonl"), index=index)
+    history.record(make_analysis(500), fake_results(1.0), dataset_name="a.csv")
+
+    hits = index.search(FingerprintVectorizer().transform(make_analysis(520)), k=1)
+    assert hits[0]["dataset"] == "a.csv"
+    assert hits[0]["best_algorithm"] == "Random Forest"
+
+def test_queries_without_target_ignore_target_features(tmp_path):
+    index = FingerprintIndex(str(tmp_path / "index"))
+    history = BenchmarkHistory(str(tmp_path / "history.jsonl"), index=index)
+    multiclass = make_analysis(500)
+    multiclass["imbalance_stats"] = dict(multiclass["imbalance_stats"], num_classes=10)
+    history.record(multiclass, fake_results(1.0), dataset_name="close.csv")
+    history.record(make_analysis(2000), fake_results(50.0), dataset_name="far.csv")
+
+    # A plain /analyze result: no imbalance_stats, so its class features read as 0
+    query = make_analysis(520)
+    del query["imbalance_stats"]
+    vectorizer = FingerprintVectorizer()
+    assert vectorizer.ignored_features(query) == vectorizer.target_feature_names
+    assert vectorizer.ignored_features(make_analysis(520)) == []
+    vector = vectorizer.transform(query)
+    assert index.search(vector, k=1)[0]["dataset"] == "far.csv"
+    assert index.search(vector, k=1, ignore=vectorizer.ignored_features(query))[0]["dataset"] == "close.csv"
+
+    ranker = MetaRanker(history=history, n_neighbors=1, min_history=1)
+    assert ranker.predict(query)["Random Forest"]["fit_time"] == pytest.approx(1.0)
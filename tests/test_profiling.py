@@ -0,0 +1,59 @@
+import pytest
+import sys
+import os
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.profiling import maybe_profile, profiling_requested, load_summary, valid_profile_id
+
+def test_profiling_requested(monkeypatch):
+    monkeypatch.delenv("MALGOCAT_PROFILE", raising=False)
+    assert not profiling_requested({}, {})
+    assert profiling_requested({"x-profile": "1"}, {})
+    assert profiling_requested({}, {"profile": "true"})
+    monkeypatch.setenv("MALGOCAT_PROFILE", "1")
+    assert profiling_requested({}, {})
+
+def test_disabled_profile_is_noop(tmp_path):
+    with maybe_profile(False, "noop", str(tmp_path)) as session:
+        pass
+    assert session is None
+    assert os.listdir(tmp_path) == []
+
+def test_profile_artifacts(tmp_path):
+    with maybe_profile(True, "unit", str(tmp_path)) as session:
+        data = [list(range(1000)) for _ in range(50)]
+        sorted(sum(row) for row in data)
+
+    assert valid_profile_id(session.id)
+    assert os.path.exists(os.path.join(tmp_path, session.id, "profile.prof"))
+    summary = load_summary(session.id, str(tmp_path))
+    assert summary["label"] == "unit"
+    assert summary["top_functions"]
+    assert summary["top_allocations"]
+    assert load_summary("../etc", str(tmp_path)) is None
+
+def test_analyze_endpoint_profile(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    from src.api.main import app
+
+    monkeypatch.chdir(tmp_path) # Uploads, plots and profiles land in the temp dir
+    os.makedirs("temp_uploads")
+    os.makedirs("plots")
+    client = TestClient(app)
+    csv = pd.DataFrame({"a": [1, 2, 3, 4], "b": [0.5, 0.1, 0.2, 0.9]}).to_csv(index=False)
+
+    resp = client.post("/analyze?profile=1", files={"file": ("p.csv", csv.encode(), "text/csv")})
+    assert resp.status_code == 200
+    profile_id = resp.headers["x-profile-id"]
+
+    summary = client.get(f"/profiles/{profile_id}").json()
+    assert summary["label"] == "analyze"
+    assert any("_run_analysis" in f["function"] for f in summary["top_functions"])
+    assert client.get(f"/profiles/{profile_id}/download").content
+    assert client.get("/profiles/deadbeef").status_code == 404
+
+    plain = client.post("/analyze", files={"file": ("p.csv", csv.encode(), "text/csv")})
+    assert "x-profile-id" not in plain.headers
@@ -0,0 +1,109 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.relevance import mutual_information, correlation_ratio, quantile_codes, target_relevance
+from src.analyzer import DatasetAnalyzer
+
+def _frame(rows=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({"a": rng.normal(size=rows), "noise": rng.normal(size=rows),
+                       "city": rng.choice(["x", "y", "z"], rows)})
+    df["target"] = ((df["a"] ** 2 > 1) | (df["city"] == "x")).astype(int)
+    df["leak"] = df["target"] * 2 + rng.normal(0, 0.01, rows)
+    df["row_id"] = [f"r{i}" for i in range(rows)]
+    return df
+
+def test_mutual_information_matches_entropy():
+    y = np.repeat([0, 1, 2, 3], 250)
+    x = np.column_stack([y, np.tile([0, 1], 500)])
+    info = mutual_information(x, y)
+    # Identical column carries all of H(y) = log(4); an unrelated one nothing
+    assert info["mi"][0] == pytest.approx(np.log(4), abs=0.01)
+    assert info["uncertainty"][0] == pytest.approx(1.0, abs=0.01)
+    assert info["mi"][1] == pytest.approx(0.0, abs=1e-3)
+
+def test_correlation_ratio_and_quantile_codes():
+    codes = np.repeat([0, 1], 50)[:, None]
+    assert correlation_ratio(codes, codes[:, 0] * 10.0)[0] == pytest.approx(1.0)
+    assert correlation_ratio(codes, np.tile([1.0, 2.0], 50))[0] == pytest.approx(0.0)
+    binned = quantile_codes(np.append(np.arange(99.0), np.nan), n_bins=4)
+    assert binned[-1] == 4 and sorted(np.bincount(binned[:-1])) == [24, 25, 25, 25]
+
+def test_target_relevance_finds_signal_and_leakage():
+    report = target_relevance(_frame(), "target", is_classification=True)
+    features = report["features"]
+    assert features["a"]["uncertainty"] > features["noise"]["uncertainty"] + 0.1
+    assert features["city"]["uncertainty"] > 0.1
+    # Informative but uncorrelated: only visible to mutual information
+    assert "a" in report["nonlinear_features"]
+    assert [s["column"] for s in report["leakage_suspects"]] == ["leak"]
+    assert report["top_features"][0] == "leak"
+    assert not report["truncated"] and report["columns_evaluated"] == 5
+
+def test_target_relevance_skips_empty_and_id_like_columns():
+    import warnings
+    df = _frame(500)
+    df["empty"] = np.nan
+    df["day"] = pd.date_range("2020-01-01", periods=500).astype(str) # One value per row
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        report = target_relevance(df, "target", is_classification=True)
+        assert (quantile_codes(np.full((5, 2), np.nan)) == 16).all()
+    assert "empty" not in report["features"]
+    assert report["features"]["day"]["id_like"] and not report["features"]["city"]["id_like"]
+    assert "day" not in report["top_features"] and "row_id" not in report["top_features"]
+
+    from src.engine import HeuristicRanker
+    import src.algorithms.definitions # Register algorithms
+    # Only ID-like categoricals look informative: no native-categorical bonus
+    relevance = {"features": {"day": dict(report["features"]["day"], uncertainty=0.9)}, "nonlinear_features": []}
+    ranked = HeuristicRanker().rank({"basic_stats": {"n_rows": 500}, "target_relevance": relevance}, top_k=50)
+    reasons = [reason for rec in ranked for reason in rec["reasons"]]
+    assert not any("categorical features natively" in r for r in reasons)
+
+def test_target_relevance_regression_sampling_and_budget():
+    df = _frame().drop(columns=["target", "leak"])
+    df["price"] = df["city"].map({"x": 10.0, "y": 20.0, "z": 30.0}) + df["noise"]
+    report = target_relevance(df, "price", is_classification=False, max_rows=1000)
+    assert report["sample_rows"] == 1000
+    assert report["features"]["city"]["correlation_ratio"] > 0.9
+    assert report["features"]["noise"]["pearson"] > 0
+    # No time left: nothing evaluated, reported as truncated
+    empty = target_relevance(df, "price", is_classification=False, time_budget=-1)
+    assert empty["truncated"] and empty["columns_evaluated"] == 0
+
+def test_analyzer_section_and_ranker():
+    from src.engine import HeuristicRanker
+    from src.competition.advisor import CompetitionAdvisor
+    import src.algorithms.definitions # Register algorithms
+
+    df = _frame(500)
+    assert DatasetAnalyzer(df).analyze(sections=["target_relevance"])["target_relevance"] is None
+    analysis = DatasetAnalyzer(df, target_column="target").analyze()
+    assert analysis["target_relevance"]["leakage_suspects"][0]["column"] == "leak"
+    assert any("leakage" in tip for tip in CompetitionAdvisor().get_kaggle_tips(analysis))
+
+    ranker = HeuristicRanker()
+    with_relevance = {r["algorithm"].name: r for r in ranker.rank(analysis, top_k=50)}
+    without = {r["algorithm"].name: r for r in ranker.rank(dict(analysis, target_relevance=None), top_k=50)}
+    assert with_relevance["Logistic Regression"]["score"] < without["Logistic Regression"]["score"]
+
+def test_api_analyze_with_target(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    from src.api.main import app
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("temp_uploads")
+    os.makedirs("plots")
+    client = TestClient(app)
+    csv = _frame(300).to_csv(index=False).encode()
+    response = client.post("/analyze?fields=target_relevance&target=target", files={"file": ("d.csv", csv, "text/csv")})
+    assert response.status_code == 200
+    assert response.json()["analysis"]["target_relevance"]["leakage_suspects"][0]["column"] == "leak"
+    assert client.post("/analyze?target=nope", files={"file": ("d.csv", csv, "text/csv")}).status_code == 400
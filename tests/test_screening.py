@@ -0,0 +1,77 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.screening import screen_columns, apply_screening, pruning_summary
+from src.automl.runner import AutoMLRunner
+from src.algorithms.registry import AlgorithmRegistry
+import src.algorithms.definitions # Register algorithms
+
+def _frame(rows=400, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.normal(size=(rows, 3)), columns=["a", "b", "c"])
+    df["a_copy"] = df["a"]
+    df["city"] = rng.choice(["x", "y"], rows)
+    df["city_copy"] = df["city"].copy()
+    df["constant"] = 7
+    df["rare"] = np.where(np.arange(rows) < 2, 1, 0)
+    df["user_id"] = [f"u{i}" for i in range(rows)]
+    df["row"] = np.arange(rows)
+    df["target"] = (df["a"] > 0).astype(int)
+    return pd.concat([df, df.iloc[:5]], ignore_index=True)
+
+def test_screen_columns_flags_useless_columns():
+    report = screen_columns(_frame(), target="target")
+    assert report["constant_columns"] == ["constant"]
+    assert list(report["near_constant_columns"]) == ["rare"]
+    assert report["duplicate_columns"] == {"a_copy": "a", "city_copy": "city"}
+    assert report["id_columns"] == ["user_id", "row"]
+    assert report["duplicate_rows"] == 5
+    # Same values but a different dtype is not a duplicate; floats are never ID-like
+    df = pd.DataFrame({"i": np.arange(100), "f": np.arange(100.0), "t": 0})
+    report = screen_columns(df, target="t")
+    assert report["duplicate_columns"] == {} and report["id_columns"] == ["i"] and report["constant_columns"] == []
+
+def test_apply_screening_and_summary():
+    df = _frame()
+    report = screen_columns(df, target="target")
+    pruned = apply_screening(df, report, drop_duplicate_rows=True)
+    assert list(pruned.columns) == ["a", "b", "c", "city", "target"]
+    assert len(pruned) == 400
+    summary = pruning_summary(report, pruned, seconds=10.0)
+    assert summary["columns_pruned"] == 6 and summary["rows_pruned"] == 5
+    assert summary["estimated_seconds_saved"] == pytest.approx(10.0 * (11 / 5 * 405 / 400 - 1) - report["elapsed"])
+    assert len(apply_screening(df, report)) == len(df)
+
+def test_runner_prunes_before_benchmarking():
+    recs = [{"algorithm": AlgorithmRegistry.get_by_name("Logistic Regression")}]
+    runner = AutoMLRunner(prune_columns=True)
+    results = runner.run_benchmark(_frame(), "target", recs)
+    assert results.iloc[0]["Status"] == "Success"
+    assert runner.screening["pruned"]["columns_pruned"] == 6
+    assert runner.screening["pruned"]["estimated_seconds_saved"] >= 0
+    assert AutoMLRunner().run_benchmark(_frame(), "target", recs) is not None
+
+def test_api_analyze_prune(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    from src.api.main import app
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("temp_uploads")
+    os.makedirs("plots")
+    client = TestClient(app)
+    csv = _frame().to_csv(index=False).encode()
+    offered = client.post("/analyze?fields=column_screening", files={"file": ("d.csv", csv, "text/csv")}).json()
+    assert "a_copy" in offered["analysis"]["column_screening"]["drop"]
+
+    pruned = client.post("/analyze?fields=basic_stats,correlations&prune=true&target=target",
+                         files={"file": ("d.csv", csv, "text/csv")}).json()["analysis"]
+    assert pruned["basic_stats"]["n_columns"] == 5 and "a_copy" not in pruned["correlations"]
+    assert pruned["column_screening"]["pruned"]["rows_pruned"] == 5
+    # Without a target nothing protects the label column from being dropped
+    assert client.post("/analyze?prune=true", files={"file": ("d.csv", csv, "text/csv")}).status_code == 400
@@ -0,0 +1,109 @@
+import pytest
+import sys
+import os
+import json
+import numpy as np
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import src.serialization as serialization
+from src.serialization import to_native, frame_to_dict, series_to_dict, array_to_list, dumps
+from src.analyzer import DatasetAnalyzer
+
+def test_to_native_converts_numpy_and_nan():
+    payload = {
+        np.int64(1): np.float64("nan"),
+        "arr": np.array([1.5, np.nan, np.inf]),
+        "nested": [(np.int32(2), np.bool_(True)), {"ts": pd.Timestamp("2024-01-01"), "na": pd.NA}],
+        "plain": 0.5,
+    }
+    out = to_native(payload)
+    assert out == {1: None, "arr": [1.5, None, None], "nested": [[2, True], {"ts": "2024-01-01 00:00:00", "na": None}], "plain": 0.5}
+    assert type(out[1]) is type(None) and type(out["nested"][0][0]) is int
+
+def test_to_native_deep_nesting_has_no_recursion_limit():
+    obj = current = {}
+    for _ in range(5000):
+        current["child"] = {}
+        current = current["child"]
+    current["value"] = np.float32(1.0)
+    out = to_native(obj)
+    for _ in range(5000):
+        out = out["child"]
+    assert out["value"] == 1.0
+
+def test_bulk_block_conversion_matches_to_dict():
+    df = pd.DataFrame(np.random.default_rng(0).normal(size=(30, 4)), columns=list("abcd")).corr()
+    df.loc["a", "b"] = np.nan
+    out = frame_to_dict(df)
+    expected = df.to_dict()
+    expected["b"]["a"] = None
+    assert out == expected
+    assert series_to_dict(pd.Series([1.0, np.nan], index=["x", "y"])) == {"x": 1.0, "y": None}
+    assert array_to_list(np.array(["2024-01-01", "NaT"], dtype="datetime64[ns]"))[1] is None
+
+def test_analyzer_output_is_json_native():
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0, 4.0], "b": [1.0, 1.0, 1.0, 1.0], "t": ["x", "y", "x", "x"]})
+    result = DatasetAnalyzer(df, target_column="t").analyze()
+    # Constant column gives NaN correlations/skew; they must already be None
+    assert result["correlations"]["a"]["b"] is None
+    json.dumps(result, allow_nan=False)
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_backends_agree(monkeypatch, use_orjson):
+    if use_orjson and serialization.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(serialization, "orjson", None)
+    payload = {"x": np.float64("nan"), "y": [np.int64(3), 2.5], 7: pd.Series([1.0, np.nan], index=["p", "q"])}
+    assert json.loads(dumps(payload)) == {"x": None, "y": [3, 2.5], "7": {"p": 1.0, "q": None}}
+
+def test_quality_list_and_pack_roundtrip():
+    from src.api.negotiation import parse_quality_list, pack_numeric_blocks, unpack_numeric_blocks
+    assert parse_quality_list("gzip;q=0.5, br, identity;q=0") == [("br", 1.0), ("gzip", 0.5)]
+    analysis = {"correlations": {"a": {"a": 1.0, "b": None}, "b": {"a": None, "b": 1.0}},
+                "skewness": {"a": 0.3, "b": None}, "basic_stats": {"n_rows": 3}}
+    packed = pack_numeric_blocks(analysis)
+    assert packed["correlations"]["shape"] == [2, 2] and isinstance(packed["correlations"]["data"], bytes)
+    assert unpack_numeric_blocks(packed) == analysis
+
+def _wide_csv():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.normal(size=(50, 40)), columns=[f"c{i}" for i in range(40)]).to_csv(index=False).encode()
+
+def _analyze(client, **headers):
+    return client.post("/analyze", files={"file": ("wide.csv", _wide_csv(), "text/csv")}, headers=headers)
+
+def test_analyze_content_negotiation(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    from src.api.main import app
+    import src.api.negotiation as negotiation
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("temp_uploads")
+    os.makedirs("plots")
+    client = TestClient(app)
+
+    plain = _analyze(client, **{"Accept-Encoding": "identity"})
+    assert plain.headers["content-type"] == "application/json"
+    assert "content-encoding" not in plain.headers
+    assert len(plain.json()["analysis"]["correlations"]) == 40
+
+    gzipped = _analyze(client, **{"Accept-Encoding": "gzip"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.json()["analysis"]["correlations"] == plain.json()["analysis"]["correlations"]
+
+    if negotiation.brotli is not None:
+        br = _analyze(client, **{"Accept-Encoding": "br, gzip"})
+        assert br.headers["content-encoding"] == "br"
+        assert int(br.headers["content-length"]) < len(plain.content) / 3
+
+    if negotiation.msgpack is not None:
+        binary = _analyze(client, **{"Accept": "application/msgpack", "Accept-Encoding": "identity"})
+        assert binary.headers["content-type"] == "application/msgpack"
+        assert len(binary.content) < len(plain.content)
+        body = negotiation.msgpack.unpackb(binary.content, raw=False)
+        restored = negotiation.unpack_numeric_blocks(body["analysis"])
+        assert restored["correlations"]["c0"]["c1"] == pytest.approx(plain.json()["analysis"]["correlations"]["c0"]["c1"])
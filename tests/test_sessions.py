@@ -0,0 +1,89 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.api.sessions import SessionStore
+
+def _frame(rows=1000):
+    return pd.DataFrame({"a": np.arange(rows, dtype=np.float64), "b": np.arange(rows, dtype=np.int64)})
+
+def test_lru_eviction_by_memory(tmp_path):
+    one = _frame()
+    budget = int(one.memory_usage(deep=True).sum() * 2.5)
+    store = SessionStore(max_bytes=budget)
+
+    path = tmp_path / "first.csv"
+    path.write_text("a,b\n")
+    first = store.create(_frame(), "first.csv", path=str(path))
+    second = store.create(_frame(), "second.csv")
+    store.get(first.id)  # first is now most recently used
+    third = store.create(_frame(), "third.csv")
+
+    assert second.id not in store
+    assert first.id in store and third.id in store
+    assert store.evictions == 1
+    assert store.total_bytes <= budget
+
+    store.remove(first.id)
+    assert not path.exists()
+
+def test_artifacts_count_towards_budget():
+    store = SessionStore(max_bytes=10 ** 9)
+    session = store.create(_frame(10), "x.csv", analysis={"basic_stats": {"n_rows": 10}})
+    before = session.nbytes
+    store.set_artifact(session, "benchmark_results", [{"Algorithm": "Random Forest", "Value": 0.9}])
+    assert session.nbytes > before
+    assert store.find_by_filename("x.csv") is session
+    assert store.get("missing") is None
+
+def test_payload_estimate_and_cleanup_outside_lock(tmp_path, monkeypatch):
+    from src.api import sessions as sessions_module
+    from src.api.sessions import DatasetSession
+
+    frame = _frame()
+    assert DatasetSession._payload_bytes({"frame": frame}) >= frame.memory_usage(deep=True).sum()
+    assert DatasetSession._payload_bytes([{"a": 1.0}] * 100) > DatasetSession._payload_bytes([{"a": 1.0}])
+
+    store = SessionStore(max_bytes=1)
+    path = tmp_path / "old.csv"
+    path.write_text("a\n")
+    store.create(_frame(10), "old.csv", path=str(path))
+    held = []
+    original_remove = sessions_module.os.remove
+    monkeypatch.setattr(sessions_module.os, "remove", lambda p: held.append(store._lock.locked()) or original_remove(p))
+    store.create(_frame(10), "new.csv")
+    assert held == [False] and not path.exists()
+
+def test_api_follow_up_calls_use_dataset_id(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    from src.api.main import app
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("temp_uploads")
+    os.makedirs("plots")
+    client = TestClient(app)
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"x1": rng.normal(size=60), "x2": rng.normal(size=60), "target": rng.integers(0, 2, 60)})
+    csv = df.to_csv(index=False).encode()
+
+    # Same filename twice: two independent sessions and upload files
+    ids = [client.post("/analyze?fields=basic_stats,feature_types,missing_stats",
+                       files={"file": ("same.csv", csv, "text/csv")}).json()["dataset_id"] for _ in range(2)]
+    assert ids[0] != ids[1]
+    assert len(os.listdir("temp_uploads")) == 2
+
+    rec = client.post("/recommend", json={"dataset_id": ids[0]})
+    assert rec.status_code == 200 and rec.json()["recommendations"]
+
+    bench = client.post("/benchmark", json={"dataset_id": ids[0], "target_col": "target",
+                                            "recommmendations": [{"algorithm": "Logistic Regression"}]})
+    assert bench.status_code == 200
+    assert bench.json()["results"][0]["Status"] == "Success"
+
+    assert client.post("/recommend", json={"dataset_id": "unknown"}).status_code == 404
+    assert client.post("/recommend", json={}).status_code == 400
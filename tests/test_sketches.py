@@ -0,0 +1,94 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.sketches import (HyperLogLog, CountMinSketch, CategoricalSketch, hash_values, sketch_chunks,
+                          profile_categoricals, choose_encodings)
+from src.automl.preprocessing import TabularPreprocessor
+
+def _skewed(rows=50_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.Series([f"v{z}" for z in rng.zipf(1.5, rows)])
+
+def test_hyperloglog_accuracy_and_merge():
+    for n in (10, 1000, 200_000):
+        hll = HyperLogLog()
+        hll.add_hashes(hash_values(np.arange(n).astype(str)))
+        assert hll.estimate() == pytest.approx(n, rel=0.05)
+    left, right = HyperLogLog(), HyperLogLog()
+    left.add_hashes(hash_values(np.arange(0, 6000).astype(str)))
+    right.add_hashes(hash_values(np.arange(4000, 10000).astype(str)))
+    assert left.merge(right).estimate() == pytest.approx(10000, rel=0.05)
+
+def test_count_min_never_undercounts():
+    values = _skewed(20_000).to_numpy(dtype=object)
+    cms = CountMinSketch(width=256)
+    cms.add_hashes(hash_values(values))
+    truth = pd.Series(values).value_counts()
+    estimates = cms.estimate(hash_values(truth.index.to_numpy(dtype=object)))
+    assert (estimates >= truth.to_numpy()).all()
+    assert estimates[0] == pytest.approx(truth.iloc[0], rel=0.01)
+
+def test_chunked_sketches_match_one_pass():
+    series = _skewed()
+    whole = CategoricalSketch().update(series).summary()
+    chunks = sketch_chunks(pd.DataFrame({"c": series[i:i + 7000]}) for i in range(0, len(series), 7000))["c"].summary()
+    assert chunks["distinct"] == whole["distinct"]
+    assert [h["value"] for h in chunks["heavy_hitters"][:5]] == [h["value"] for h in whole["heavy_hitters"][:5]]
+
+    truth = series.value_counts(normalize=True)
+    assert whole["distinct"] == pytest.approx(series.nunique(), rel=0.05)
+    assert whole["heavy_hitters"][0]["value"] == truth.index[0]
+    assert whole["top_share"] == pytest.approx(truth.iloc[0], abs=0.01)
+    assert whole["rare_share"] == pytest.approx(truth[truth < 0.01].sum(), abs=0.02)
+
+def test_profile_categoricals_and_encodings():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"user": [f"u{i % 3000}" for i in range(6000)], "color": rng.choice(["r", "g"], 6000),
+                       "x": rng.normal(size=6000), "target": rng.choice(["a", "b"], 6000)})
+    df.loc[::10, "color"] = None
+    profile = profile_categoricals(df, exclude=["target"])
+    assert set(profile["columns"]) == {"user", "color"}
+    assert profile["columns"]["color"]["n_missing"] == 600
+    assert profile["high_cardinality_columns"] == ["user"]
+    assert choose_encodings(profile) == {"user": "frequency", "color": "label"}
+
+def test_frequency_encoding_in_preprocessor():
+    df = pd.DataFrame({"city": ["a", "a", "b", "c"], "x": [1.0, 2.0, 3.0, 4.0], "y": [0, 1, 0, 1]})
+    preprocessor = TabularPreprocessor("y", encodings={"city": "frequency"})
+    X, _, _ = preprocessor.fit_transform(df)
+    assert X["city"].tolist() == [0.5, 0.5, 0.25, 0.25]
+    assert preprocessor.categorical_indices == []
+    assert preprocessor.transform(pd.DataFrame({"city": ["b", "zzz"], "x": [1.0, 1.0]}))[:, 0].tolist() == [0.25, 0.0]
+
+def test_runner_and_advisor_use_profile():
+    from src.automl.runner import AutoMLRunner
+    from src.algorithms.registry import AlgorithmRegistry
+    from src.analyzer import DatasetAnalyzer
+    from src.competition.advisor import CompetitionAdvisor
+    import src.algorithms.definitions # Register algorithms
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"user": [f"u{i}" for i in rng.integers(0, 150, 600)], "x": rng.normal(size=600)})
+    df["target"] = (df["x"] > 0).astype(int)
+    runner = AutoMLRunner()
+    recs = [{"algorithm": AlgorithmRegistry.get_by_name("Logistic Regression")}]
+    results = runner.run_benchmark(df, "target", recs)
+    assert results.iloc[0]["Status"] == "Success"
+    assert runner.encodings == {"user": "frequency"}
+    label_runner = AutoMLRunner(categorical_encoding="label")
+    label_runner.run_benchmark(df, "target", recs)
+    assert label_runner.encodings == {}
+    # The tuner preprocesses the same way, so tuned and benchmarked models see the same features
+    from src.automl.preprocessing import preprocess_frame
+    X, _, _ = preprocess_frame(df, "target")
+    assert X["user"].dtype == float and X["user"].max() < 1
+
+    analysis = DatasetAnalyzer(df, target_column="target").analyze()
+    assert analysis["categorical_profile"]["high_cardinality_columns"] == ["user"]
+    assert any("user (~" in tip for tip in CompetitionAdvisor().get_kaggle_tips(analysis))
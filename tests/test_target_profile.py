@@ -0,0 +1,76 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import src.target_profile as target_profile_module
+import src.automl.preprocessing as preprocessing_module
+from src.target_profile import profile_series, problem_type_of
+from src.analyzer import DatasetAnalyzer
+from src.automl.preprocessing import TabularPreprocessor
+
+@pytest.mark.parametrize("values, expected", [
+    (["a", "b", "a", None], "classification"),
+    ([1, 2, 3, 1, 2], "classification"),
+    ([1.0, 2.0, np.nan, 1.0], "classification"), # Integer labels read as float because of a NaN
+    ([0.5, 1.5, 0.5, 2.5], "regression"),        # Few values but not labels
+    (list(range(25)), "regression"),
+    ([True, False, True], "classification"),
+])
+def test_problem_type_rule(values, expected):
+    df = pd.DataFrame({"x": range(len(values)), "t": values})
+    assert profile_series(df["t"])["problem_type"] == expected
+    # Analyzer, ranker input and runner preprocessing all agree
+    analysis = DatasetAnalyzer(df, target_column="t").analyze(sections=["imbalance_stats"])
+    assert analysis["imbalance_stats"]["problem_type"] == analysis["imbalance_stats"]["type"] == expected
+    assert problem_type_of(analysis) == expected
+    if df["t"].notna().all():
+        assert TabularPreprocessor("t").fit_transform(df)[2] == (expected == "classification")
+
+def test_profile_matches_value_counts():
+    target = pd.Series(["b", "a", "b", "c", "b", None, "a"])
+    profile = profile_series(target)
+    expected = target.value_counts(normalize=True)
+    assert list(profile["class_distribution"]) == list(expected.index)
+    assert list(profile["class_distribution"].values()) == pytest.approx(expected.tolist())
+    assert profile["n_unique"] == 3 and profile["n_missing"] == 1 and profile["sub_type"] == "multiclass"
+    assert not profile["is_imbalanced"]
+    assert profile_series(pd.Series([0] * 95 + [1] * 5))["is_imbalanced"]
+
+def test_profile_is_computed_once_per_analyzer(monkeypatch):
+    calls = []
+    original = target_profile_module.profile_series
+    counted = lambda s: calls.append(1) or original(s)
+    monkeypatch.setattr(target_profile_module, "profile_series", counted)
+    monkeypatch.setattr(preprocessing_module, "profile_series", counted)
+    df = pd.DataFrame({"a": np.arange(100.0), "t": np.arange(100) % 3})
+    analyzer = DatasetAnalyzer(df, target_column="t")
+    analysis = analyzer.analyze()
+    analyzer.analyze(sections=["imbalance_stats", "target_relevance"])
+    assert len(calls) == 1
+    # A caller holding the profile hands it to the preprocessor instead of recomputing it
+    TabularPreprocessor("t").fit_transform(df, target_profile=original(df["t"]))
+    assert len(calls) == 1 and analysis["imbalance_stats"]["problem_type"] == "classification"
+    TabularPreprocessor("t").fit_transform(df)
+    assert len(calls) == 2
+
+def test_mutated_frame_is_profiled_afresh():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"a": rng.normal(size=100), "y": rng.integers(0, 2, size=100)})
+    assert DatasetAnalyzer(df, target_column="y").analyze(sections=["imbalance_stats"])["imbalance_stats"]["problem_type"] == "classification"
+    df["y"] = rng.normal(size=100)
+    assert DatasetAnalyzer(df, target_column="y").analyze(sections=["imbalance_stats"])["imbalance_stats"]["problem_type"] == "regression"
+    X, y, is_classification = TabularPreprocessor("y").fit_transform(df)
+    assert not is_classification and np.allclose(y, df["y"])
+
+def test_problem_type_of_fallbacks():
+    assert problem_type_of({"problem_type": "regression"}) == "regression"
+    assert problem_type_of({"target_analysis": {"n_unique": 100, "dtype": "float64"}}) == "regression"
+    assert problem_type_of({"target_analysis": {"n_unique": 2, "dtype": "object"}}) == "classification"
+    # The measured target profile wins over hints
+    assert problem_type_of({"imbalance_stats": {"type": "classification"}, "problem_type": "regression"}) == "classification"
+    assert problem_type_of({}) == "classification"
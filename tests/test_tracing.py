@@ -0,0 +1,51 @@
+import pytest
+import sys
+import os
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.analyzer import DatasetAnalyzer
+from src.tracing import Histogram, STAGE_SECONDS, stage, start_request_timings, server_timing_header
+
+def test_histogram_render():
+    hist = Histogram("test_seconds", "Test.", ("stage",), buckets=(0.1, 1.0))
+    hist.observe(0.05, stage="a")
+    hist.observe(0.5, stage="a")
+    hist.observe(5.0, stage="a")
+    lines = hist.render()
+    assert 'test_seconds_bucket{stage="a",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{stage="a",le="1.0"} 2' in lines
+    assert 'test_seconds_bucket{stage="a",le="+Inf"} 3' in lines
+    assert 'test_seconds_count{stage="a"} 3' in lines
+
+def test_stage_collects_request_timings():
+    timings = start_request_timings()
+    with stage("unit.block", algorithm="Random Forest"):
+        pass
+    assert timings[0][0] == "unit.block.Random Forest"
+    header = server_timing_header(timings + [("unit.block.Random Forest", 0.5)])
+    # Header tokens cannot contain spaces; repeated stages are summed
+    assert header.startswith("unit.block.Random_Forest;dur=")
+    assert header.count(";dur=") == 1
+
+def test_analyzer_stages_are_recorded():
+    before = STAGE_SECONDS.snapshot().get(("analyzer.correlations", ""), {"count": 0})["count"]
+    DatasetAnalyzer(pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [3.0, 1.0, 2.0]})).analyze()
+    after = STAGE_SECONDS.snapshot()[("analyzer.correlations", "")]["count"]
+    assert after == before + 1
+
+def test_metrics_endpoint_and_server_timing():
+    from fastapi.testclient import TestClient
+    from src.api.main import app
+
+    client = TestClient(app)
+    resp = client.post("/competition/plan", json={"analysis": {"problem_type": "classification"}, "filename": "x.csv"},
+                       headers={"X-Server-Timing": "1"})
+    assert resp.status_code == 200
+    assert "total;dur=" in resp.headers["server-timing"]
+
+    metrics = client.get("/metrics")
+    assert metrics.headers["content-type"].startswith("text/plain")
+    assert 'malgocat_request_seconds_count{method="POST",path="/competition/plan",status="200"}' in metrics.text
@@ -0,0 +1,110 @@
+import pytest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Ensure src is in path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.algorithms.base import Algorithm
+from src.algorithms.registry import AlgorithmRegistry
+from src.automl.gbdt import fit_with_early_stopping
+from src.automl.tuning import HyperparameterTuner, sample_params, accepted_params
+import src.algorithms.definitions # Register algorithms
+
+def _classification_frame(rows=300, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(rows, 4))
+    df = pd.DataFrame(X, columns=["a", "b", "c", "d"])
+    df["target"] = (X[:, 0] + 0.5 * X[:, 1] > 0).astype(int)
+    return df
+
+def test_sample_params_respects_space():
+    space = {"n": ("int", 3, 5), "lr": ("log", 1e-3, 1e-1), "frac": ("float", 0.5, 1.0), "kind": ["a", None]}
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        params = sample_params(space, rng)
+        assert 3 <= params["n"] <= 5 and isinstance(params["n"], int)
+        assert 1e-3 <= params["lr"] <= 1e-1
+        assert 0.5 <= params["frac"] <= 1.0
+        assert params["kind"] in ("a", None)
+    with pytest.raises(ValueError):
+        sample_params({"x": ("normal", 0, 1)}, rng)
+
+def test_accepted_params_drops_unknown_for_fallback():
+    from sklearn.ensemble import GradientBoostingClassifier
+    params = accepted_params(GradientBoostingClassifier, {"learning_rate": 0.1, "colsample_bytree": 0.8})
+    assert params == {"learning_rate": 0.1}
+    # LightGBM's unlimited depth is None for sklearn trees
+    assert accepted_params(GradientBoostingClassifier, {"max_depth": -1}) == {"max_depth": None}
+    space = AlgorithmRegistry.get_by_name("LightGBM Classifier").search_space
+    assert -1 in space["max_depth"]
+    GradientBoostingClassifier(**accepted_params(GradientBoostingClassifier, {"max_depth": -1})).fit([[0], [1]], [0, 1])
+
+def test_sklearn_gbdt_early_stopping():
+    from sklearn.ensemble import GradientBoostingClassifier
+    df = _classification_frame(400)
+    X, y = df[["a", "b", "c", "d"]].values, df["target"].values
+    info = fit_with_early_stopping(GradientBoostingClassifier(n_estimators=500), X, y, None, None, rounds=5)
+    assert info["max_iterations"] == 500
+    assert info["early_stopped"] and info["best_iteration"] < 500
+
+def test_tuner_finds_config_and_prunes():
+    df = _classification_frame()
+    X, y = df.drop(columns=["target"]).values, df["target"].values
+    algorithm = AlgorithmRegistry.get_by_name("K-Nearest Neighbors")
+    tuner = HyperparameterTuner(n_trials=10, n_folds=3, n_jobs=1, n_startup_trials=2, seed=1)
+    result = tuner.tune(algorithm, X, y, is_classification=True)
+
+    assert result["status"] == "Success"
+    assert result["metric"] == "Accuracy"
+    assert result["n_trials"] == 10
+    assert result["n_pruned"] > 0
+    pruned = [t for t in result["trials"] if t["status"] == "pruned"]
+    assert all(len(t["fold_scores"]) < 3 for t in pruned)
+    complete_scores = [t["score"] for t in result["trials"] if t["status"] == "complete"]
+    assert result["best_score"] == max(complete_scores)
+    assert set(result["best_params"]) <= set(algorithm.search_space)
+
+def test_tuner_without_search_space():
+    algorithm = AlgorithmRegistry.get_by_name("Linear Regression")
+    assert algorithm.search_space is None
+    result = HyperparameterTuner(n_jobs=1).tune(algorithm, np.zeros((10, 1)), np.zeros(10), False)
+    assert result["status"].startswith("Not Tunable")
+    unregistered = Algorithm(name="Unregistered", type="classification", description="", pros=[], cons=[],
+                             complexity_score=1, search_space={"C": [1.0]})
+    assert HyperparameterTuner(n_jobs=1).tune(unregistered, np.zeros((10, 1)), np.zeros(10), True)["status"] == "Not Implemented"
+
+def test_tune_frame_splits_budget():
+    df = _classification_frame(200)
+    tuner = HyperparameterTuner(n_trials=50, time_budget=2.0, n_jobs=1)
+    results = tuner.tune_frame(df, "target", ["Logistic Regression", "Gaussian Naive Bayes", "Unknown Model"])
+    assert [r["algorithm"] for r in results][-1] == "Unknown Model"
+    assert all(r["status"] == "Success" for r in results[:2])
+    assert sum(r["elapsed"] for r in results[:2]) < 5.0
+
+def test_api_tune(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    from src.api.main import app
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("temp_uploads")
+    os.makedirs("plots")
+    client = TestClient(app)
+    csv = _classification_frame(120).to_csv(index=False).encode()
+    dataset_id = client.post("/analyze?fields=basic_stats", files={"file": ("d.csv", csv, "text/csv")}).json()["dataset_id"]
+
+    tuned = client.post("/tune", json={"dataset_id": dataset_id, "target_col": "target",
+                                       "algorithms": ["Logistic Regression"], "n_trials": 4, "time_budget": 10})
+    assert tuned.status_code == 200
+    best = tuned.json()["results"][0]
+    assert best["status"] == "Success" and "C" in best["best_params"]
+
+    assert client.post("/tune", json={"dataset_id": dataset_id, "target_col": "missing",
+                                      "algorithms": ["Logistic Regression"]}).status_code == 400
+    assert client.post("/tune", json={"dataset_id": "unknown", "target_col": "target",
+                                      "algorithms": []}).status_code == 404
+    for bad in ({"n_folds": 1}, {"n_trials": 0}):
+        assert client.post("/tune", json={"dataset_id": dataset_id, "target_col": "target",
+                                          "algorithms": ["Logistic Regression"], **bad}).status_code == 422